@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""Benchmarks de inicialização e dos caminhos quentes da Jera CLI.
+
+Mede o cold start do `jeracli --help`, de `jeracli <comando> --help` (caminho
+de parse de cada comando) e do autocompletar de ponta a ponta (o processo que o
+shell inicia a cada Tab) usando `-X importtime`, e o tempo das funções puras
+mais usadas na renderização. Cada medição é o menor tempo de N execuções
+(o ruído da máquina só deixa uma execução mais lenta, nunca mais rápida).
+
+Os orçamentos em `budgets.json` são relativos a uma referência medida junto
+com cada caso, intercalada com as execuções dele: na inicialização,
+`python -c pass`; nos caminhos quentes, um laço Python fixo. Assim o mesmo
+arquivo vale em máquinas mais lentas ou mais rápidas, a carga da máquina
+afeta caso e referência igualmente e a folga pode ser pequena; qualquer
+estouro faz o script sair com código 1. Os caminhos quentes usam um
+diretório de cache temporário, sem tocar em ~/.jera/cache.
+
+Uso:
+    $ python benchmarks/bench.py                 # Roda tudo e compara com os orçamentos
+    $ python benchmarks/bench.py --only startup  # Apenas inicialização
+    $ python benchmarks/bench.py --only hot      # Apenas caminhos quentes
+    $ python benchmarks/bench.py --update        # Regrava os orçamentos a partir desta máquina
+"""
+
+import argparse
+import datetime
+import gc
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGETS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'budgets.json')
+
+sys.path.insert(0, ROOT)
+
+# Módulos que não devem ser importados só para mostrar a ajuda
+HEAVY_MODULES = ('kubernetes', 'inquirer', 'yaml')
+# No autocompletar nem o rich: os comandos só o importam ao imprimir
+COMPLETION_HEAVY_MODULES = HEAVY_MODULES + ('rich',)
+
+# Tab nos argumentos que completam pods, namespaces e nós: (rótulo, COMP_WORDS, nome esperado)
+COMPLETION_CASES = [
+    ('complete logs <Tab>', 'jeracli logs ', 'app-0'),
+    ('complete use <Tab>', 'jeracli use ', 'jera-bench'),
+    ('complete node-metrics <Tab>', 'jeracli node-metrics ', 'node-0'),
+]
+
+# kubeconfig mínimo do HOME temporário do autocompletar (o servidor nunca é consultado)
+BENCH_KUBECONFIG = """apiVersion: v1
+kind: Config
+current-context: jera-bench
+clusters:
+- name: jera-bench
+  cluster: {server: "https://127.0.0.1:1"}
+contexts:
+- name: jera-bench
+  context: {cluster: jera-bench, user: jera-bench}
+users:
+- name: jera-bench
+  user: {token: jera-bench}
+"""
+
+# Folga aplicada sobre a razão medida ao regravar os orçamentos, e folga mínima
+# (em múltiplos da referência) para medições de 1-2ms, em que o ruído passa de 40%
+BUDGET_HEADROOM = 1.4
+BUDGET_MIN_SLACK = 0.02
+
+def ratio(result):
+    """Medição em múltiplos da referência medida junto com ela"""
+    return result['ms'] / result['reference_ms']
+
+def budget_for(result):
+    """Orçamento gravado pelo --update: a razão medida com a folga"""
+    measured = ratio(result)
+    return round(max(measured * BUDGET_HEADROOM, measured + BUDGET_MIN_SLACK), 3)
+
+def python_startup_ms():
+    """Tempo (ms) de iniciar um processo Python vazio, a referência da inicialização"""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', 'pass'], check=True)
+    return (time.perf_counter() - start) * 1000
+
+def reference_loop():
+    """Laço Python fixo, a referência dos caminhos quentes"""
+    total = 0
+    for i in range(300000):
+        total += len(str(i)) * (i % 7)
+    return total
+
+def run_cli(args, env=None):
+    """Executa a CLI em um processo novo com -X importtime e retorna (ms, imports, stdout)"""
+    if env is None:
+        cmd = [sys.executable, '-X', 'importtime', '-m', 'jera_cli'] + args
+    else:
+        # Como o script jeracli instalado: o nome do programa define a variável do autocompletar
+        cmd = [sys.executable, '-X', 'importtime', '-c', "from jera_cli import cli; cli(prog_name='jeracli')"]
+    start = time.perf_counter()
+    result = subprocess.run(cmd, capture_output=True, text=True, cwd=ROOT, env=env)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    if result.returncode != 0:
+        raise RuntimeError(f"Falha ao executar {' '.join(args)}: {result.stderr[-500:]}")
+
+    imports = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        parts = line[len('import time:'):].split('|')
+        if not parts[0].strip().isdigit():
+            continue  # cabeçalho
+        imports[parts[2].strip()] = int(parts[0])
+
+    return elapsed, imports, result.stdout
+
+def bench_startup(repeat):
+    """Mede o cold start da ajuda geral e do parse de cada subcomando"""
+    from jera_cli.cli import LAZY_COMMANDS
+
+    cases = [('--help', ['--help'])]
+    cases += [(f"{name} --help", [name, '--help']) for name in sorted(LAZY_COMMANDS)]
+
+    results = {}
+    for label, args in cases:
+        samples = []
+        references = [python_startup_ms()]
+        imports = {}
+        for _ in range(repeat):
+            elapsed, imports, _ = run_cli(args)
+            samples.append(elapsed)
+            references.append(python_startup_ms())
+
+        heavy = sorted(name for name in imports if name in HEAVY_MODULES)
+        results[label] = {
+            'ms': min(samples),
+            'reference_ms': min(references),
+            'import_ms': sum(imports.values()) / 1000,
+            'heavy': heavy,
+        }
+    results.update(bench_completion(repeat))
+    return results
+
+def completion_home():
+    """Cria um HOME temporário com kubeconfig, namespace salvo e nomes em cache.
+
+    Reproduz o estado depois do primeiro Tab: os nomes estão frescos, então
+    nenhum processo de atualização é disparado durante a medição.
+    """
+    from jera_cli.utils.completion import names_cache_name
+
+    home = tempfile.mkdtemp(prefix='jera-bench-home-')
+    cache_dir = os.path.join(home, '.jera', 'cache')
+    os.makedirs(cache_dir, mode=0o700)
+    with open(os.path.join(home, 'kubeconfig'), 'w') as f:
+        f.write(BENCH_KUBECONFIG)
+    with open(os.path.join(home, '.jera', 'config'), 'w') as f:
+        f.write('namespace: jera-bench\n')
+
+    names = {
+        ('pods', 'jera-bench'): [f"app-{i}" for i in range(5000)],
+        ('namespaces', None): ['default', 'jera-bench', 'kube-system'],
+        ('nodes', None): [f"node-{i}" for i in range(50)],
+    }
+    for (kind, namespace), values in names.items():
+        with open(os.path.join(cache_dir, names_cache_name(kind, 'jera-bench', namespace)), 'w') as f:
+            json.dump({'updated': time.time() + 3600, 'names': values}, f)
+    return home
+
+def bench_completion(repeat):
+    """Mede o autocompletar como o shell o chama: um processo novo com _JERACLI_COMPLETE"""
+    home = completion_home()
+    try:
+        results = {}
+        for label, words, expected in COMPLETION_CASES:
+            env = dict(
+                os.environ, HOME=home, KUBECONFIG=os.path.join(home, 'kubeconfig'),
+                _JERACLI_COMPLETE='bash_complete', COMP_WORDS=words, COMP_CWORD=str(len(words.split())),
+            )
+            env.pop('JERA_NO_DAEMON', None)
+            # A primeira execução grava o estado local (contexto e namespace) no cache, como no primeiro Tab
+            _, _, output = run_cli([label], env)
+            if f"plain,{expected}\n" not in output:
+                raise RuntimeError(f"{label}: o autocompletar não sugeriu '{expected}': {output[:200]!r}")
+
+            samples = []
+            references = [python_startup_ms()]
+            imports = {}
+            for _ in range(repeat):
+                elapsed, imports, _ = run_cli([label], env)
+                samples.append(elapsed)
+                references.append(python_startup_ms())
+            results[label] = {
+                'ms': min(samples),
+                'reference_ms': min(references),
+                'import_ms': sum(imports.values()) / 1000,
+                'heavy': sorted({name for name in imports if name.split('.')[0] in COMPLETION_HEAVY_MODULES}),
+            }
+        return results
+    finally:
+        shutil.rmtree(home, ignore_errors=True)
+
+def iso(moment):
+    """Formata um datetime como os timestamps da API (RFC 3339)"""
+    return moment.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+def synthetic_pods(count):
+    """Gera pods sintéticos no formato retornado pela API (o mesmo de `kubectl get -o json`)"""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    items = []
+    for i in range(count):
+        containers = [{'name': f"c{j}"} for j in range(1 + i % 3)]
+        statuses = [{'name': f"c{j}", 'ready': (i + j) % 7 != 0} for j in range(len(containers))]
+        items.append({
+            'metadata': {
+                'name': f"app-{i:05d}-7c9f8d6b5-x{i % 97:02d}",
+                'creationTimestamp': iso(now - datetime.timedelta(seconds=i * 37)),
+            },
+            'spec': {'containers': containers},
+            'status': {
+                'containerStatuses': statuses,
+                'phase': 'Running' if i % 11 else 'Pending',
+                'podIP': f"10.0.{i // 256 % 256}.{i % 256}",
+                'hostIP': f"192.168.1.{i % 50}",
+            },
+        })
+    return items
+
+def elapsed_ms(fn):
+    """Tempo (ms) de uma execução de fn, com o coletor de lixo desligado como no timeit"""
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        fn()
+        return (time.perf_counter() - start) * 1000
+    finally:
+        gc.enable()
+
+def timed(fn, repeat):
+    """Executa fn `repeat` vezes entre execuções do laço de referência; retorna os menores tempos em ms.
+
+    A velocidade da máquina oscila por segundos; medindo a referência antes
+    e depois de cada execução, os dois mínimos saem da mesma janela.
+    """
+    samples = []
+    references = [elapsed_ms(reference_loop)]
+    for _ in range(repeat):
+        samples.append(elapsed_ms(fn))
+        references.append(elapsed_ms(reference_loop))
+    return {'ms': min(samples), 'reference_ms': min(references)}
+
+def local_http_server():
+    """Sobe um servidor HTTP/1.1 keep-alive local (stand-in dos Ingress); retorna (servidor, porta)"""
+    import http.server
+    import threading
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, *args):
+            pass
+
+        def do_HEAD(self):
+            self.send_response(200)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, server.server_address[1]
+
+def bench_hot_paths(repeat):
+    """Mede as funções puras usadas na renderização, com o cache num diretório temporário"""
+    from jera_cli.utils import cache
+
+    saved_cache_dir = cache.CACHE_DIR
+    cache.CACHE_DIR = tempfile.mkdtemp(prefix='jera-bench-')
+    try:
+        return _bench_hot_paths(repeat)
+    finally:
+        shutil.rmtree(cache.CACHE_DIR, ignore_errors=True)
+        cache.CACHE_DIR = saved_cache_dir
+
+def _bench_hot_paths(repeat):
+    from rich.console import Console
+    from jera_cli.utils.kubernetes import parse_resource_value, format_age
+    from jera_cli.commands.pods import generate_pods_table
+    from jera_cli.utils.cache import write_json
+    from jera_cli.utils.completion import get_cached_names, names_cache_name
+    from jera_cli.utils.http_probe import probe_urls
+
+    cpu_values = ['250m', '1', '0.5', '1500m', '2'] * 20000
+    mem_values = ['512Mi', '2Gi', '1048576Ki', '128Mi', '0.5Gi'] * 20000
+    now = datetime.datetime.now(datetime.timezone.utc)
+    timestamps = [iso(now - datetime.timedelta(seconds=s)) for s in (5, 300, 7200, 172800)] * 25000
+
+    pods = synthetic_pods(10000)
+    console = Console(file=io.StringIO(), width=160, force_terminal=True)
+
+    # Nomes em cache para o autocompletar, num contexto fictício
+    names_file = names_cache_name('pods', 'jera-bench', 'jera-bench')
+    write_json(names_file, {'updated': time.time(), 'names': [f"app-{i}" for i in range(5000)]})
+
+    def complete_pods():
+        return [n for n in get_cached_names('pods', 'jera-bench', 'jera-bench') if n.startswith('app-12')]
+
+    def render_table():
+        console.print(generate_pods_table([(None, pods)]))
+        console.file.seek(0)
+        console.file.truncate()
+
+    filter_result = timed(complete_pods, repeat)
+
+    server, port = local_http_server()
+    probe_targets = [f"http://127.0.0.1:{port}/app-{i}" for i in range(50)]
+    try:
+        probe_result = timed(lambda: probe_urls(probe_targets, repeat=4, timeout=5), repeat)
+    finally:
+        server.shutdown()
+
+    return {
+        # Só o filtro em processo; o Tab de ponta a ponta é medido em bench_completion
+        'filtro de 5k nomes em cache (em processo)': filter_result,
+        'parse_resource_value cpu x100k': timed(lambda: [parse_resource_value(v, 'cpu') for v in cpu_values], repeat),
+        'parse_resource_value memory x100k': timed(lambda: [parse_resource_value(v, 'memory') for v in mem_values], repeat),
+        'format_age x100k': timed(lambda: [format_age(t) for t in timestamps], repeat),
+        'generate_pods_table 10k pods': timed(lambda: generate_pods_table([(None, pods)]), repeat),
+        'render pods table 10k pods': timed(render_table, max(1, repeat // 2)),
+        'probe_urls 50 URLs x4 servidor local': probe_result,
+    }
+
+def load_budgets():
+    if os.path.exists(BUDGETS_PATH):
+        with open(BUDGETS_PATH) as f:
+            return json.load(f)
+    return {}
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de inicialização e renderização da Jera CLI")
+    parser.add_argument('--only', choices=['startup', 'hot'], help='Executa apenas um grupo de benchmarks')
+    parser.add_argument('--repeat', type=int, default=7, help='Repetições por medição (usa o menor tempo)')
+    parser.add_argument('--update', action='store_true', help='Regrava budgets.json a partir das medições atuais (em múltiplos da referência)')
+    args = parser.parse_args()
+
+    groups = {}
+    if args.only in (None, 'startup'):
+        groups['startup'] = bench_startup(args.repeat)
+    if args.only in (None, 'hot'):
+        groups['hot_paths'] = bench_hot_paths(args.repeat)
+
+    budgets = load_budgets()
+    failures = []
+
+    for group, results in groups.items():
+        reference = "python -c pass" if group == 'startup' else "laço de referência"
+        print(f"\n== {group} (em múltiplos de {reference}) ==")
+        group_budgets = budgets.get(group, {})
+        for label, result in results.items():
+            budget = group_budgets.get(label)
+            status = "ok"
+            if result.get('heavy'):
+                status = f"FALHA (importou {', '.join(result['heavy'])})"
+                failures.append(label)
+            elif budget is not None and ratio(result) > budget:
+                status = f"FALHA (orçamento {budget:.3f}x = {budget * result['reference_ms']:.1f}ms)"
+                failures.append(label)
+            elif budget is None:
+                status = "sem orçamento"
+
+            extra = f"  imports {result['import_ms']:7.1f}ms" if 'import_ms' in result else ""
+            print(f"  {label:<42} {result['ms']:8.1f}ms {ratio(result):7.2f}x{extra}  {status}")
+
+    if args.update:
+        for group, results in groups.items():
+            budgets[group] = {
+                label: budget_for(result)
+                for label, result in results.items()
+            }
+        with open(BUDGETS_PATH, 'w') as f:
+            json.dump(budgets, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+        print(f"\n✅ Orçamentos atualizados em {BUDGETS_PATH}")
+        return 0
+
+    if failures:
+        print(f"\n❌ {len(failures)} benchmark(s) acima do orçamento: {', '.join(failures)}")
+        return 1
+
+    print("\n✅ Todos os benchmarks dentro do orçamento")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,28 +1,115 @@
 #!/usr/bin/env python3
 
+import importlib
+import os
+import sys
 import click
-from rich.console import Console
-from .commands.commands import (
-    pods, logs, exec, pods_by_node, describe, delete,
-    pod_metrics, all_metrics,
-    init, use, login_aws, use_cluster, clusters,
-    nodes, namespaces, urls, loadbalancer,
-    pvs, pvcs, storage, node_metrics, describe_node,
-    login_azure, init_azure
-)
-
-console = Console()
+from .utils.output import OUTPUT_FORMATS
+
+# Comandos registrados sem importar os módulos: nome -> (módulo, atributo, ajuda curta).
+# O módulo só é importado quando o comando é executado, mantendo o `--help` rápido.
+LAZY_COMMANDS = {
+    'init': ('config', 'init', 'Inicializa a configuração do kubectl para um cluster EKS.'),
+    'use': ('config', 'use', 'Seleciona o namespace atual para operações.'),
+    'use-cluster': ('config', 'use_cluster', 'Alterna entre diferentes clusters Kubernetes.'),
+    'clusters': ('config', 'clusters', 'Lista todos os clusters Kubernetes configurados.'),
+    'login-aws': ('config', 'login_aws', 'Faz login no AWS SSO de forma interativa.'),
+    'login-azure': ('config', 'login_azure', 'Faz login no Azure CLI de forma interativa.'),
+    'init-azure': ('config', 'init_azure', 'Inicializa a configuração do kubectl para um cluster AKS.'),
+    'pods': ('pods', 'pods', 'Lista todos os pods no namespace atual.'),
+    'logs': ('pods', 'logs', 'Visualiza logs de um pod no namespace atual.'),
+    'exec': ('pods', 'exec', 'Executa um shell interativo dentro de um pod.'),
+    'pod-metrics': ('metrics', 'pod_metrics', 'Mostra uma análise detalhada dos recursos dos pods.'),
+    'all-metrics': ('metrics', 'all_metrics', 'Mostra uma análise detalhada dos recursos de todos os pods em todos os namespaces.'),
+    'nodes': ('nodes', 'nodes', 'Lista todos os nós do cluster com informações detalhadas.'),
+    'pods-by-node': ('pods', 'pods_by_node', 'Lista todos os pods agrupados por nó, opcionalmente filtrados por namespace.'),
+    'describe': ('pods', 'describe', 'Mostra informações detalhadas de um pod.'),
+    'describe-node': ('nodes', 'describe_node', 'Mostra informações detalhadas de um nó.'),
+    'namespaces': ('namespaces', 'namespaces', '📋 Lista todos os namespaces disponíveis no cluster'),
+    'urls': ('ingress', 'urls', 'Mostra as URLs dos Ingress disponíveis no cluster.'),
+    'delete': ('pods', 'delete', 'Deleta um ou mais pods no namespace atual.'),
+    'loadbalancer': ('ingress', 'loadbalancer', 'Mostra os LoadBalancers (Ingresses e Services) do cluster.'),
+    'pvs': ('storage', 'pvs', 'Mostra os Persistent Volumes (PVs) no cluster.'),
+    'pvcs': ('storage', 'pvcs', 'Mostra os Persistent Volume Claims (PVCs) no cluster.'),
+    'storage': ('storage', 'storage', 'Mostra informações sobre armazenamento no cluster (PVs e PVCs).'),
+    'node-metrics': ('nodes', 'node_metrics', 'Mostra métricas de utilização de CPU e memória por nó com os top 5 pods que mais consomem recursos.'),
+    'daemon': ('daemon', 'daemon', 'Gerencia o daemon que mantém clientes da API aquecidos em segundo plano.'),
+    'shell': ('shell', 'shell', 'Abre uma sessão interativa que reaproveita conexões e cache.'),
+
+    # Aliases
+    'aws-login': ('config', 'login_aws', 'Faz login no AWS SSO de forma interativa.'),
+    'azure-login': ('config', 'login_azure', 'Faz login no Azure CLI de forma interativa.'),
+    'lb': ('ingress', 'loadbalancer', 'Mostra os LoadBalancers (Ingresses e Services) do cluster.'),
+}
+
+class LazyGroup(click.Group):
+    """Grupo do click que importa o módulo de cada comando apenas quando ele é usado"""
+
+    def __init__(self, *args, lazy_commands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def main(self, args=None, prog_name=None, complete_var=None, standalone_mode=True, **extra):
+        """Envia o comando ao daemon quando ele está rodando; senão executa neste processo"""
+        argv = sys.argv[1:] if args is None else list(args)
+        if standalone_mode and not os.environ.get('JERA_NO_DAEMON'):
+            from .utils import daemon
+
+            if daemon.should_use_daemon(argv):
+                exit_code = daemon.run_in_daemon(argv)
+                if exit_code is not None:
+                    sys.exit(exit_code)
+
+        return super().main(args, prog_name, complete_var, standalone_mode, **extra)
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.commands:
+            return self.commands[cmd_name]
+        if cmd_name not in self.lazy_commands:
+            return None
+
+        module_name, attr, _ = self.lazy_commands[cmd_name]
+        module = importlib.import_module(f"{__package__}.commands.{module_name}")
+        return getattr(module, attr)
+
+    def format_commands(self, ctx, formatter):
+        """Lista os comandos usando a ajuda registrada, sem importar os módulos"""
+        names = self.list_commands(ctx)
+        if not names:
+            return
+
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = []
+        for name in names:
+            if name in self.commands:
+                cmd = self.commands[name]
+                if cmd.hidden:
+                    continue
+                rows.append((name, cmd.get_short_help_str(limit)))
+            else:
+                short_help = self.lazy_commands[name][2]
+                rows.append((name, click.utils.make_default_short_help(short_help, limit)))
+
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
 
 class KubeContext:
-    def __init__(self):
+    def __init__(self, output='table'):
         self.namespace = None
+        # Formato do -o global, lido pelos comandos de listagem via resolve_output
+        self.output = output
 
 pass_context = click.make_pass_decorator(KubeContext, ensure=True)
 
-@click.group()
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
 @click.version_option(version='1.0.0', prog_name='Jera CLI')
+@click.option('--output', '-o', type=click.Choice(OUTPUT_FORMATS), default='table',
+              help='Formato da saída dos comandos de listagem (json, ndjson ou csv para scripts)')
 @click.pass_context
-def cli(ctx):
+def cli(ctx, output='table'):
     """🚀 Jera CLI - Gerencie seus recursos na AWS e Kubernetes de maneira simples
 
     Uma CLI para facilitar operações comuns no cluster Kubernetes da Jera.
@@ -39,6 +126,8 @@ def cli(ctx):
       clusters      Lista todos os clusters configurados
       login-aws     Faz login no AWS SSO de forma interativa
       login-azure   Faz login no Azure de forma interativa
+      daemon        Inicia/para o daemon que acelera os comandos de leitura
+      shell         Abre uma sessão interativa com autocompletar
     
     \b
     📊 Visualização:
@@ -47,7 +136,7 @@ def cli(ctx):
       pod-metrics  Mostra análise detalhada de recursos dos pods
       all-metrics  Mostra análise detalhada de recursos de todos os pods
       urls         Mostra as URLs dos Ingresses (todos os namespaces)
-      loadbalancer Mostra as URLs dos LoadBalancers (todos os namespaces)
+      loadbalancer Mostra os LoadBalancers (Ingresses e Services) por endereço
       lb           Alias para loadbalancer
     
     \b
@@ -55,6 +144,7 @@ def cli(ctx):
       pvs          Mostra os Persistent Volumes do cluster
       pvcs         Mostra os Persistent Volume Claims
       storage      Mostra uma visão consolidada de armazenamento
+      storage audit Procura volumes órfãos e VolumeAttachments travados
     
     \b
     🖥️ Nós:
@@ -106,44 +196,24 @@ def cli(ctx):
        $ jeracli use-cluster my-cluster   # Usa cluster AWS específico
        $ jeracli use-cluster my-aks -az -g my-group  # Usa cluster Azure específico
     
+    \b
+    Saída para scripts (um registro por vez, sem montar a tabela):
+       $ jeracli -o ndjson pods           # Um JSON por linha
+       $ jeracli -o csv all-metrics       # CSV com cabeçalho
+       $ jeracli urls -o json             # Também aceito depois do comando
+    
     \b
     Use --help em qualquer comando para mais informações:
        $ jeracli init --help
        $ jeracli use-cluster --help
        etc.
     """
-    ctx.obj = KubeContext()
-
-# Registra os comandos
-cli.add_command(init)
-cli.add_command(use)
-cli.add_command(use_cluster)
-cli.add_command(clusters)
-cli.add_command(login_aws)
-cli.add_command(login_azure)
-cli.add_command(init_azure)
-cli.add_command(pods)
-cli.add_command(logs)
-cli.add_command(exec)
-cli.add_command(pod_metrics)
-cli.add_command(all_metrics)
-cli.add_command(nodes)
-cli.add_command(pods_by_node)
-cli.add_command(describe)
-cli.add_command(describe_node)
-cli.add_command(namespaces)
-cli.add_command(urls)
-cli.add_command(delete)
-cli.add_command(loadbalancer)
-cli.add_command(pvs)
-cli.add_command(pvcs)
-cli.add_command(storage)
-cli.add_command(node_metrics)
-
-# Adiciona aliases
-cli.add_command(login_aws, name='aws-login')
-cli.add_command(login_azure, name='azure-login')
-cli.add_command(loadbalancer, name='lb')
+    ctx.obj = KubeContext(output)
+    # O -o global só vale para os comandos de listagem; nos demais é erro, não a tabela em silêncio
+    if output != 'table' and ctx.invoked_subcommand:
+        command = ctx.command.get_command(ctx, ctx.invoked_subcommand)
+        if command is not None and not any(param.name == 'output' for param in command.params):
+            raise click.UsageError(f"'{ctx.invoked_subcommand}' não aceita -o {output}", ctx)
 
 if __name__ == '__main__':
     cli() 
\ No newline at end of file
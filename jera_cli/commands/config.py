@@ -1,24 +1,16 @@
 import click
-from rich.console import Console
-from rich.table import Table
+from ..utils.console import LazyConsole
 import subprocess
 import json
-import yaml
-import os
-import inquirer
-from kubernetes import client, config
-from ..utils.kubernetes import check_aws_sso_config, check_aws_sso_session, check_azure_cli_installed, check_azure_session, get_azure_subscriptions, get_azure_current_subscription, set_azure_subscription, get_azure_clusters, get_aks_credentials
-from ..utils.common import load_namespace
-console = Console()
+from ..utils.kubernetes import check_aws_sso_config, check_aws_sso_session, get_aws_profiles, check_azure_cli_installed, check_azure_session, get_azure_session_expiry, get_azure_subscriptions, get_azure_current_subscription, set_azure_subscription, get_aks_credentials
+from ..utils.config_store import load_config, update_config
+from ..utils.cluster_store import remember_cluster, find_known_clusters, use_known_cluster, get_liveness, probe_in_background, probe_clusters
+from ..utils import gateway
+from ..utils.completion import complete_namespaces, complete_clusters
+console = LazyConsole()
 
-def load_namespace():
-    """Carrega o namespace salvo na configuração"""
-    config_path = os.path.expanduser('~/.jera/config')
-    if os.path.exists(config_path):
-        with open(config_path) as f:
-            config_data = yaml.safe_load(f) or {}
-            return config_data.get('namespace')
-    return None
+# Tempo máximo (segundos) da verificação de cada cluster no `clusters --probe`
+CLUSTERS_PROBE_TIMEOUT = 3
 
 @click.command()
 @click.option('--cluster', '-c', help='Nome do cluster EKS para inicializar')
@@ -26,6 +18,8 @@ def load_namespace():
 @click.option('--profile', '-p', help='Profile AWS para usar')
 def init(cluster=None, region='us-east-1', profile=None):
     """Inicializa a configuração do kubectl para um cluster EKS."""
+    import inquirer
+
     try:
         # Verifica se o AWS CLI está instalado
         try:
@@ -62,12 +56,7 @@ def init(cluster=None, region='us-east-1', profile=None):
             return
 
         # Lista os profiles disponíveis
-        result = subprocess.run(
-            ["aws", "configure", "list-profiles"],
-            capture_output=True,
-            text=True
-        )
-        profiles = result.stdout.strip().split('\n')
+        profiles = get_aws_profiles()
         
         # Adiciona a opção para criar um novo profile
         profiles.append("+ Adicionar novo profile")
@@ -106,13 +95,7 @@ def init(cluster=None, region='us-east-1', profile=None):
                         subprocess.run(["aws", "configure", "sso"], check=True)
                         
                         # Atualiza a lista de profiles
-                        profile_result = subprocess.run(
-                            ["aws", "configure", "list-profiles"],
-                            capture_output=True,
-                            text=True,
-                            check=True
-                        )
-                        new_profiles = profile_result.stdout.strip().split('\n')
+                        new_profiles = get_aws_profiles()
                         after_profiles = set(new_profiles)
                         
                         # Identifica os profiles adicionados
@@ -178,8 +161,17 @@ def init(cluster=None, region='us-east-1', profile=None):
                 console.print(f"❌ Erro ao fazer login com o profile '{selected_profile}'", style="bold red")
                 return
         
-        # Se não foi fornecido cluster, lista os clusters disponíveis
+        # Se não foi fornecido cluster, mostra os clusters do profile no inventário (todas as regiões)
         selected_cluster = cluster
+        if not selected_cluster:
+            found = find_eks_clusters(profile=selected_profile)
+            if found:
+                selected = prompt_eks_cluster(found)
+                if not selected:
+                    return
+                selected_cluster, region = selected['name'], selected['region']
+
+        # Sem clusters no inventário, lista os clusters do profile na região informada
         if not selected_cluster:
             console.print(f"🔍 Listando clusters EKS disponíveis com profile '{selected_profile}'...", style="bold blue")
             
@@ -321,26 +313,14 @@ def init(cluster=None, region='us-east-1', profile=None):
                     console.print(f"\nErro detalhado: {error_message}", style="dim red")
                 return
             
-            # Atualiza a configuração para o cluster atual
-            os.makedirs(os.path.expanduser('~/.jera'), exist_ok=True)
-            config_path = os.path.expanduser('~/.jera/config')
-            
-            # Carrega configuração existente ou cria uma nova
-            config_data = {}
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    config_data = yaml.safe_load(f) or {}
-            
-            # Atualiza a configuração com o cluster atual
-            config_data['current_cluster'] = {
-                'name': selected_cluster,
-                'region': region,
-                'profile': selected_profile
-            }
-            
-            # Salva a configuração
-            with open(config_path, 'w') as f:
-                yaml.dump(config_data, f)
+            # Atualiza a configuração com o cluster atual e guarda o cluster para as próximas trocas
+            with update_config() as config_data:
+                config_data['current_cluster'] = {
+                    'name': selected_cluster,
+                    'region': region,
+                    'profile': selected_profile
+                }
+                remember_cluster(config_data, 'aws', name=selected_cluster, region=region, profile=selected_profile)
             
             console.print(f"✅ Configuração do kubectl atualizada com sucesso para o cluster '{selected_cluster}'!", style="bold green")
             
@@ -369,13 +349,12 @@ def init(cluster=None, region='us-east-1', profile=None):
         console.print(f"❌ Erro durante a inicialização: {str(e)}", style="bold red")
 
 @click.command()
-@click.argument('namespace', required=False)
+@click.argument('namespace', required=False, shell_complete=complete_namespaces)
 def use(namespace=None):
     """Seleciona o namespace atual para operações."""
+    import inquirer
     try:
-        config.load_kube_config()
-        v1 = client.CoreV1Api()
-        available_namespaces = [ns.metadata.name for ns in v1.list_namespace().items]
+        available_namespaces = [ns['metadata']['name'] for ns in gateway.list_namespaces()]
         
         if not available_namespaces:
             console.print("❌ Nenhum namespace encontrado no cluster.", style="bold red")
@@ -406,29 +385,16 @@ def use(namespace=None):
             console.print(f"❌ Namespace '{selected_namespace}' não encontrado!", style="bold red")
             return
             
-        # Salva o namespace selecionado
-        os.makedirs(os.path.expanduser('~/.jera'), exist_ok=True)
-        config_path = os.path.expanduser('~/.jera/config')
-        
-        # Carrega configuração existente ou cria uma nova
-        config_data = {}
-        if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                config_data = yaml.safe_load(f) or {}
-        
         # Atualiza apenas o namespace, mantendo o resto da configuração
-        config_data['namespace'] = selected_namespace
-        
-        # Salva a configuração
-        with open(config_path, 'w') as f:
-            yaml.dump(config_data, f)
+        with update_config() as config_data:
+            config_data['namespace'] = selected_namespace
             
         console.print(f"✅ Namespace alterado para: [bold green]{selected_namespace}[/]", style="bold")
     except Exception as e:
         console.print(f"❌ Erro ao alterar namespace: {str(e)}", style="bold red")
 
 @click.command(name="use-cluster")
-@click.argument('cluster_name', required=False)
+@click.argument('cluster_name', required=False, shell_complete=complete_clusters)
 @click.option('--region', '-r', default='us-east-1', help='Região AWS onde o cluster está localizado')
 @click.option('--profile', '-p', help='Profile AWS para usar')
 @click.option('--azure', '-az', is_flag=True, help='Indica que o cluster está no Azure')
@@ -440,11 +406,7 @@ def use_cluster(cluster_name=None, region='us-east-1', profile=None, azure=False
     """Alterna entre diferentes clusters Kubernetes."""
     try:
         # Carrega a configuração atual
-        config_path = os.path.expanduser('~/.jera/config')
-        config_data = {}
-        if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                config_data = yaml.safe_load(f) or {}
+        config_data = load_config()
         
         # Verifica o tipo atual de cluster configurado (aws ou azure)
         current_type = config_data.get('current_type', 'aws')
@@ -467,14 +429,95 @@ def use_cluster(cluster_name=None, region='us-east-1', profile=None, azure=False
                 
         # Redireciona para o handler específico com base no tipo
         if is_azure:
-            return use_cluster_azure(cluster_name, resource_group, subscription, config_data, config_path)
+            return use_cluster_azure(cluster_name, resource_group, subscription, config_data)
         else:
-            return use_cluster_aws(cluster_name, region, profile, config_data, config_path)
+            return use_cluster_aws(cluster_name, region, profile, config_data)
     except Exception as e:
         console.print(f"❌ Erro ao alternar entre clusters: {str(e)}", style="bold red")
 
-def use_cluster_aws(cluster_name=None, region='us-east-1', profile=None, config_data=None, config_path=None):
+def switch_known_cluster(cluster_type, context, stored):
+    """Troca para um cluster já usado apontando o config para o contexto guardado.
+
+    Não roda o AWS/Azure CLI nem reescreve o kubeconfig; a conexão é
+    verificada em segundo plano. Retorna False, para seguir o caminho
+    completo, se a última verificação do cluster falhou.
+    """
+    liveness = get_liveness(context)
+    if liveness and not liveness.get('ok'):
+        console.print(f"⚠️ A última verificação de conexão com '{stored['name']}' falhou ({liveness.get('error')}). Atualizando as credenciais...", style="bold yellow")
+        return False
+
+    with update_config() as config_data:
+        use_known_cluster(config_data, context)
+        if cluster_type == 'azure':
+            config_data['azure_cluster'] = stored['name']
+            config_data['azure_resource_group'] = stored.get('resource_group')
+            config_data['azure_subscription'] = stored.get('subscription')
+        else:
+            config_data['current_cluster'] = {
+                'name': stored['name'],
+                'region': stored.get('region'),
+                'profile': stored.get('profile')
+            }
+        config_data['current_type'] = cluster_type
+    probe_in_background(context)
+
+    if cluster_type == 'azure':
+        console.print(f"✅ Cluster alterado para: [bold green]{stored['name']}[/] (Azure AKS)", style="bold")
+    else:
+        console.print(f"✅ Cluster alterado para: [bold green]{stored['name']}[/] com profile [bold green]{stored.get('profile')}[/]", style="bold")
+    console.print("🔎 Usando o contexto guardado; a conexão é verificada em segundo plano.", style="dim")
+    return True
+
+def find_eks_clusters(cluster_name=None, profile=None):
+    """Busca clusters EKS no inventário de todos os profiles e regiões (~/.jera/cache/clusters.json).
+
+    O inventário em cache responde na hora e é atualizado em segundo plano
+    quando vence; só a primeira vez consulta a AWS antes de responder.
+    Retorna a lista filtrada por nome e/ou profile (vazia se nada for encontrado).
+    """
+    from ..utils.cache import read_json
+    from ..utils.inventory import INVENTORY_FILE, get_eks_inventory
+
+    try:
+        if read_json(INVENTORY_FILE) is None:
+            console.print("🔍 Montando o inventário de clusters EKS de todos os profiles e regiões...", style="bold blue")
+        clusters = get_eks_inventory().get('clusters') or []
+    except Exception as e:
+        console.print(f"⚠️ Não foi possível montar o inventário de clusters: {str(e)}", style="dim yellow")
+        return []
+
+    if profile:
+        clusters = [c for c in clusters if c['profile'] == profile]
+    if cluster_name:
+        clusters = [c for c in clusters if c['name'] == cluster_name]
+    return clusters
+
+def prompt_eks_cluster(clusters, current=None):
+    """Mostra a lista de clusters do inventário; retorna o escolhido ou None se cancelado"""
+    import inquirer
+
+    current = current or {}
+    choices = []
+    for c in clusters:
+        label = f"{c['name']}  ({c['region']}, {c['profile']})"
+        if (c['name'], c['region'], c['profile']) == (current.get('name'), current.get('region'), current.get('profile')):
+            label += " (atual)"
+        choices.append((label, c))
+
+    questions = [
+        inquirer.List('cluster',
+                      message="Selecione um cluster EKS",
+                      choices=choices,
+                      )
+    ]
+    answers = inquirer.prompt(questions)
+    return answers['cluster'] if answers else None
+
+def use_cluster_aws(cluster_name=None, region='us-east-1', profile=None, config_data=None):
     """Alterna para um cluster AWS EKS."""
+    import inquirer
+
     try:
         # Verifica se tem uma sessão AWS ativa
         if not check_aws_sso_session():
@@ -482,13 +525,25 @@ def use_cluster_aws(cluster_name=None, region='us-east-1', profile=None, config_
             console.print("\n📝 Use o comando 'jeracli login-aws' para fazer login primeiro.", style="bold blue")
             return
         
+        # Cluster já usado antes: só troca o contexto, sem rodar o update-kubeconfig
+        known = find_known_clusters('aws', name=cluster_name, profile=profile) if cluster_name else []
+        if len(known) == 1 and switch_known_cluster('aws', *known[0]):
+            return
+        checked_known = len(known) == 1
+
+        # Escolhe pelo inventário de todos os profiles e regiões, se ele tiver o cluster
+        from_inventory = False
+        if not (cluster_name and profile):
+            found = find_eks_clusters(cluster_name, profile)
+            if found:
+                selected = found[0] if cluster_name and len(found) == 1 else prompt_eks_cluster(found, config_data.get('current_cluster'))
+                if not selected:
+                    return
+                cluster_name, profile, region = selected['name'], selected['profile'], selected['region']
+                from_inventory = True
+
         # Lista os profiles disponíveis
-        result = subprocess.run(
-            ["aws", "configure", "list-profiles"],
-            capture_output=True,
-            text=True
-        )
-        profiles = result.stdout.strip().split('\n')
+        profiles = get_aws_profiles()
         
         profile = profile
         
@@ -521,150 +576,157 @@ def use_cluster_aws(cluster_name=None, region='us-east-1', profile=None, config_
             else:
                 return
         
-        # Lista os clusters disponíveis para o profile selecionado
-        console.print(f"🔍 Listando clusters EKS disponíveis com profile '{profile}'...", style="bold blue")
+        # Sem o cluster no inventário, lista os clusters do profile selecionado na região informada
+        if not from_inventory:
+            # Lista os clusters disponíveis para o profile selecionado
+            console.print(f"🔍 Listando clusters EKS disponíveis com profile '{profile}'...", style="bold blue")
         
-        try:
-            # Primeiro verifica se o usuário tem permissão para listar clusters do EKS
-            test_cmd = [
-                "aws", "sts", "get-caller-identity",
-                "--profile", profile,
-                "--region", region
-            ]
-            test_result = subprocess.run(
-                test_cmd,
-                capture_output=True,
-                text=True
-            )
+            try:
+                # Primeiro verifica se o usuário tem permissão para listar clusters do EKS
+                test_cmd = [
+                    "aws", "sts", "get-caller-identity",
+                    "--profile", profile,
+                    "--region", region
+                ]
+                test_result = subprocess.run(
+                    test_cmd,
+                    capture_output=True,
+                    text=True
+                )
             
-            if test_result.returncode != 0:
-                console.print(f"❌ Erro de autenticação com o profile '{profile}'", style="bold red")
-                console.print("\n📝 Possíveis soluções:", style="bold yellow")
-                console.print("1. Verifique se a sessão SSO está ativa:", style="dim white")
-                console.print(f"   aws sso login --profile {profile}", style="bold green")
-                console.print("2. Verifique se o profile tem as permissões necessárias para acessar o EKS", style="dim white")
-                console.print("3. Tente usar outro profile com permissões adequadas", style="dim white")
-                return
+                if test_result.returncode != 0:
+                    console.print(f"❌ Erro de autenticação com o profile '{profile}'", style="bold red")
+                    console.print("\n📝 Possíveis soluções:", style="bold yellow")
+                    console.print("1. Verifique se a sessão SSO está ativa:", style="dim white")
+                    console.print(f"   aws sso login --profile {profile}", style="bold green")
+                    console.print("2. Verifique se o profile tem as permissões necessárias para acessar o EKS", style="dim white")
+                    console.print("3. Tente usar outro profile com permissões adequadas", style="dim white")
+                    return
 
-            result = subprocess.run(
-                ["aws", "eks", "list-clusters", "--region", region, "--profile", profile],
-                capture_output=True,
-                text=True,
-                check=False
-            )
+                result = subprocess.run(
+                    ["aws", "eks", "list-clusters", "--region", region, "--profile", profile],
+                    capture_output=True,
+                    text=True,
+                    check=False
+                )
             
-            if result.returncode != 0:
-                error_message = result.stderr.strip()
-                console.print(f"❌ Erro ao listar clusters EKS:", style="bold red")
+                if result.returncode != 0:
+                    error_message = result.stderr.strip()
+                    console.print(f"❌ Erro ao listar clusters EKS:", style="bold red")
                 
-                if "AccessDeniedException" in error_message or "UnauthorizedException" in error_message:
-                    console.print("\n⚠️ O profile não tem permissão para listar clusters do EKS.", style="bold yellow")
-                    console.print(f"\n📝 Tente logar novamente com o profile '{profile}':", style="bold blue")
-                    console.print(f"   aws sso login --profile {profile}", style="bold green")
-                    console.print("\nOu forneça o nome do cluster diretamente:", style="bold blue")
-                    console.print(f"   jeracli use-cluster nome-do-cluster -p {profile}", style="bold green")
-                elif "ExpiredToken" in error_message:
-                    console.print("\n⚠️ Token de acesso AWS expirado.", style="bold yellow")
-                    console.print(f"\n📝 Renove sua sessão:", style="bold blue")
-                    console.print(f"   aws sso login --profile {profile}", style="bold green")
-                else:
-                    console.print(f"\nErro detalhado: {error_message}", style="dim red")
-                    console.print("\n📝 Se você conhece o nome do cluster, pode fornecê-lo diretamente:", style="bold blue")
-                    console.print(f"   jeracli use-cluster nome-do-cluster -p {profile}", style="bold green")
+                    if "AccessDeniedException" in error_message or "UnauthorizedException" in error_message:
+                        console.print("\n⚠️ O profile não tem permissão para listar clusters do EKS.", style="bold yellow")
+                        console.print(f"\n📝 Tente logar novamente com o profile '{profile}':", style="bold blue")
+                        console.print(f"   aws sso login --profile {profile}", style="bold green")
+                        console.print("\nOu forneça o nome do cluster diretamente:", style="bold blue")
+                        console.print(f"   jeracli use-cluster nome-do-cluster -p {profile}", style="bold green")
+                    elif "ExpiredToken" in error_message:
+                        console.print("\n⚠️ Token de acesso AWS expirado.", style="bold yellow")
+                        console.print(f"\n📝 Renove sua sessão:", style="bold blue")
+                        console.print(f"   aws sso login --profile {profile}", style="bold green")
+                    else:
+                        console.print(f"\nErro detalhado: {error_message}", style="dim red")
+                        console.print("\n📝 Se você conhece o nome do cluster, pode fornecê-lo diretamente:", style="bold blue")
+                        console.print(f"   jeracli use-cluster nome-do-cluster -p {profile}", style="bold green")
                 
-                # Questiona o usuário se deseja informar o nome do cluster manualmente
-                manual_cluster = click.prompt("Deseja informar o nome do cluster manualmente? [s/N]", default="n")
-                if manual_cluster.lower() == "s":
-                    selected_cluster = click.prompt("Digite o nome do cluster")
-                    # Define o argumento cluster_name para usar no restante do código
-                    cluster_name = selected_cluster
+                    # Questiona o usuário se deseja informar o nome do cluster manualmente
+                    manual_cluster = click.prompt("Deseja informar o nome do cluster manualmente? [s/N]", default="n")
+                    if manual_cluster.lower() == "s":
+                        selected_cluster = click.prompt("Digite o nome do cluster")
+                        # Define o argumento cluster_name para usar no restante do código
+                        cluster_name = selected_cluster
+                    else:
+                        return
                 else:
-                    return
-            else:
-                try:
-                    clusters_data = json.loads(result.stdout)
-                    available_clusters = clusters_data.get("clusters", [])
+                    try:
+                        clusters_data = json.loads(result.stdout)
+                        available_clusters = clusters_data.get("clusters", [])
                     
-                    if not available_clusters:
-                        console.print(f"❌ Nenhum cluster EKS encontrado na conta com profile '{profile}'.", style="bold red")
+                        if not available_clusters:
+                            console.print(f"❌ Nenhum cluster EKS encontrado na conta com profile '{profile}'.", style="bold red")
                         
-                        # Questiona o usuário se deseja informar o nome do cluster manualmente
-                        manual_cluster = click.prompt("Deseja informar o nome do cluster manualmente? [s/N]", default="n")
-                        if manual_cluster.lower() == "s":
-                            selected_cluster = click.prompt("Digite o nome do cluster")
-                            # Define o argumento cluster_name para usar no restante do código
-                            cluster_name = selected_cluster
+                            # Questiona o usuário se deseja informar o nome do cluster manualmente
+                            manual_cluster = click.prompt("Deseja informar o nome do cluster manualmente? [s/N]", default="n")
+                            if manual_cluster.lower() == "s":
+                                selected_cluster = click.prompt("Digite o nome do cluster")
+                                # Define o argumento cluster_name para usar no restante do código
+                                cluster_name = selected_cluster
+                            else:
+                                return
                         else:
-                            return
-                    else:
-                        # Se um nome de cluster foi fornecido, verifica se ele existe na lista
-                        if cluster_name and cluster_name not in available_clusters:
-                            console.print(f"⚠️ Cluster '{cluster_name}' não encontrado na lista. Verifique o nome e tente novamente.", style="bold yellow")
+                            # Se um nome de cluster foi fornecido, verifica se ele existe na lista
+                            if cluster_name and cluster_name not in available_clusters:
+                                console.print(f"⚠️ Cluster '{cluster_name}' não encontrado na lista. Verifique o nome e tente novamente.", style="bold yellow")
                             
-                            # Questiona se deseja selecionar entre os clusters disponíveis
-                            select_from_list = click.prompt("Deseja selecionar entre os clusters disponíveis? [S/n]", default="s")
-                            if select_from_list.lower() != "s":
-                                return
+                                # Questiona se deseja selecionar entre os clusters disponíveis
+                                select_from_list = click.prompt("Deseja selecionar entre os clusters disponíveis? [S/n]", default="s")
+                                if select_from_list.lower() != "s":
+                                    return
                             
-                            # Reseta o argumento para forçar seleção interativa
-                            cluster_name = None
+                                # Reseta o argumento para forçar seleção interativa
+                                cluster_name = None
                         
-                        # Se não foi fornecido um cluster ou o nome não foi encontrado, mostra a lista interativa
-                        if not cluster_name:
-                            # Obtém o cluster atual da configuração (se existir)
-                            current_cluster = None
-                            if 'current_cluster' in config_data and 'name' in config_data['current_cluster']:
-                                current_cluster = config_data['current_cluster']['name']
+                            # Se não foi fornecido um cluster ou o nome não foi encontrado, mostra a lista interativa
+                            if not cluster_name:
+                                # Obtém o cluster atual da configuração (se existir)
+                                current_cluster = None
+                                if 'current_cluster' in config_data and 'name' in config_data['current_cluster']:
+                                    current_cluster = config_data['current_cluster']['name']
                             
-                            # Prepara as opções com o cluster atual destacado
-                            cluster_choices = []
-                            for c in available_clusters:
-                                if c == current_cluster:
-                                    cluster_choices.append(f"{c} (atual)")
-                                else:
-                                    cluster_choices.append(c)
+                                # Prepara as opções com o cluster atual destacado
+                                cluster_choices = []
+                                for c in available_clusters:
+                                    if c == current_cluster:
+                                        cluster_choices.append(f"{c} (atual)")
+                                    else:
+                                        cluster_choices.append(c)
                             
-                            questions = [
-                                inquirer.List('cluster',
-                                            message="Selecione um cluster EKS para usar",
-                                            choices=cluster_choices,
-                                            )
-                            ]
-                            answers = inquirer.prompt(questions)
+                                questions = [
+                                    inquirer.List('cluster',
+                                                message="Selecione um cluster EKS para usar",
+                                                choices=cluster_choices,
+                                                )
+                                ]
+                                answers = inquirer.prompt(questions)
                             
-                            if answers:
-                                # Remove o sufixo " (atual)" se presente
-                                selected_cluster = answers['cluster'].replace(" (atual)", "")
-                                # Define o argumento cluster_name para usar no restante do código
-                                cluster_name = selected_cluster
-                            else:
-                                return
-                except json.JSONDecodeError:
-                    console.print("❌ Erro ao processar a resposta da AWS.", style="bold red")
-                    console.print(f"Resposta recebida: {result.stdout}", style="dim")
+                                if answers:
+                                    # Remove o sufixo " (atual)" se presente
+                                    selected_cluster = answers['cluster'].replace(" (atual)", "")
+                                    # Define o argumento cluster_name para usar no restante do código
+                                    cluster_name = selected_cluster
+                                else:
+                                    return
+                    except json.JSONDecodeError:
+                        console.print("❌ Erro ao processar a resposta da AWS.", style="bold red")
+                        console.print(f"Resposta recebida: {result.stdout}", style="dim")
                     
-                    # Questiona o usuário se deseja informar o nome do cluster manualmente
-                    manual_cluster = click.prompt("Deseja informar o nome do cluster manualmente? [s/N]", default="n")
-                    if manual_cluster.lower() == "s":
-                        selected_cluster = click.prompt("Digite o nome do cluster")
-                        # Define o argumento cluster_name para usar no restante do código
-                        cluster_name = selected_cluster
-                    else:
-                        return
-        except Exception as e:
-            console.print(f"❌ Erro ao listar ou selecionar clusters: {str(e)}", style="bold red")
-            console.print("\n📝 Se você conhece o nome do cluster, pode fornecê-lo diretamente:", style="bold blue")
-            console.print(f"   jeracli use-cluster nome-do-cluster -p {profile}", style="bold green")
+                        # Questiona o usuário se deseja informar o nome do cluster manualmente
+                        manual_cluster = click.prompt("Deseja informar o nome do cluster manualmente? [s/N]", default="n")
+                        if manual_cluster.lower() == "s":
+                            selected_cluster = click.prompt("Digite o nome do cluster")
+                            # Define o argumento cluster_name para usar no restante do código
+                            cluster_name = selected_cluster
+                        else:
+                            return
+            except Exception as e:
+                console.print(f"❌ Erro ao listar ou selecionar clusters: {str(e)}", style="bold red")
+                console.print("\n📝 Se você conhece o nome do cluster, pode fornecê-lo diretamente:", style="bold blue")
+                console.print(f"   jeracli use-cluster nome-do-cluster -p {profile}", style="bold green")
             
-            # Questiona o usuário se deseja informar o nome do cluster manualmente
-            manual_cluster = click.prompt("Deseja informar o nome do cluster manualmente? [s/N]", default="n")
-            if manual_cluster.lower() == "s":
-                selected_cluster = click.prompt("Digite o nome do cluster")
-                # Define o argumento cluster_name para usar no restante do código
-                cluster_name = selected_cluster
-            else:
-                return
+                # Questiona o usuário se deseja informar o nome do cluster manualmente
+                manual_cluster = click.prompt("Deseja informar o nome do cluster manualmente? [s/N]", default="n")
+                if manual_cluster.lower() == "s":
+                    selected_cluster = click.prompt("Digite o nome do cluster")
+                    # Define o argumento cluster_name para usar no restante do código
+                    cluster_name = selected_cluster
+                else:
+                    return
         
+        # Cluster já usado antes com este profile e região
+        known = find_known_clusters('aws', name=cluster_name, profile=profile, region=region) if cluster_name and not checked_known else []
+        if known and switch_known_cluster('aws', *known[0]):
+            return
+
         # Faz login se necessário
         if not check_aws_sso_session():
             console.print(f"\n🔑 Fazendo login com o profile [bold green]{profile}[/]...", style="bold blue")
@@ -722,18 +784,15 @@ def use_cluster_aws(cluster_name=None, region='us-east-1', profile=None, config_
                     console.print(f"\nErro detalhado: {error_message}", style="dim red")
                 return
                 
-            # Atualiza a configuração do Jera CLI
-            config_data['current_cluster'] = {
-                'name': cluster_name,
-                'region': region,
-                'profile': profile
-            }
-            config_data['current_type'] = 'aws'
-            
-            # Salva a configuração
-            os.makedirs(os.path.expanduser('~/.jera'), exist_ok=True)
-            with open(config_path, 'w') as f:
-                yaml.dump(config_data, f)
+            # Atualiza a configuração do Jera CLI e guarda o cluster para as próximas trocas
+            with update_config() as config_data:
+                config_data['current_cluster'] = {
+                    'name': cluster_name,
+                    'region': region,
+                    'profile': profile
+                }
+                config_data['current_type'] = 'aws'
+                remember_cluster(config_data, 'aws', name=cluster_name, region=region, profile=profile)
             
             console.print(f"✅ Cluster alterado para: [bold green]{cluster_name}[/] com profile [bold green]{profile}[/]", style="bold")
             
@@ -763,15 +822,73 @@ def use_cluster_aws(cluster_name=None, region='us-east-1', profile=None, config_
     except Exception as e:
         console.print(f"❌ Erro ao alternar para o cluster AWS: {str(e)}", style="bold red")
     
-def use_cluster_azure(cluster_name=None, resource_group=None, subscription=None, config_data=None, config_path=None):
+def select_aks_cluster(config_data, subscription=None):
+    """Mostra os clusters AKS de todas as assinaturas (ou só de `subscription`) para seleção.
+
+    A lista vem do inventário em ~/.jera/cache/aks-clusters.json, atualizado em
+    segundo plano. Se a assinatura pedida não tiver clusters no cache, o
+    inventário é refeito antes de desistir. Retorna (cluster, grupo de
+    recursos, assinatura) ou None.
+    """
+    import inquirer
+    import time
+    from ..utils.cache import read_json
+    from ..utils.inventory import AKS_INVENTORY_FILE, build_aks_inventory, get_aks_inventory
+
+    def matching(inventory):
+        clusters = inventory.get('clusters') or []
+        if subscription:
+            clusters = [c for c in clusters if subscription in (c['subscription'], c['subscription_id'])]
+        return clusters
+
+    try:
+        if read_json(AKS_INVENTORY_FILE) is None:
+            console.print("\n🔍 Listando clusters AKS de todas as assinaturas...", style="bold blue")
+        inventory = get_aks_inventory()
+        clusters = matching(inventory)
+        if not clusters and time.time() - inventory.get('updated', 0) > 60:
+            console.print("\n🔍 Atualizando a lista de clusters AKS...", style="bold blue")
+            inventory = build_aks_inventory()
+            clusters = matching(inventory)
+    except Exception as e:
+        console.print(f"❌ Erro ao listar clusters Azure: {str(e)}", style="bold red")
+        return None
+
+    for warning in inventory.get('warnings') or []:
+        console.print(f"⚠️ {warning}", style="bold yellow")
+
+    if not clusters:
+        for error in inventory.get('errors') or []:
+            console.print(f"❌ Erro ao listar clusters AKS: {error['error']}", style="bold red")
+        console.print("❌ Não foram encontrados clusters AKS nesta assinatura." if subscription else "❌ Não foram encontrados clusters AKS.", style="bold red")
+        return None
+
+    current = (config_data.get('azure_cluster'), config_data.get('azure_resource_group'))
+    choices = []
+    for c in clusters:
+        label = f"{c['name']} (Grupo: {c['resource_group']}, Assinatura: {c['subscription']})"
+        if (c['name'], c['resource_group']) == current:
+            label += " (atual)"
+        choices.append((label, c))
+
+    questions = [
+        inquirer.List('cluster',
+                      message="Selecione o cluster AKS",
+                      choices=choices,
+                      )
+    ]
+    answers = inquirer.prompt(questions)
+    if not answers:
+        return None
+    selected = answers['cluster']
+    return selected['name'], selected['resource_group'], selected['subscription']
+
+def use_cluster_azure(cluster_name=None, resource_group=None, subscription=None, config_data=None):
     """Alterna para um cluster Azure AKS."""
     try:
         # Carrega a configuração atual
-        config_path = os.path.expanduser('~/.jera/config')
-        config_data = {}
-        if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                config_data = yaml.safe_load(f) or {}
+        if config_data is None:
+            config_data = load_config()
                 
         # Verifica se o Azure CLI está instalado
         if not check_azure_cli_installed():
@@ -794,96 +911,30 @@ def use_cluster_azure(cluster_name=None, resource_group=None, subscription=None,
         current_subscription = get_azure_current_subscription()
         selected_subscription = subscription or current_subscription
         
-        if subscription and subscription != current_subscription:
-            console.print(f"\n🔄 Mudando para a assinatura [bold blue]{selected_subscription}[/]...", style="bold blue")
-            
-            if not set_azure_subscription(selected_subscription):
-                console.print(f"❌ Erro ao alterar a assinatura.", style="bold red")
-                return
-        
-        # Se não foi fornecido um cluster, lista os clusters disponíveis
+        # Se não foi fornecido um cluster, lista os clusters disponíveis (o inventário já filtra pela assinatura)
         selected_cluster = cluster_name
         selected_resource_group = resource_group
         
         if not selected_cluster:
-            console.print(f"\n🔍 Listando clusters AKS na assinatura [bold blue]{selected_subscription}[/]...", style="bold blue")
-            
-            try:
-                # Obtém todos os clusters com seus respectivos grupos de recursos
-                result = subprocess.run(
-                    ["az", "aks", "list", "--query", "[].{name:name, resourceGroup:resourceGroup}", "-o", "json"],
-                    capture_output=True,
-                    text=True
-                )
-                
-                if result.returncode != 0:
-                    console.print(f"❌ Erro ao listar clusters AKS: {result.stderr}", style="bold red")
-                    return
-                
-                clusters = json.loads(result.stdout)
-                
-                if not clusters:
-                    console.print("❌ Não foram encontrados clusters AKS nesta assinatura.", style="bold red")
-                    return
-                
-                # Obtém o cluster atual da configuração (se existir)
-                current_cluster = None
-                current_resource_group = None
-                
-                if 'azure_cluster' in config_data:
-                    current_cluster = config_data['azure_cluster']
-                    current_resource_group = config_data.get('azure_resource_group')
-                
-                # Monta opções para o usuário selecionar
-                cluster_choices = []
-                for c in clusters:
-                    cluster_info = f"{c['name']} (Grupo: {c['resourceGroup']})"
-                    # Marca o cluster atual
-                    if c['name'] == current_cluster and c['resourceGroup'] == current_resource_group:
-                        cluster_choices.append(f"{cluster_info} (atual)")
-                    else:
-                        cluster_choices.append(cluster_info)
-                
-                questions = [
-                    inquirer.List('cluster',
-                                message="Selecione o cluster AKS",
-                                choices=cluster_choices,
-                                )
-                ]
-                answers = inquirer.prompt(questions)
-                
-                if not answers:
-                    return
-                
-                # Extrai o nome do cluster e o grupo de recursos da seleção
-                selected_option = answers['cluster'].replace(" (atual)", "")
-                
-                # Tenta encontrar o cluster e grupo de recursos correspondentes
-                found = False
-                for c in clusters:
-                    if selected_option == f"{c['name']} (Grupo: {c['resourceGroup']})":
-                        selected_cluster = c['name']
-                        selected_resource_group = c['resourceGroup']
-                        found = True
-                        break
-                
-                # Se não encontrou na forma exata, tenta extrair o nome e grupo diretamente
-                if not found:
-                    # Tenta extrair o nome e o grupo da string selecionada
-                    # Formato esperado: "nome-do-cluster (Grupo: nome-do-grupo)"
-                    import re
-                    match = re.match(r"([^(]+)\s*\(Grupo:\s*([^)]+)\)", selected_option)
-                    if match:
-                        selected_cluster = match.group(1).strip()
-                        selected_resource_group = match.group(2).strip()
-                    else:
-                        console.print("❌ Não foi possível extrair o nome do cluster e grupo de recursos da seleção.", style="bold red")
-                        return
-                
-            except Exception as e:
-                console.print(f"❌ Erro ao listar clusters Azure: {str(e)}", style="bold red")
+            selected = select_aks_cluster(config_data, subscription)
+            if not selected:
+                return
+            selected_cluster, selected_resource_group, selected_subscription = selected
+        
+        # Cluster já usado antes: só troca o contexto, sem rodar o az account set nem o get-credentials
+        known = find_known_clusters('azure', name=selected_cluster, resource_group=selected_resource_group, subscription=selected_subscription) if selected_cluster else []
+        if len(known) == 1:
+            if switch_known_cluster('azure', *known[0]):
                 return
+            selected_resource_group = selected_resource_group or known[0][1].get('resource_group')
         
+        if subscription and subscription != current_subscription:
+            console.print(f"\n🔄 Mudando para a assinatura [bold blue]{selected_subscription}[/]...", style="bold blue")
+            
+            if not set_azure_subscription(selected_subscription):
+                console.print(f"❌ Erro ao alterar a assinatura.", style="bold red")
+                return
+
         # Verifica se temos o grupo de recursos quando o cluster está definido
         if selected_cluster and not selected_resource_group:
             console.print("❌ Grupo de recursos não informado para o cluster Azure.", style="bold red")
@@ -901,16 +952,13 @@ def use_cluster_azure(cluster_name=None, resource_group=None, subscription=None,
         )
         
         if success:
-            # Atualiza a configuração
-            config_data['azure_cluster'] = selected_cluster
-            config_data['azure_resource_group'] = selected_resource_group
-            config_data['azure_subscription'] = selected_subscription
-            config_data['current_type'] = 'azure'
-            
-            # Salva a configuração
-            os.makedirs(os.path.expanduser('~/.jera'), exist_ok=True)
-            with open(config_path, 'w') as f:
-                yaml.dump(config_data, f)
+            # Atualiza a configuração e guarda o cluster para as próximas trocas
+            with update_config() as config_data:
+                config_data['azure_cluster'] = selected_cluster
+                config_data['azure_resource_group'] = selected_resource_group
+                config_data['azure_subscription'] = selected_subscription
+                config_data['current_type'] = 'azure'
+                remember_cluster(config_data, 'azure', name=selected_cluster, resource_group=selected_resource_group, subscription=selected_subscription)
             
             console.print(f"✅ Cluster alterado para: [bold green]{selected_cluster}[/] (Azure AKS)", style="bold")
             console.print(f"📊 Detalhes:", style="bold blue")
@@ -946,62 +994,55 @@ def use_cluster_azure(cluster_name=None, resource_group=None, subscription=None,
     except Exception as e:
         console.print(f"❌ Erro ao alternar para o cluster Azure: {str(e)}", style="bold red")
 
-def list_configured_clusters():
-    """Lista todos os contextos de clusters configurados no kubeconfig."""
+def list_configured_clusters(probe=False, timeout=CLUSTERS_PROBE_TIMEOUT):
+    """Lista todos os contextos de clusters configurados no kubeconfig.
+
+    Lê o kubeconfig direto (sem kubectl), incluindo os clusters guardados
+    pelo use-cluster. Com probe=True consulta o /version de todos os
+    contextos em paralelo e mostra acessibilidade, versão e latência da API.
+    """
+    from rich.table import Table
+    from ..utils.kubeconfig import load_kubeconfig
+
     try:
-        # Obtém os contextos do kubeconfig
-        result = subprocess.run(
-            ["kubectl", "config", "get-contexts"],
-            capture_output=True,
-            text=True
-        )
-        
-        if result.returncode != 0:
-            console.print("❌ Erro ao listar contextos do kubectl.", style="bold red")
-            return
-        
-        # Obtém o contexto atual
-        current_context_result = subprocess.run(
-            ["kubectl", "config", "current-context"],
-            capture_output=True,
-            text=True
-        )
-        current_context = current_context_result.stdout.strip() if current_context_result.returncode == 0 else None
-        
+        kubeconfig = load_kubeconfig()
+        current_context = kubeconfig.get('current-context')
+        contexts = kubeconfig['contexts']
+
+        results = {}
+        if probe and contexts:
+            console.print(f"\n🔄 Verificando {len(contexts)} cluster(s) (timeout de {timeout}s)...", style="yellow")
+            results = probe_clusters([c['name'] for c in contexts], timeout)
+
         # Cria uma tabela com os contextos
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("Nome do Contexto")
         table.add_column("Cluster")
         table.add_column("Usuário")
         table.add_column("Status")
-        
-        # Parse das linhas do resultado
-        lines = result.stdout.strip().split('\n')
-        if len(lines) > 1:  # Ignora o cabeçalho
-            for line in lines[1:]:  # Pula o cabeçalho
-                parts = line.strip().split()
-                if len(parts) >= 3:
-                    is_current = '*' in parts[0]
-                    
-                    # Ajusta os índices baseados se tem o asterisco no começo
-                    if is_current:
-                        context_name = parts[1]
-                        cluster_name = parts[2]
-                        user_name = parts[3] if len(parts) > 3 else "N/A"
-                    else:
-                        context_name = parts[0]
-                        cluster_name = parts[1]
-                        user_name = parts[2] if len(parts) > 2 else "N/A"
-                    
-                    status = "[bold green]ATUAL[/]" if context_name == current_context else ""
-                    
-                    table.add_row(
-                        context_name,
-                        cluster_name,
-                        user_name,
-                        status
-                    )
-        
+        if probe:
+            table.add_column("API")
+            table.add_column("Versão")
+            table.add_column("Latência", justify="right")
+
+        for entry in contexts:
+            context_name = entry['name']
+            row = [
+                context_name,
+                entry['context'].get('cluster') or "N/A",
+                entry['context'].get('user') or "N/A",
+                "[bold green]ATUAL[/]" if context_name == current_context else "",
+            ]
+            if probe:
+                result = results.get(context_name) or {}
+                seconds = result.get('seconds')
+                if result.get('ok'):
+                    latency_style = "green" if seconds < 0.3 else "yellow" if seconds < 1 else "red"
+                    row += ["[green]✅ ok[/]", result.get('version') or "-", f"[{latency_style}]{seconds * 1000:.0f} ms[/]"]
+                else:
+                    row += [f"[red]❌ {result.get('error', 'inacessível')}[/]", "-", "-"]
+            table.add_row(*row)
+
         console.print("\n📋 Clusters configurados:", style="bold blue")
         console.print(table)
         console.print("\nDica: Use 'jeracli use-cluster' para alternar entre clusters.", style="dim")
@@ -1012,6 +1053,8 @@ def list_configured_clusters():
 @click.command(name="login-aws")
 def login_aws():
     """Faz login no AWS SSO de forma interativa."""
+    import inquirer
+
     try:
         # Verifica se o AWS CLI está instalado
         try:
@@ -1048,13 +1091,7 @@ def login_aws():
                     console.print("\n✅ AWS SSO configurado com sucesso!", style="bold green")
                     
                     # Obtém a lista de profiles
-                    profile_result = subprocess.run(
-                        ["aws", "configure", "list-profiles"],
-                        capture_output=True,
-                        text=True,
-                        check=True
-                    )
-                    profiles = profile_result.stdout.strip().split('\n')
+                    profiles = get_aws_profiles()
                     
                     # Se só existe um profile, usa-o automaticamente
                     if len(profiles) == 1:
@@ -1104,12 +1141,7 @@ def login_aws():
             
         else:
             # Lista os profiles disponíveis
-            result = subprocess.run(
-                ["aws", "configure", "list-profiles"],
-                capture_output=True,
-                text=True
-            )
-            profiles = result.stdout.strip().split('\n')
+            profiles = get_aws_profiles()
             
             # Adiciona a opção para criar um novo profile
             profiles.append("+ Adicionar novo profile")
@@ -1145,13 +1177,7 @@ def login_aws():
                         subprocess.run(["aws", "configure", "sso"], check=True)
                         
                         # Atualiza a lista de profiles
-                        profile_result = subprocess.run(
-                            ["aws", "configure", "list-profiles"],
-                            capture_output=True,
-                            text=True,
-                            check=True
-                        )
-                        new_profiles = profile_result.stdout.strip().split('\n')
+                        new_profiles = get_aws_profiles()
                         after_profiles = set(new_profiles)
                         
                         # Identifica os profiles adicionados
@@ -1221,13 +1247,22 @@ def login_aws():
             console.print("A sessão SSO expirou. Tente novamente.", style="yellow") 
 
 @click.command(name="clusters")
-def clusters():
-    """Lista todos os clusters Kubernetes configurados."""
-    list_configured_clusters()
+@click.option('--probe', is_flag=True, help='Consulta a API de todos os clusters em paralelo (acessibilidade, versão e latência)')
+@click.option('--timeout', type=float, default=CLUSTERS_PROBE_TIMEOUT, show_default=True, help='Tempo máximo (segundos) da verificação com --probe')
+def clusters(probe=False, timeout=CLUSTERS_PROBE_TIMEOUT):
+    """Lista todos os clusters Kubernetes configurados.
+
+    Exemplos:
+        $ jeracli clusters            # Contextos do kubeconfig
+        $ jeracli clusters --probe    # Com a latência e a versão da API de cada cluster
+    """
+    list_configured_clusters(probe, timeout)
 
 @click.command(name="login-azure")
 def login_azure():
     """Faz login no Azure CLI de forma interativa."""
+    import inquirer
+
     try:
         # Verifica se o Azure CLI está instalado
         if not check_azure_cli_installed():
@@ -1247,6 +1282,9 @@ def login_azure():
             
             console.print(f"\n✅ Você já está logado no Azure!", style="bold green")
             console.print(f"🔹 Assinatura atual: [bold blue]{current_subscription}[/]", style="dim")
+            expiry = get_azure_session_expiry()
+            if expiry:
+                console.print(f"🔹 Token de acesso válido até: [bold blue]{expiry:%d/%m/%Y %H:%M}[/] (renovado automaticamente)", style="dim")
             
             # Pergunta se quer mudar a assinatura
             choices = ["Continuar com a assinatura atual"] + subscriptions
@@ -1328,11 +1366,7 @@ def init_azure(cluster=None, resource_group=None, subscription=None):
     """Inicializa a configuração do kubectl para um cluster AKS."""
     try:
         # Carrega a configuração atual
-        config_path = os.path.expanduser('~/.jera/config')
-        config_data = {}
-        if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                config_data = yaml.safe_load(f) or {}
+        config_data = load_config()
                 
         # Verifica se o Azure CLI está instalado
         if not check_azure_cli_installed():
@@ -1367,83 +1401,10 @@ def init_azure(cluster=None, resource_group=None, subscription=None):
         selected_resource_group = resource_group
         
         if not selected_cluster:
-            console.print(f"\n🔍 Listando clusters AKS na assinatura [bold blue]{selected_subscription}[/]...", style="bold blue")
-            
-            try:
-                # Obtém todos os clusters com seus respectivos grupos de recursos
-                result = subprocess.run(
-                    ["az", "aks", "list", "--query", "[].{name:name, resourceGroup:resourceGroup}", "-o", "json"],
-                    capture_output=True,
-                    text=True
-                )
-                
-                if result.returncode != 0:
-                    console.print(f"❌ Erro ao listar clusters AKS: {result.stderr}", style="bold red")
-                    return
-                
-                clusters = json.loads(result.stdout)
-                
-                if not clusters:
-                    console.print("❌ Não foram encontrados clusters AKS nesta assinatura.", style="bold red")
-                    return
-                
-                # Obtém o cluster atual da configuração (se existir)
-                current_cluster = None
-                current_resource_group = None
-                
-                if 'azure_cluster' in config_data:
-                    current_cluster = config_data['azure_cluster']
-                    current_resource_group = config_data.get('azure_resource_group')
-                
-                # Monta opções para o usuário selecionar
-                cluster_choices = []
-                for c in clusters:
-                    cluster_info = f"{c['name']} (Grupo: {c['resourceGroup']})"
-                    # Marca o cluster atual
-                    if c['name'] == current_cluster and c['resourceGroup'] == current_resource_group:
-                        cluster_choices.append(f"{cluster_info} (atual)")
-                    else:
-                        cluster_choices.append(cluster_info)
-                
-                questions = [
-                    inquirer.List('cluster',
-                                message="Selecione o cluster AKS",
-                                choices=cluster_choices,
-                                )
-                ]
-                answers = inquirer.prompt(questions)
-                
-                if not answers:
-                    return
-                
-                # Extrai o nome do cluster e o grupo de recursos da seleção
-                selected_option = answers['cluster'].replace(" (atual)", "")
-                
-                # Tenta encontrar o cluster e grupo de recursos correspondentes
-                found = False
-                for c in clusters:
-                    if selected_option == f"{c['name']} (Grupo: {c['resourceGroup']})":
-                        selected_cluster = c['name']
-                        selected_resource_group = c['resourceGroup']
-                        found = True
-                        break
-                
-                # Se não encontrou na forma exata, tenta extrair o nome e grupo diretamente
-                if not found:
-                    # Tenta extrair o nome e o grupo da string selecionada
-                    # Formato esperado: "nome-do-cluster (Grupo: nome-do-grupo)"
-                    import re
-                    match = re.match(r"([^(]+)\s*\(Grupo:\s*([^)]+)\)", selected_option)
-                    if match:
-                        selected_cluster = match.group(1).strip()
-                        selected_resource_group = match.group(2).strip()
-                    else:
-                        console.print("❌ Não foi possível extrair o nome do cluster e grupo de recursos da seleção.", style="bold red")
-                        return
-                
-            except Exception as e:
-                console.print(f"❌ Erro ao listar clusters Azure: {str(e)}", style="bold red")
+            selected = select_aks_cluster(config_data, subscription)
+            if not selected:
                 return
+            selected_cluster, selected_resource_group, selected_subscription = selected
         
         # Verifica se temos o grupo de recursos quando o cluster está definido
         if selected_cluster and not selected_resource_group:
@@ -1462,16 +1423,13 @@ def init_azure(cluster=None, resource_group=None, subscription=None):
         )
         
         if success:
-            # Atualiza a configuração
-            config_data['azure_cluster'] = selected_cluster
-            config_data['azure_resource_group'] = selected_resource_group
-            config_data['azure_subscription'] = selected_subscription
-            config_data['current_type'] = 'azure'
-            
-            # Salva a configuração
-            os.makedirs(os.path.expanduser('~/.jera'), exist_ok=True)
-            with open(config_path, 'w') as f:
-                yaml.dump(config_data, f)
+            # Atualiza a configuração e guarda o cluster para as próximas trocas
+            with update_config() as config_data:
+                config_data['azure_cluster'] = selected_cluster
+                config_data['azure_resource_group'] = selected_resource_group
+                config_data['azure_subscription'] = selected_subscription
+                config_data['current_type'] = 'azure'
+                remember_cluster(config_data, 'azure', name=selected_cluster, resource_group=selected_resource_group, subscription=selected_subscription)
             
             console.print(f"✅ Cluster alterado para: [bold green]{selected_cluster}[/] (Azure AKS)", style="bold")
             console.print(f"📊 Detalhes:", style="bold blue")
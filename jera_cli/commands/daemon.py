@@ -0,0 +1,76 @@
+import click
+from ..utils.console import LazyConsole
+from ..utils import daemon as jera_daemon
+
+console = LazyConsole()
+
+@click.group()
+def daemon():
+    """Gerencia o daemon que mantém clientes da API aquecidos em segundo plano.
+
+    Com o daemon rodando, comandos de leitura (pods, nodes, urls, pvcs...)
+    são executados por ele: sem o custo de iniciar o Python, ler o kubeconfig,
+    obter o token e abrir a conexão TLS a cada chamada. Sem o daemon os
+    comandos continuam funcionando normalmente.
+
+    Exemplos:
+        $ jeracli daemon start     # Inicia o daemon
+        $ jeracli daemon status    # Mostra o estado do daemon
+        $ jeracli daemon stop      # Encerra o daemon
+    """
+
+@daemon.command()
+@click.option('--cache-ttl', type=float, default=jera_daemon.DEFAULT_CACHE_TTL, show_default=True,
+              help='Segundos que as respostas da API ficam em cache no daemon (0 desliga)')
+def start(cache_ttl):
+    """Inicia o daemon em segundo plano."""
+    try:
+        status = jera_daemon.get_status()
+        if status:
+            console.print(f"ℹ️ Daemon já está rodando (PID {status['pid']}).", style="bold yellow")
+            return
+
+        console.print("\n🔄 Iniciando o daemon...", style="yellow")
+        status = jera_daemon.start(cache_ttl)
+        if not status:
+            console.print(f"❌ O daemon não respondeu. Veja o log em {jera_daemon.LOG_PATH}", style="bold red")
+            return
+
+        console.print(f"✅ Daemon rodando (PID {status['pid']}) em [bold]{jera_daemon.SOCKET_PATH}[/]", style="bold green")
+    except Exception as e:
+        console.print(f"❌ Erro ao iniciar o daemon: {str(e)}", style="bold red")
+
+@daemon.command()
+def stop():
+    """Encerra o daemon."""
+    try:
+        if jera_daemon.stop():
+            console.print("✅ Daemon encerrado.", style="bold green")
+        else:
+            console.print("ℹ️ Daemon não está rodando.", style="bold yellow")
+    except Exception as e:
+        console.print(f"❌ Erro ao encerrar o daemon: {str(e)}", style="bold red")
+
+@daemon.command()
+def status():
+    """Mostra o estado do daemon."""
+    try:
+        status = jera_daemon.get_status()
+        if not status:
+            console.print("ℹ️ Daemon não está rodando. Use 'jeracli daemon start'.", style="bold yellow")
+            return
+
+        console.print(f"\n✅ Daemon rodando (PID {status['pid']})", style="bold green")
+        console.print(f"Ativo há: [bold]{int(status['uptime'])}s[/]")
+        console.print(f"Comandos atendidos: [bold]{status['requests']}[/]")
+        console.print(f"Requisições à API: [bold]{status['api_requests']}[/] ({status['api_seconds']:.2f}s)")
+        console.print(f"Cache das respostas: [bold]{status['cache_ttl']}s[/]")
+        console.print(f"Contextos aquecidos: [bold cyan]{', '.join(status['contexts']) or 'nenhum'}[/]")
+    except Exception as e:
+        console.print(f"❌ Erro ao obter o estado do daemon: {str(e)}", style="bold red")
+
+@daemon.command(hidden=True)
+@click.option('--cache-ttl', type=float, default=jera_daemon.DEFAULT_CACHE_TTL)
+def run(cache_ttl):
+    """Roda o daemon em primeiro plano (usado por `daemon start`)."""
+    jera_daemon.serve(cache_ttl)
@@ -1,24 +1,275 @@
 import click
-from rich.console import Console
-from rich.table import Table
-import subprocess
+from ..utils.console import LazyConsole
 from ..utils.common import load_namespace
+from ..utils import gateway
+from ..utils.multicluster import cluster_options, resolve_contexts, fetch_per_cluster
+from ..utils.output import output_option, resolve_output, write_records, report_error
+from ..utils.defaults import URLS_PROBE_TIMEOUT, CERTS_CACHE_TTL
 
-console = Console()
+console = LazyConsole()
+
+def probe_columns(url, result, repeat):
+    """Células de status e tempos do urls --probe para uma URL"""
+    empty = ["-"] * (5 if repeat > 1 else 4)
+    if result is None:
+        return empty
+    if not result['statuses']:
+        return [f"[red]❌ {result['error']}[/]"] + empty[1:]
+
+    codes = []
+    for status in result['statuses']:
+        style = "green" if status < 400 else "yellow" if status < 500 else "red"
+        codes.append(f"[{style}]{status}[/]")
+    status_cell = ", ".join(codes)
+    if result['errors']:
+        status_cell += f" [red]({result['errors']} falha(s))[/]"
+
+    def ms(value):
+        return f"{value:.0f} ms" if value is not None else "-"
+
+    cells = [status_cell, ms(result['tls']), ms(result['ttfb']), ms(result['total'])]
+    if repeat > 1:
+        cells.append(ms(result['total_p95']))
+    return cells
+
+def backend_ref(backend):
+    """Retorna (Service, porta) do backend de um path ou defaultBackend do Ingress, ou None"""
+    if not backend:
+        return None
+    if 'service' in backend:
+        port = backend['service'].get('port') or {}
+        return backend['service']['name'], port.get('number') or port.get('name')
+    if 'serviceName' in backend:
+        # Formato antigo (extensions/v1beta1)
+        return backend['serviceName'], backend.get('servicePort')
+    return None
+
+def index_backends(services, slices):
+    """Indexa os Services por (namespace, nome) e as EndpointSlices pelo Service dono.
+
+    Com os índices, checar todas as rotas custa uma consulta em dict por
+    rota, em vez de percorrer Services e EndpointSlices a cada uma.
+    """
+    index = {'services': {}, 'slices': {}, 'checked': {}}
+    for service in services:
+        index['services'][(service['metadata']['namespace'], service['metadata']['name'])] = service
+    for endpoint_slice in slices:
+        metadata = endpoint_slice['metadata']
+        service_name = (metadata.get('labels') or {}).get('kubernetes.io/service-name')
+        if service_name:
+            index['slices'].setdefault((metadata['namespace'], service_name), []).append(endpoint_slice)
+    return index
+
+def check_backend(index, namespace, ref):
+    """Conta os endpoints prontos do backend de uma rota.
+
+    Retorna {'ready', 'not_ready', 'problem', 'external'}; `problem` explica
+    por que a rota está morta (ou é None) e `external` marca Services
+    ExternalName, que não têm endpoints. O resultado é reaproveitado entre
+    rotas que apontam para o mesmo Service e porta.
+    """
+    key = (namespace, ref)
+    if key in index['checked']:
+        return index['checked'][key]
+
+    health = {'ready': 0, 'not_ready': 0, 'problem': None, 'external': False}
+    index['checked'][key] = health
+    service_name, port = ref
+    service = index['services'].get((namespace, service_name))
+    if service is None:
+        health['problem'] = "Service inexistente"
+        return health
+
+    spec = service.get('spec') or {}
+    if spec.get('type') == 'ExternalName':
+        health['external'] = True
+        return health
+
+    # A porta do Ingress pode ser o número ou o nome da porta do Service
+    by_number = isinstance(port, int) or (isinstance(port, str) and port.isdigit())
+    service_port = next((
+        p for p in spec.get('ports') or []
+        if (int(port) == p.get('port') if by_number else port == p.get('name'))
+    ), None)
+    if service_port is None:
+        health['problem'] = f"porta {port} inexistente"
+        return health
+
+    # Nas EndpointSlices a porta aparece com o nome da porta do Service ("" se não tiver)
+    port_name = service_port.get('name') or ''
+    seen = set()
+    for endpoint_slice in index['slices'].get((namespace, service_name), []):
+        slice_ports = endpoint_slice.get('ports')
+        if slice_ports is not None and not any((p.get('name') or '') == port_name for p in slice_ports):
+            continue
+        for endpoint in endpoint_slice.get('endpoints') or []:
+            # O mesmo pod pode aparecer em duas slices durante uma troca
+            target = endpoint.get('targetRef') or {}
+            endpoint_key = target.get('uid') or tuple(endpoint.get('addresses') or [])
+            if endpoint_key in seen:
+                continue
+            seen.add(endpoint_key)
+            # ready ausente significa estado desconhecido, tratado como pronto
+            if (endpoint.get('conditions') or {}).get('ready') is False:
+                health['not_ready'] += 1
+            else:
+                health['ready'] += 1
+
+    if not health['ready']:
+        health['problem'] = "nenhum endpoint pronto"
+    return health
+
+def backend_columns(health):
+    """Células de endpoints e situação do urls --backends para uma rota"""
+    if health is None:
+        return ["-", "-"]
+    if health['external']:
+        return ["-", "[dim]ExternalName[/]"]
+
+    total = health['ready'] + health['not_ready']
+    style = "red" if not health['ready'] else "yellow" if health['not_ready'] else "green"
+    endpoints = f"[{style}]{health['ready']}/{total}[/]"
+    if health['problem']:
+        return [endpoints if total else "-", f"[red]❌ {health['problem']}[/]"]
+    return [endpoints, "[green]✅ ok[/]"]
+
+def ingress_hosts(groups, show_cluster):
+    """Retorna {host: [ingress]} com os hosts únicos de spec.rules e spec.tls (sem curingas)"""
+    hosts = {}
+    for cluster, (ingresses, _) in groups:
+        for ingress in ingresses:
+            spec = ingress.get('spec') or {}
+            names = [rule.get('host') for rule in spec.get('rules') or []]
+            names += [host for tls in spec.get('tls') or [] for host in tls.get('hosts') or []]
+            source = f"{ingress['metadata']['namespace']}/{ingress['metadata']['name']}"
+            if show_cluster:
+                source = f"{cluster}:{source}"
+            for host in names:
+                if host and '*' not in host and source not in hosts.setdefault(host, []):
+                    hosts[host].append(source)
+    return hosts
+
+def show_certificates(hosts, cache_ttl, output='table'):
+    """Mostra os certificados TLS dos hosts, do que vence primeiro ao que vence por último"""
+    from rich.table import Table
+    import datetime
+    from ..utils.certs import check_certificates, days_left
+
+    if output == 'table':
+        console.print(f"\n🔄 Verificando certificados de {len(hosts)} host(s)...", style="yellow")
+    results = check_certificates(list(hosts), cache_ttl=cache_ttl)
+
+    def rank(host):
+        days = days_left(results[host])
+        return (days is None, days if days is not None else 0, host)
+
+    if output != 'table':
+        def records():
+            for host in sorted(hosts, key=rank):
+                result = results[host]
+                days = days_left(result)
+                not_after = result.get('not_after')
+                yield {
+                    'host': host,
+                    'days_left': round(days, 1) if days is not None else None,
+                    'not_after': datetime.datetime.fromtimestamp(not_after, datetime.timezone.utc).isoformat() if not_after is not None else None,
+                    'issuer': result.get('issuer'),
+                    'subject': result.get('subject'),
+                    'sans': result.get('sans') or [],
+                    'ingresses': hosts[host],
+                    'verify_error': result.get('verify_error'),
+                    'error': result.get('error'),
+                }
+        write_records(records(), output)
+        return
+
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Host", style="bold white")
+    table.add_column("Dias", justify="right")
+    table.add_column("Vence em")
+    table.add_column("Emissor", style="dim")
+    table.add_column("SANs", style="dim")
+    table.add_column("Ingress", style="cyan")
+    table.add_column("Situação")
+
+    expiring = 0
+    for host in sorted(hosts, key=rank):
+        result = results[host]
+        sources = hosts[host]
+        ingress_cell = sources[0] + (f" (+{len(sources) - 1})" if len(sources) > 1 else "")
+        if result.get('error'):
+            table.add_row(host, "-", "-", "-", "-", ingress_cell, f"[red]❌ {result['error']}[/]")
+            continue
+
+        days = days_left(result)
+        style = "bold red" if days < 14 else "yellow" if days < 30 else "green"
+        expiring += days < 30
+        sans = result['sans'][:3]
+        sans_cell = ", ".join(sans) + (f" (+{len(result['sans']) - 3})" if len(result['sans']) > 3 else "")
+        if days < 0:
+            situation = "[bold red]❌ vencido[/]"
+        elif result.get('verify_error'):
+            situation = f"[yellow]⚠️ {result['verify_error']}[/]"
+        else:
+            situation = "[green]✅ ok[/]"
+        table.add_row(
+            host,
+            f"[{style}]{days:.0f}[/]",
+            datetime.datetime.fromtimestamp(result['not_after']).strftime('%d/%m/%Y'),
+            result.get('issuer') or "-",
+            sans_cell or "-",
+            ingress_cell,
+            situation,
+        )
+
+    console.print("\n🔒 Certificados TLS dos Ingress (vencimento mais próximo primeiro):", style="bold blue")
+    console.print(table)
+    if expiring:
+        console.print(f"\n⚠️ {expiring} certificado(s) vencido(s) ou vencendo em até 30 dias.", style="bold yellow")
 
 @click.command()
 @click.option('--namespace', '-n', help='Filtra por namespace específico')
-def urls(namespace=None):
+@click.option('--probe', is_flag=True, help='Faz requisições HTTP em paralelo para cada URL (status, TLS, TTFB e latência)')
+@click.option('--repeat', type=click.IntRange(min=1), default=1, show_default=True, help='Rodadas de requisições do --probe (mostra p50/p95)')
+@click.option('--timeout', type=float, default=URLS_PROBE_TIMEOUT, show_default=True, help='Tempo máximo (segundos) de cada requisição do --probe')
+@click.option('--insecure', is_flag=True, help='Não valida o certificado TLS no --probe')
+@click.option('--backends', is_flag=True, help='Mostra os endpoints prontos de cada backend e marca as rotas sem backend')
+@click.option('--certs', is_flag=True, help='Verifica os certificados TLS de todos os hosts e ordena pelo vencimento')
+@click.option('--cache-ttl', type=click.IntRange(min=0), default=CERTS_CACHE_TTL, show_default=True,
+              help='Tempo (segundos) em que o certificado de cada host fica em cache no --certs (0 desliga)')
+@cluster_options
+@output_option
+def urls(namespace=None, probe=False, repeat=1, timeout=URLS_PROBE_TIMEOUT, insecure=False, backends=False,
+         certs=False, cache_ttl=CERTS_CACHE_TTL, clusters=None, all_clusters=False, output=None):
     """Mostra as URLs dos Ingress disponíveis no cluster.
     
     Por padrão, mostra Ingress de todos os namespaces.
     Use a opção --namespace para filtrar por um namespace específico.
+    Com --clusters (ou --all-clusters) junta os Ingress de vários clusters.
+    Com --probe verifica todas as URLs ao mesmo tempo e mostra o status HTTP,
+    o tempo do handshake TLS, o TTFB e a latência total; --repeat N faz N
+    rodadas sobre as mesmas conexões e mostra a mediana e o p95.
+    Com --backends segue cada rota até o Service e as EndpointSlices e
+    marca as rotas mortas: Service inexistente, porta inexistente no
+    Service ou nenhum endpoint pronto.
+    Com --certs faz o handshake TLS com todos os hosts (spec.rules e
+    spec.tls) ao mesmo tempo e lista emissor, SANs e vencimento, do que
+    vence primeiro ao que vence por último.
     
     Exemplos:
         $ jcli urls                    # Mostra URLs de todos os namespaces
         $ jcli urls -n production      # Mostra URLs apenas do namespace production
+        $ jcli urls --all-clusters     # Mostra URLs de todos os clusters do kubeconfig
+        $ jcli urls --probe --repeat 5 # Verifica as URLs e mostra p50/p95
+        $ jcli urls --backends         # Mostra os endpoints prontos de cada rota
+        $ jcli urls --certs            # Mostra o vencimento dos certificados
+        $ jcli urls --backends -o csv  # Uma rota por linha, em CSV
     """
+    from rich.table import Table
+
+    output = resolve_output(output)
     try:
+        
         # Se foi especificado um namespace, usa ele
         # Caso contrário, mostra todos os namespaces por padrão
         selected_namespace = namespace
@@ -30,147 +281,147 @@ def urls(namespace=None):
             configured_namespace = load_namespace()
             selected_namespace = configured_namespace
 
-        # Executa o comando kubectl para obter os Ingresses
-        cmd = ["kubectl", "get", "ingress"]
+        contexts = resolve_contexts(clusters, all_clusters)
         
-        if selected_namespace:
-            cmd.extend(["-n", selected_namespace])
-        else:
-            cmd.append("--all-namespaces")
-            
-        cmd.extend(["-o", "json"])
+        def fetch(context):
+            if not backends or certs:
+                return gateway.list_ingresses(selected_namespace, context=context), None
+            # Ingresses, Services e EndpointSlices numa só ida, unidos por índices
+            ingresses, services, slices = gateway.fetch_concurrently(
+                lambda: gateway.list_ingresses(selected_namespace, context=context),
+                lambda: gateway.list_services(selected_namespace, context=context),
+                lambda: gateway.list_endpoint_slices(selected_namespace, context=context),
+            )
+            return ingresses, index_backends(services, slices)
         
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=False
-        )
-        
-        if result.returncode != 0:
-            # Tenta verificar se o erro é por falta de recursos Ingress
-            if "No resources found" in result.stderr:
-                if show_all:
-                    console.print("ℹ️ Nenhum Ingress encontrado em nenhum namespace.", style="bold yellow")
-                else:
-                    console.print(f"ℹ️ Nenhum Ingress encontrado no namespace '{selected_namespace}'.", style="bold yellow")
-                return
-            else:
-                console.print(f"❌ Erro ao obter Ingresses: {result.stderr}", style="bold red")
-                return
-        
-        import json
-        ingresses = json.loads(result.stdout)
+        groups = fetch_per_cluster(contexts, fetch)
+        show_cluster = contexts is not None
         
         # Se não houver Ingresses
-        if not ingresses.get('items'):
+        if not any(ingresses for _, (ingresses, _) in groups) and output == 'table':
             if show_all:
                 console.print("ℹ️ Nenhum Ingress encontrado em nenhum namespace.", style="bold yellow")
             else:
                 console.print(f"ℹ️ Nenhum Ingress encontrado no namespace '{selected_namespace}'.", style="bold yellow")
             return
         
+        if certs:
+            show_certificates(ingress_hosts(groups, show_cluster), cache_ttl, output)
+            return
+        
         # Cria a tabela para exibir os resultados
         table = Table(show_header=True, header_style="bold magenta")
         
+        if show_cluster:
+            table.add_column("Cluster", style="blue")
         if show_all:
             table.add_column("Namespace", style="blue")
         
         table.add_column("Nome", style="cyan")
         table.add_column("URL", style="bold white")
         table.add_column("Backend", style="dim")
+        if backends:
+            table.add_column("Endpoints", justify="right")
+            table.add_column("Situação")
+        if probe:
+            table.add_column("Status")
+            table.add_column("TLS", justify="right")
+            if repeat > 1:
+                table.add_column("TTFB p50", justify="right")
+                table.add_column("Total p50", justify="right")
+                table.add_column("Total p95", justify="right")
+            else:
+                table.add_column("TTFB", justify="right")
+                table.add_column("Total", justify="right")
+        
+        # Linhas da tabela (a URL é sempre a penúltima coluna) com a situação do backend
+        # e o registro da rota para o -o json/ndjson/csv
+        rows = []
         
-        # Processa cada Ingress
-        for ingress in ingresses['items']:
-            ingress_name = ingress['metadata']['name']
-            ingress_namespace = ingress['metadata']['namespace']
+        # Processa cada Ingress de cada cluster
+        for cluster, (ingresses, index) in groups:
+            prefix = [cluster] if show_cluster else []
             
-            # Pula ingresses de outros namespaces se um foi especificado
-            if selected_namespace and ingress_namespace != selected_namespace:
-                continue
+            for ingress in ingresses:
+                ingress_name = ingress['metadata']['name']
+                ingress_namespace = ingress['metadata']['namespace']
             
-            # Obtém o endereço do LoadBalancer (não usado na tabela, mas mantido para reuso no futuro)
-            lb_address = "N/A"
-            if 'status' in ingress and 'loadBalancer' in ingress['status']:
-                ingress_lb = ingress['status']['loadBalancer']
-                if 'ingress' in ingress_lb and ingress_lb['ingress']:
-                    lb_entry = ingress_lb['ingress'][0]
-                    lb_address = lb_entry.get('hostname') or lb_entry.get('ip') or "N/A"
+                # Pula ingresses de outros namespaces se um foi especificado
+                if selected_namespace and ingress_namespace != selected_namespace:
+                    continue
+                
+                start = (*prefix, ingress_namespace, ingress_name) if show_all else (*prefix, ingress_name)
+                
+                def add_row(url, backend, label="N/A"):
+                    ref = backend_ref(backend)
+                    if ref:
+                        label = f"{ref[0]}:{ref[1] if ref[1] is not None else 'N/A'}"
+                    health = check_backend(index, ingress_namespace, ref) if index is not None and ref else None
+                    record = {'cluster': cluster} if show_cluster else {}
+                    record.update(namespace=ingress_namespace, name=ingress_name, url=url, backend=label)
+                    rows.append((start + (url, label), health, record))
             
-            # Extrai as regras
-            if 'rules' not in ingress['spec']:
-                # Ingress sem regras, possivelmente apenas com TLS ou defaultBackend
-                if show_all:
-                    table.add_row(
-                        ingress_namespace,
-                        ingress_name,
-                        "N/A",
-                        "DefaultBackend"
-                    )
-                else:
-                    table.add_row(
-                        ingress_name,
-                        "N/A",
-                        "DefaultBackend"
-                    )
-                continue
+                # Extrai as regras
+                if 'rules' not in ingress['spec']:
+                    # Ingress sem regras, possivelmente apenas com TLS ou defaultBackend
+                    add_row("N/A", ingress['spec'].get('defaultBackend'), "DefaultBackend")
+                    continue
             
-            # Processa todas as regras e caminhos
-            for rule in ingress['spec']['rules']:
-                host = rule.get('host', '*')
+                # Processa todas as regras e caminhos
+                for rule in ingress['spec']['rules']:
+                    host = rule.get('host', '*')
                 
-                if 'http' not in rule:
-                    # Regra sem HTTP paths (possivelmente apenas DNS)
-                    if show_all:
-                        table.add_row(
-                            ingress_namespace,
-                            ingress_name,
-                            f"https://{host}",
-                            "N/A"
-                        )
-                    else:
-                        table.add_row(
-                            ingress_name,
-                            f"https://{host}",
-                            "N/A"
-                        )
-                    continue
+                    if 'http' not in rule:
+                        # Regra sem HTTP paths (possivelmente apenas DNS)
+                        add_row(f"https://{host}", None)
+                        continue
                 
-                # Processa os caminhos HTTP
-                for path in rule['http']['paths']:
-                    path_value = path.get('path', '/')
-                    
-                    # Determina o serviço backend
-                    if 'backend' in path:
-                        # Formato antigo (v1)
-                        if 'serviceName' in path['backend']:
-                            backend = f"{path['backend']['serviceName']}:{path['backend'].get('servicePort', 'N/A')}"
-                        # Formato novo (v1beta1 ou v1)
-                        elif 'service' in path['backend']:
-                            service_info = path['backend']['service']
-                            backend = f"{service_info['name']}:{service_info.get('port', {}).get('number', 'N/A')}"
-                        else:
-                            backend = "N/A"
-                    else:
-                        backend = "N/A"
-                    
-                    # Gera a URL completa
-                    url = f"https://{host}{path_value}"
-                    
-                    # Adiciona à tabela
-                    if show_all:
-                        table.add_row(
-                            ingress_namespace,
-                            ingress_name,
-                            url,
-                            backend
+                    # Processa os caminhos HTTP
+                    for path in rule['http']['paths']:
+                        add_row(f"https://{host}{path.get('path', '/')}", path.get('backend'))
+        
+        results = {}
+        if probe:
+            from ..utils.http_probe import probe_urls
+            
+            # Hosts curinga (*.exemplo.com) não têm um endereço para verificar
+            targets = [cells[-2] for cells, _, _ in rows if cells[-2].startswith('https://') and '*' not in cells[-2]]
+            if output == 'table':
+                console.print(f"\n🔄 Verificando {len(set(targets))} URL(s) (timeout de {timeout:g}s)...", style="yellow")
+            results = probe_urls(targets, repeat=repeat, timeout=timeout, verify=not insecure)
+        
+        if output != 'table':
+            def records():
+                for _, health, record in rows:
+                    if backends:
+                        record.update(
+                            ready_endpoints=health['ready'] if health else None,
+                            not_ready_endpoints=health['not_ready'] if health else None,
+                            external=health['external'] if health else None,
+                            problem=health['problem'] if health else None,
                         )
-                    else:
-                        table.add_row(
-                            ingress_name,
-                            url,
-                            backend
+                    if probe:
+                        result = results.get(record['url']) or {}
+                        record.update(
+                            statuses=result.get('statuses') or [],
+                            errors=result.get('errors'),
+                            error=result.get('error'),
+                            tls_ms=result.get('tls'),
+                            ttfb_ms=result.get('ttfb'),
+                            total_ms=result.get('total'),
+                            total_p95_ms=result.get('total_p95'),
                         )
+                    yield record
+            write_records(records(), output)
+            return
+        
+        for cells, health, _ in rows:
+            row = cells
+            if backends:
+                row = row + tuple(backend_columns(health))
+            if probe:
+                row = row + tuple(probe_columns(cells[-2], results.get(cells[-2]), repeat))
+            table.add_row(*row)
         
         # Título da tabela
         if show_all:
@@ -181,166 +432,134 @@ def urls(namespace=None):
         # Imprime a tabela
         console.print(table)
         
+        dead = [health for _, health, _ in rows if health and health['problem']]
+        if dead:
+            console.print(f"\n⚠️ {len(dead)} rota(s) sem backend pronto.", style="bold yellow")
+        
         # Nota adicional sobre HTTPS
         console.print("\nNota: As URLs são mostradas com http:// por padrão. Se o Ingress estiver configurado para HTTPS, substitua por https://.", style="dim")
             
     except Exception as e:
-        console.print(f"❌ Erro ao listar URLs de Ingress: {str(e)}", style="bold red")
+        report_error(output, f"Erro ao listar URLs de Ingress: {str(e)}")
+
+def index_load_balancers(ingresses, services):
+    """Indexa Ingresses e Services do tipo LoadBalancer pelo endereço externo.
+
+    Retorna {endereço: [backend]}; cada backend é um dict com kind,
+    namespace, name, ports e hosts (só nos Ingress), o mesmo registro
+    usado na saída NDJSON.
+    """
+    index = {}
+
+    def add(resource, backend):
+        status = (resource.get('status') or {}).get('loadBalancer') or {}
+        for entry in status.get('ingress') or []:
+            address = entry.get('hostname') or entry.get('ip')
+            if address and backend not in index.setdefault(address, []):
+                index[address].append(backend)
+
+    for ingress in ingresses:
+        spec = ingress.get('spec') or {}
+        add(ingress, {
+            'kind': 'Ingress',
+            'namespace': ingress['metadata']['namespace'],
+            'name': ingress['metadata']['name'],
+            'ports': ['80/TCP', '443/TCP'] if spec.get('tls') else ['80/TCP'],
+            'hosts': sorted({rule['host'] for rule in spec.get('rules') or [] if rule.get('host')}),
+        })
+
+    for service in services:
+        spec = service.get('spec') or {}
+        if spec.get('type') != 'LoadBalancer':
+            continue
+        add(service, {
+            'kind': 'Service',
+            'namespace': service['metadata']['namespace'],
+            'name': service['metadata']['name'],
+            'ports': [f"{port['port']}/{port.get('protocol', 'TCP')}" for port in spec.get('ports') or []],
+            'hosts': [],
+        })
+
+    for backends in index.values():
+        backends.sort(key=lambda b: (b['namespace'], b['kind'], b['name']))
+    return index
 
 @click.command()
 @click.option('--namespace', '-n', help='Filtra por namespace específico')
-def loadbalancer(namespace=None):
-    """Mostra as URLs dos LoadBalancers dos Ingress no cluster.
+@output_option
+def loadbalancer(namespace=None, output=None):
+    """Mostra os LoadBalancers do cluster: Ingresses e Services do tipo LoadBalancer.
     
     Por padrão, mostra os LoadBalancers de todos os namespaces.
     Use a opção --namespace para filtrar por um namespace específico.
+    Cada endereço externo aparece uma vez, com todos os Ingresses e
+    Services (namespace, nome e portas) que estão atrás dele. Em json e
+    ndjson cada registro é um endereço com a lista de backends; em csv,
+    que não tem listas aninhadas, cada linha é um backend.
     
     Exemplos:
         $ jcli loadbalancer                # Mostra LoadBalancers de todos os namespaces
         $ jcli loadbalancer -n production  # Mostra LoadBalancers apenas do namespace production
+        $ jcli loadbalancer -o ndjson      # Um JSON por endereço, para ferramentas de inventário
     """
+    from rich.table import Table
+
+    output = resolve_output(output)
     try:
-        # Se foi especificado um namespace, usa ele
-        # Caso contrário, mostra todos os namespaces por padrão
         selected_namespace = namespace
         show_all = selected_namespace is None
-        
-        # Se não especificou namespace, usa o configurado apenas para mostrar no cabeçalho
-        configured_namespace = None
-        if not selected_namespace and not show_all:
-            configured_namespace = load_namespace()
-            selected_namespace = configured_namespace
 
-        # Executa o comando kubectl para obter os Ingresses
-        cmd = ["kubectl", "get", "ingress"]
-        
-        if selected_namespace:
-            cmd.extend(["-n", selected_namespace])
-        else:
-            cmd.append("--all-namespaces")
-            
-        cmd.extend(["-o", "json"])
-        
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=False
+        # Ingresses e Services numa só ida à API
+        ingresses, services = gateway.fetch_concurrently(
+            lambda: gateway.list_ingresses(selected_namespace),
+            lambda: gateway.list_services(selected_namespace),
         )
-        
-        if result.returncode != 0:
-            # Tenta verificar se o erro é por falta de recursos Ingress
-            if "No resources found" in result.stderr:
-                if show_all:
-                    console.print("ℹ️ Nenhum Ingress encontrado em nenhum namespace.", style="bold yellow")
-                else:
-                    console.print(f"ℹ️ Nenhum Ingress encontrado no namespace '{selected_namespace}'.", style="bold yellow")
-                return
-            else:
-                console.print(f"❌ Erro ao obter Ingresses: {result.stderr}", style="bold red")
-                return
+        index = index_load_balancers(ingresses, services)
 
-        import json
-        ingresses = json.loads(result.stdout)
-        
-        # Se não houver Ingresses
-        if not ingresses.get('items'):
-            if show_all:
-                console.print("ℹ️ Nenhum Ingress encontrado em nenhum namespace.", style="bold yellow")
-            else:
-                console.print(f"ℹ️ Nenhum Ingress encontrado no namespace '{selected_namespace}'.", style="bold yellow")
+        if output == 'csv':
+            write_records((
+                {'address': address, **backend}
+                for address in sorted(index)
+                for backend in index[address]
+            ), output, fields=['address', 'kind', 'namespace', 'name', 'ports', 'hosts'])
+            return
+        if output != 'table':
+            write_records(({'address': address, 'backends': index[address]} for address in sorted(index)), output)
             return
 
-        # Cria a tabela para exibir os resultados
-        table = Table(show_header=True, header_style="bold magenta")
-        
-        # Inverte a lógica: agora agrupa por URL e lista namespaces associados
-        if show_all:
-            table.add_column("LoadBalancer URL", style="bold green")
-            table.add_column("Namespaces", style="blue")
-        else:
-            table.add_column("LoadBalancer URL", style="bold green")
-        
-        # Dicionário para agrupar namespaces por URL de LoadBalancer
-        urls_to_namespaces = {}
-        
-        # Processa cada Ingress para encontrar os LoadBalancers
-        for ingress in ingresses['items']:
-            ingress_name = ingress['metadata']['name']
-            ingress_namespace = ingress['metadata']['namespace']
-            
-            # Pula ingresses de outros namespaces se um foi especificado
-            if selected_namespace and ingress_namespace != selected_namespace:
-                continue
-            
-            # Obtém o endereço do LoadBalancer
-            if 'status' in ingress and 'loadBalancer' in ingress['status']:
-                ingress_lb = ingress['status']['loadBalancer']
-                if 'ingress' in ingress_lb and ingress_lb['ingress']:
-                    lb_entry = ingress_lb['ingress'][0]
-                    
-                    # Verifica se temos um hostname ou IP
-                    hostname = lb_entry.get('hostname')
-                    ip = lb_entry.get('ip')
-                    
-                    # Formata a URL do LoadBalancer
-                    lb_address = None
-                    if hostname:
-                        lb_address = f"https://{hostname}"
-                    elif ip:
-                        lb_address = f"https://{ip}"
-                        
-                    if lb_address:
-                        # Agrupa namespaces por URL
-                        if lb_address not in urls_to_namespaces:
-                            urls_to_namespaces[lb_address] = set()
-                        
-                        # Se estamos mostrando todos os namespaces, adiciona este namespace à lista
-                        if show_all:
-                            urls_to_namespaces[lb_address].add(ingress_namespace)
-        
-        # Verifica se encontrou algum LoadBalancer
-        found_lb = len(urls_to_namespaces) > 0
-        
         # Se não encontrou nenhum LoadBalancer
-        if not found_lb:
+        if not index:
             if show_all:
                 console.print("ℹ️ Nenhum LoadBalancer encontrado em nenhum namespace.", style="bold yellow")
             else:
                 console.print(f"ℹ️ Nenhum LoadBalancer encontrado no namespace '{selected_namespace}'.", style="bold yellow")
             return
-        
+
+        table = Table(show_header=True, header_style="bold magenta")
+        # fold: o endereço quebra em várias linhas mas nunca é cortado
+        table.add_column("Endereço", style="bold green", overflow="fold")
+        table.add_column("Tipo")
+        if show_all:
+            table.add_column("Namespace", style="blue")
+        table.add_column("Nome", style="cyan")
+        table.add_column("Portas")
+        table.add_column("Hosts", style="dim")
+
+        for address in sorted(index):
+            backends = index[address]
+            for position, backend in enumerate(backends):
+                row = [address if position == 0 else "", backend['kind']]
+                if show_all:
+                    row.append(backend['namespace'])
+                row += [backend['name'], ", ".join(backend['ports']), ", ".join(backend['hosts'])]
+                table.add_row(*row, end_section=position == len(backends) - 1)
+
         # Título da tabela
         if show_all:
-            console.print("\n🌐 URLs dos LoadBalancers (agrupados):", style="bold blue")
+            console.print("\n🌐 LoadBalancers (todos os namespaces):", style="bold blue")
         else:
-            console.print(f"\n🌐 URLs dos LoadBalancers no namespace [bold green]{selected_namespace}[/]:", style="bold blue")
-        
-        # Imprime as URLs primeiro, sem tabela, para garantir que sejam exibidas por completo
-        for url, namespaces in urls_to_namespaces.items():
-            console.print(f"\n[bold green]{url}[/]")
-            
-            # Se estamos mostrando todos os namespaces, exibe a lista
-            if show_all:
-                # Agrupa namespaces em linhas de no máximo 80 caracteres
-                namespaces_list = sorted(namespaces)
-                line = "  [blue]Namespaces:[/] "
-                for ns in namespaces_list:
-                    # Se adicionar este namespace ultrapassar o limite, imprime a linha atual e começa nova linha
-                    if len(line + ns) > 100:
-                        console.print(line)
-                        line = "    "
-                    
-                    line += ns + ", "
-                
-                # Imprime a última linha, removendo a vírgula final
-                if line.endswith(", "):
-                    line = line[:-2]
-                if line.strip():
-                    console.print(line)
-        
-        # Nota adicional sobre HTTPS
-        console.print("\nNota: As URLs são mostradas com https:// por padrão.", style="dim")
+            console.print(f"\n🌐 LoadBalancers no namespace [bold green]{selected_namespace}[/]:", style="bold blue")
+        console.print(table)
         
     except Exception as e:
-        console.print(f"❌ Erro ao listar URLs dos LoadBalancers: {str(e)}", style="bold red") 
\ No newline at end of file
+        report_error(output, f"Erro ao listar URLs dos LoadBalancers: {str(e)}")
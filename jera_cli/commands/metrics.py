@@ -1,24 +1,64 @@
 import click
-from rich.console import Console
-from rich.table import Table
-import inquirer
-from kubernetes import client, config
-from ..utils.kubernetes import get_pod_metrics, parse_resource_value, format_age
+from ..utils.console import LazyConsole
+from ..utils.kubernetes import get_pod_metrics, parse_resource_value, sum_container_usage
+from ..utils import gateway
+from ..utils.completion import complete_namespaces
+from ..utils.multicluster import cluster_options, resolve_contexts, fetch_per_cluster
+from ..utils.output import output_option, resolve_output, write_records, report_error
 
-console = Console()
+console = LazyConsole()
+
+def pod_resources(pod):
+    """Soma requests e limits dos containers do pod: (cpu_req, cpu_lim, mem_req, mem_lim) em m e Mi"""
+    cpu_req = cpu_lim = mem_req = mem_lim = 0
+    for container in pod['spec']['containers']:
+        resources = container.get('resources') or {}
+        if resources.get('requests'):
+            cpu_req += parse_resource_value(resources['requests'].get('cpu', '0'), 'cpu')
+            mem_req += parse_resource_value(resources['requests'].get('memory', '0'), 'memory')
+        
+        if resources.get('limits'):
+            cpu_lim += parse_resource_value(resources['limits'].get('cpu', '0'), 'cpu')
+            mem_lim += parse_resource_value(resources['limits'].get('memory', '0'), 'memory')
+    return cpu_req, cpu_lim, mem_req, mem_lim
+
+def resource_record(pod, usage, cluster=None):
+    """Registro de um pod para o -o json/ndjson/csv: requests, limits e uso (m e Mi); limit 0 é sem limite"""
+    cpu_req, cpu_lim, mem_req, mem_lim = pod_resources(pod)
+    record = {'cluster': cluster} if cluster else {}
+    record.update(
+        namespace=pod['metadata']['namespace'],
+        pod=pod['metadata']['name'],
+        cpu_request_m=cpu_req,
+        cpu_limit_m=cpu_lim,
+        cpu_usage_m=int(usage['cpu'].replace('m', '')),
+        memory_request_mi=mem_req,
+        memory_limit_mi=mem_lim,
+        memory_usage_mi=int(usage['memory'].replace('Mi', '')),
+    )
+    return record
 
 @click.command(name="pod-metrics")
-@click.argument('namespace', required=False)
-def pod_metrics(namespace=None):
-    """Mostra uma análise detalhada dos recursos dos pods."""
+@click.argument('namespace', required=False, shell_complete=complete_namespaces)
+@cluster_options
+@output_option
+def pod_metrics(namespace=None, clusters=None, all_clusters=False, output=None):
+    """Mostra uma análise detalhada dos recursos dos pods.
+
+    Com --clusters (ou --all-clusters) analisa o mesmo namespace em vários
+    clusters ao mesmo tempo.
+    """
+    from rich.table import Table
+    import inquirer
+
+    output = resolve_output(output)
     try:
-        config.load_kube_config()
-        v1 = client.CoreV1Api()
-        
         if not namespace:
-            available_namespaces = [ns.metadata.name for ns in v1.list_namespace().items]
+            available_namespaces = [ns['metadata']['name'] for ns in gateway.list_namespaces()]
             
             if not available_namespaces:
+                if output != 'table':
+                    raise RuntimeError("nenhum namespace encontrado no cluster")
                 console.print("❌ Nenhum namespace encontrado no cluster.", style="bold red")
                 return
                 
@@ -37,16 +77,43 @@ def pod_metrics(namespace=None):
             else:
                 return
 
-        console.print(f"\n🔄 Analisando recursos no namespace [bold green]{namespace}[/]...", style="yellow")
+        if output == 'table':
+            console.print(f"\n🔄 Analisando recursos no namespace [bold green]{namespace}[/]...", style="yellow")
 
-        pods = v1.list_namespaced_pod(namespace)
-        metrics_dict = get_pod_metrics(namespace)
+        contexts = resolve_contexts(clusters, all_clusters)
+        groups = fetch_per_cluster(
+            contexts,
+            lambda context: (gateway.list_pods(namespace, context=context), get_pod_metrics(namespace, context=context))
+        )
+        show_cluster = contexts is not None
         
-        if not metrics_dict:
-            console.print("\n❌ Metrics Server não está disponível.", style="bold red")
+        if output != 'table':
+            # Fora da tabela o aviso vai para o stderr, longe dos registros; sem nenhum cluster com métricas é erro
+            for cluster, (_, metrics_dict) in groups:
+                if not metrics_dict and cluster:
+                    LazyConsole(stderr=True).print(f"⚠️ {cluster}: Metrics Server não está disponível", style="bold yellow")
+            if not any(metrics_dict for _, (_, metrics_dict) in groups):
+                raise RuntimeError("Metrics Server não está disponível")
+        else:
+            for cluster, (_, metrics_dict) in groups:
+                if not metrics_dict:
+                    console.print(f"\n❌ Metrics Server não está disponível{f' em {cluster}' if cluster else ''}.", style="bold red")
+        groups = [(cluster, data) for cluster, data in groups if data[1]]
+        if not groups:
+            return
+        
+        if output != 'table':
+            write_records((
+                resource_record(pod, metrics_dict[pod['metadata']['name']], cluster)
+                for cluster, (pods, metrics_dict) in groups
+                for pod in pods
+                if pod['metadata']['name'] in metrics_dict
+            ), output)
             return
         
         table = Table(title=f"📊 Análise de Recursos - Namespace: [bold green]{namespace}[/]", show_header=True)
+        if show_cluster:
+            table.add_column("Cluster", style="blue")
         table.add_column("Pod", style="cyan")
         table.add_column("CPU Req", justify="right", style="blue")
         table.add_column("CPU Lim", justify="right", style="blue")
@@ -60,55 +127,49 @@ def pod_metrics(namespace=None):
         total_cpu_req = total_cpu_lim = total_cpu_use = 0
         total_mem_req = total_mem_lim = total_mem_use = 0
         
-        for pod in pods.items:
-            pod_name = pod.metadata.name
-            if pod_name not in metrics_dict:
-                continue
+        for cluster, (pods, metrics_dict) in groups:
+            if show_cluster:
+                table.add_section()
+            for pod in pods:
+                pod_name = pod['metadata']['name']
+                if pod_name not in metrics_dict:
+                    continue
                 
-            cpu_req = cpu_lim = mem_req = mem_lim = 0
-            
-            for container in pod.spec.containers:
-                if container.resources:
-                    if container.resources.requests:
-                        cpu_req += parse_resource_value(container.resources.requests.get('cpu', '0'), 'cpu')
-                        mem_req += parse_resource_value(container.resources.requests.get('memory', '0'), 'memory')
-                    
-                    if container.resources.limits:
-                        cpu_lim += parse_resource_value(container.resources.limits.get('cpu', '0'), 'cpu')
-                        mem_lim += parse_resource_value(container.resources.limits.get('memory', '0'), 'memory')
+                cpu_req, cpu_lim, mem_req, mem_lim = pod_resources(pod)
             
-            cpu_use = int(metrics_dict[pod_name]['cpu'].replace('m', ''))
-            mem_use = int(metrics_dict[pod_name]['memory'].replace('Mi', ''))
+                cpu_use = int(metrics_dict[pod_name]['cpu'].replace('m', ''))
+                mem_use = int(metrics_dict[pod_name]['memory'].replace('Mi', ''))
             
-            total_cpu_req += cpu_req
-            total_cpu_lim += cpu_lim
-            total_cpu_use += cpu_use
-            total_mem_req += mem_req
-            total_mem_lim += mem_lim
-            total_mem_use += mem_use
+                total_cpu_req += cpu_req
+                total_cpu_lim += cpu_lim
+                total_cpu_use += cpu_use
+                total_mem_req += mem_req
+                total_mem_lim += mem_lim
+                total_mem_use += mem_use
             
-            cpu_percent = f"{(cpu_use / cpu_req * 100):.1f}%" if cpu_req > 0 else "N/A"
+                cpu_percent = f"{(cpu_use / cpu_req * 100):.1f}%" if cpu_req > 0 else "N/A"
             
-            if mem_req > 0:
-                mem_percent = f"{(mem_use / mem_req * 100):.1f}%"
-                if mem_use > mem_req:
-                    mem_percent = f"[bold red]⚠️ {(mem_use / mem_req * 100):.1f}%[/]"
-            elif mem_use > 0:
-                mem_percent = "⚠️ Sem request"
-            else:
-                mem_percent = "N/A"
+                if mem_req > 0:
+                    mem_percent = f"{(mem_use / mem_req * 100):.1f}%"
+                    if mem_use > mem_req:
+                        mem_percent = f"[bold red]⚠️ {(mem_use / mem_req * 100):.1f}%[/]"
+                elif mem_use > 0:
+                    mem_percent = "⚠️ Sem request"
+                else:
+                    mem_percent = "N/A"
             
-            table.add_row(
-                pod_name,
-                f"{cpu_req}m",
-                f"{cpu_lim}m" if cpu_lim > 0 else "∞",
-                f"{cpu_use}m",
-                cpu_percent,
-                f"{mem_req}Mi" if mem_req > 0 else "0Mi",
-                f"{mem_lim}Mi" if mem_lim > 0 else "∞",
-                f"{mem_use}Mi",
-                mem_percent
-            )
+                table.add_row(
+                    *([cluster] if show_cluster else []),
+                    pod_name,
+                    f"{cpu_req}m",
+                    f"{cpu_lim}m" if cpu_lim > 0 else "∞",
+                    f"{cpu_use}m",
+                    cpu_percent,
+                    f"{mem_req}Mi" if mem_req > 0 else "0Mi",
+                    f"{mem_lim}Mi" if mem_lim > 0 else "∞",
+                    f"{mem_use}Mi",
+                    mem_percent
+                )
 
         table.add_section()
         
@@ -129,6 +190,7 @@ def pod_metrics(namespace=None):
             total_mem_percent = "N/A"
         
         table.add_row(
+            *([""] if show_cluster else []),
             "[bold red]TOTAL[/]",
             f"[bold]{total_cpu_req}m[/]",
             f"[bold]{total_cpu_lim}m[/]" if total_cpu_lim > 0 else "∞",
@@ -169,19 +231,52 @@ def pod_metrics(namespace=None):
         console.print()
         
     except Exception as e:
-        console.print(f"❌ Erro ao analisar recursos: {str(e)}", style="bold red")
+        report_error(output, f"Erro ao analisar recursos: {str(e)}")
 
 @click.command(name="all-metrics")
-def all_metrics():
+@output_option
+def all_metrics(output=None):
     """Mostra uma análise detalhada dos recursos de todos os pods em todos os namespaces."""
+    from rich.table import Table
+
+    output = resolve_output(output)
     try:
-        config.load_kube_config()
-        v1 = client.CoreV1Api()
-        
-        console.print("\n🔄 Analisando recursos de todos os namespaces...", style="yellow")
+        if output == 'table':
+            console.print("\n🔄 Analisando recursos de todos os namespaces...", style="yellow")
 
-        namespaces = v1.list_namespace()
-        namespaces.items.sort(key=lambda x: x.metadata.name)
+        namespaces = sorted(ns['metadata']['name'] for ns in gateway.list_namespaces())
+        
+        # Pods e métricas de todos os namespaces em duas chamadas, agrupados por namespace
+        pods_by_namespace = {}
+        for pod in gateway.list_pods():
+            pods_by_namespace.setdefault(pod['metadata']['namespace'], []).append(pod)
+        
+        metrics_by_namespace = {}
+        try:
+            for item in gateway.list_pod_metrics():
+                cpu, memory = sum_container_usage(item)
+                metrics_by_namespace.setdefault(item['metadata']['namespace'], {})[item['metadata']['name']] = {
+                    'cpu': f"{cpu}m",
+                    'memory': f"{memory}Mi"
+                }
+        except Exception:
+            # 404 (sem Metrics Server), falta de permissão ou timeout: tratado como sem métricas, abaixo
+            metrics_by_namespace = {}
+        
+        if not metrics_by_namespace:
+            if output != 'table':
+                raise RuntimeError("Metrics Server não está disponível")
+            console.print("\n❌ Metrics Server não está disponível.", style="bold red")
+            return
+        
+        if output != 'table':
+            write_records((
+                resource_record(pod, metrics_by_namespace[namespace][pod['metadata']['name']])
+                for namespace in namespaces
+                for pod in pods_by_namespace.get(namespace, [])
+                if pod['metadata']['name'] in metrics_by_namespace.get(namespace, {})
+            ), output)
+            return
         
         table = Table(title="📊 Análise de Recursos - Todos os Namespaces", show_header=True)
         table.add_column("Namespace", style="magenta")
@@ -200,10 +295,9 @@ def all_metrics():
         
         is_first_namespace = True
         
-        for ns in namespaces.items:
-            namespace = ns.metadata.name
-            pods = v1.list_namespaced_pod(namespace)
-            metrics_dict = get_pod_metrics(namespace)
+        for namespace in namespaces:
+            pods = pods_by_namespace.get(namespace, [])
+            metrics_dict = metrics_by_namespace.get(namespace)
             
             if not metrics_dict:
                 continue
@@ -215,22 +309,12 @@ def all_metrics():
                 table.add_section()
             is_first_namespace = False
             
-            for pod in pods.items:
-                pod_name = pod.metadata.name
+            for pod in pods:
+                pod_name = pod['metadata']['name']
                 if pod_name not in metrics_dict:
                     continue
                     
-                cpu_req = cpu_lim = mem_req = mem_lim = 0
-                
-                for container in pod.spec.containers:
-                    if container.resources:
-                        if container.resources.requests:
-                            cpu_req += parse_resource_value(container.resources.requests.get('cpu', '0'), 'cpu')
-                            mem_req += parse_resource_value(container.resources.requests.get('memory', '0'), 'memory')
-                        
-                        if container.resources.limits:
-                            cpu_lim += parse_resource_value(container.resources.limits.get('cpu', '0'), 'cpu')
-                            mem_lim += parse_resource_value(container.resources.limits.get('memory', '0'), 'memory')
+                cpu_req, cpu_lim, mem_req, mem_lim = pod_resources(pod)
                 
                 cpu_use = int(metrics_dict[pod_name]['cpu'].replace('m', ''))
                 mem_use = int(metrics_dict[pod_name]['memory'].replace('Mi', ''))
@@ -358,4 +442,4 @@ def all_metrics():
         console.print()
         
     except Exception as e:
-        console.print(f"❌ Erro ao analisar recursos: {str(e)}", style="bold red") 
\ No newline at end of file
+        report_error(output, f"Erro ao analisar recursos: {str(e)}") 
\ No newline at end of file
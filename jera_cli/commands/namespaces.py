@@ -1,18 +1,172 @@
 import click
-from rich.console import Console
-from rich.table import Table
-from kubernetes import client, config
-import time
+from ..utils.console import LazyConsole
+from ..utils.kubernetes import format_age, parse_resource_value
+from ..utils import gateway
+from ..utils.output import output_option, resolve_output, write_records, report_error
 
-console = Console()
+console = LazyConsole()
+
+def pod_is_unhealthy(pod):
+    """Pod Pending/Failed/Unknown ou Running com algum container que não está pronto"""
+    status = pod.get('status') or {}
+    phase = status.get('phase')
+    if phase == 'Succeeded':
+        return False
+    if phase != 'Running':
+        return True
+    return not all(c.get('ready') for c in status.get('containerStatuses') or [])
+
+def pod_requests(pod):
+    """CPU (m) e memória (Mi) requisitadas pelo pod, considerando os init containers"""
+    spec = pod.get('spec') or {}
+    totals = []
+    for key in ('containers', 'initContainers'):
+        cpu = []
+        memory = []
+        for container in spec.get(key) or []:
+            requests = (container.get('resources') or {}).get('requests') or {}
+            cpu.append(parse_resource_value(requests.get('cpu', '0'), 'cpu'))
+            memory.append(parse_resource_value(requests.get('memory', '0'), 'memory'))
+        totals.append((cpu, memory))
+    (cpu, memory), (init_cpu, init_memory) = totals
+    # Os init containers rodam um de cada vez, antes dos demais
+    return max(sum(cpu), max(init_cpu, default=0)), max(sum(memory), max(init_memory, default=0))
+
+def summarize_namespaces(pods, pvcs, ingresses, services):
+    """Agrega, numa única passada por lista, os contadores e requests de cada namespace"""
+    summary = {}
+
+    def entry(namespace):
+        if namespace not in summary:
+            summary[namespace] = {'pods': 0, 'unhealthy': 0, 'pvcs': 0, 'ingresses': 0, 'services': 0, 'cpu': 0, 'memory': 0}
+        return summary[namespace]
+
+    for pod in pods:
+        counters = entry(pod['metadata']['namespace'])
+        counters['pods'] += 1
+        counters['unhealthy'] += pod_is_unhealthy(pod)
+        # Pods finalizados não reservam mais recursos no nó
+        if (pod.get('status') or {}).get('phase') not in ('Succeeded', 'Failed'):
+            cpu, memory = pod_requests(pod)
+            counters['cpu'] += cpu
+            counters['memory'] += memory
+    for kind, items in (('pvcs', pvcs), ('ingresses', ingresses), ('services', services)):
+        for item in items:
+            entry(item['metadata']['namespace'])[kind] += 1
+    return summary
+
+def show_summary(output='table'):
+    """Tabela de namespaces com contadores de recursos, pods com problema e requests"""
+    from rich.table import Table
+
+    # Uma lista de todos os namespaces por tipo, todas ao mesmo tempo; PVCs,
+    # Ingresses e Services só com metadados, que é o que a contagem precisa
+    namespaces, pods, pvcs, ingresses, services = gateway.fetch_concurrently(
+        gateway.list_namespaces,
+        gateway.list_pods,
+        lambda: gateway.list_metadata('/api/v1', 'persistentvolumeclaims'),
+        lambda: gateway.list_metadata('/apis/networking.k8s.io/v1', 'ingresses'),
+        lambda: gateway.list_metadata('/api/v1', 'services'),
+    )
+    summary = summarize_namespaces(pods, pvcs, ingresses, services)
+    empty = {'pods': 0, 'unhealthy': 0, 'pvcs': 0, 'ingresses': 0, 'services': 0, 'cpu': 0, 'memory': 0}
+
+    if output != 'table':
+        def records():
+            for ns in namespaces:
+                counters = summary.get(ns['metadata']['name'], empty)
+                yield {
+                    'name': ns['metadata']['name'],
+                    'status': ns['status'].get('phase'),
+                    'created': ns['metadata']['creationTimestamp'],
+                    'pods': counters['pods'],
+                    'unhealthy_pods': counters['unhealthy'],
+                    'pvcs': counters['pvcs'],
+                    'ingresses': counters['ingresses'],
+                    'services': counters['services'],
+                    'cpu_request_m': counters['cpu'],
+                    'memory_request_mi': counters['memory'],
+                }
+        write_records(records(), output)
+        return
+
+    table = Table(title="📋 Resumo dos Namespaces", show_header=True)
+    table.add_column("Nome", style="cyan")
+    table.add_column("Status", style="green")
+    table.add_column("Idade", style="yellow")
+    table.add_column("Pods", justify="right")
+    table.add_column("Com problema", justify="right")
+    table.add_column("PVCs", justify="right")
+    table.add_column("Ingresses", justify="right")
+    table.add_column("Services", justify="right")
+    table.add_column("CPU Req", justify="right")
+    table.add_column("Mem Req", justify="right")
+
+    totals = dict(empty)
+    for ns in sorted(namespaces, key=lambda n: n['metadata']['name']):
+        counters = summary.get(ns['metadata']['name'], empty)
+        for key in totals:
+            totals[key] += counters[key]
+        unhealthy = counters['unhealthy']
+        table.add_row(
+            ns['metadata']['name'],
+            ns['status'].get('phase'),
+            format_age(ns['metadata']['creationTimestamp']),
+            str(counters['pods']),
+            f"[bold red]{unhealthy}[/]" if unhealthy else "0",
+            str(counters['pvcs']),
+            str(counters['ingresses']),
+            str(counters['services']),
+            f"{counters['cpu']}m",
+            f"{int(counters['memory'])}Mi",
+        )
+
+    table.add_section()
+    table.add_row(
+        "TOTAL", "", "",
+        str(totals['pods']),
+        f"[bold red]{totals['unhealthy']}[/]" if totals['unhealthy'] else "0",
+        str(totals['pvcs']),
+        str(totals['ingresses']),
+        str(totals['services']),
+        f"{totals['cpu']}m",
+        f"{int(totals['memory'])}Mi",
+        style="bold",
+    )
+    console.print(table)
 
 @click.command()
-def namespaces():
-    """📋 Lista todos os namespaces disponíveis no cluster"""
+@click.option('--summary', is_flag=True, help='Mostra pods, pods com problema, PVCs, Ingresses, Services e requests de cada namespace')
+@output_option
+def namespaces(summary=False, output=None):
+    """📋 Lista todos os namespaces disponíveis no cluster
+    
+    Com --summary busca pods, PVCs, Ingresses e Services de todos os
+    namespaces de uma vez (uma requisição por tipo, ao mesmo tempo) e mostra
+    os contadores e os requests de CPU e memória por namespace.
+    
+    Exemplos:
+        $ jcli namespaces             # Lista os namespaces
+        $ jcli namespaces --summary   # Lista com contadores por namespace
+    """
+    from rich.table import Table
+
+    output = resolve_output(output)
     try:
-        # Carrega a configuração do kubernetes
-        config.load_kube_config()
-        v1 = client.CoreV1Api()
+        if summary:
+            show_summary(output)
+            return
+        
+        if output != 'table':
+            write_records((
+                {
+                    'name': ns['metadata']['name'],
+                    'status': ns['status'].get('phase'),
+                    'created': ns['metadata']['creationTimestamp'],
+                }
+                for ns in gateway.list_namespaces()
+            ), output)
+            return
         
         # Cria uma tabela rica para exibir os namespaces
         table = Table(title="📋 Namespaces Disponíveis", show_header=True)
@@ -21,29 +175,17 @@ def namespaces():
         table.add_column("Idade", style="yellow")
         
         # Lista os namespaces
-        namespaces = v1.list_namespace()
+        namespaces = gateway.list_namespaces()
         
-        for ns in namespaces.items:
-            # Calcula a idade do namespace
-            creation_time = ns.metadata.creation_timestamp
-            age = time.time() - creation_time.timestamp()
-            age_str = ""
-            
-            if age < 3600:  # menos de 1 hora
-                age_str = f"{int(age/60)}m"
-            elif age < 86400:  # menos de 1 dia
-                age_str = f"{int(age/3600)}h"
-            else:
-                age_str = f"{int(age/86400)}d"
-            
+        for ns in namespaces:
             table.add_row(
-                ns.metadata.name,
-                ns.status.phase,
-                age_str
+                ns['metadata']['name'],
+                ns['status'].get('phase'),
+                format_age(ns['metadata']['creationTimestamp'])
             )
         
         console.print(table)
         
     except Exception as e:
-        console.print(f"❌ Erro ao listar namespaces: {str(e)}", style="bold red")
+        report_error(output, f"Erro ao listar namespaces: {str(e)}")
         return 
\ No newline at end of file
@@ -1,25 +1,71 @@
 import click
-from rich.console import Console
-from rich.table import Table
-from kubernetes import client, config
-from ..utils.kubernetes import format_age, get_pod_metrics, parse_resource_value
-import inquirer
-import subprocess
+from ..utils.console import LazyConsole
+from ..utils.kubernetes import format_age, parse_resource_value, sum_container_usage
+from ..utils import gateway
+from ..utils.completion import complete_nodes
+from ..utils.multicluster import cluster_options, resolve_contexts, fetch_per_cluster
+from ..utils.output import output_option, resolve_output, write_records, report_error
 
-console = Console()
+console = LazyConsole()
+
+def node_status(node):
+    """Ready ou NotReady, pela condição Ready do nó"""
+    for condition in node['status'].get('conditions') or []:
+        if condition['type'] == "Ready":
+            return "Ready" if condition['status'] == "True" else "NotReady"
+    return "Ready"
+
+def node_roles(node):
+    """Roles do nó pelos labels node-role.kubernetes.io/*"""
+    return [
+        label.split("/")[1]
+        for label in (node['metadata'].get('labels') or {})
+        if label.startswith("node-role.kubernetes.io/")
+    ]
+
+def node_records(groups, show_cluster):
+    """Gera um registro por nó para o -o json/ndjson/csv"""
+    for cluster, nodes in groups:
+        for node in nodes:
+            allocatable = node['status'].get('allocatable') or {}
+            record = {'cluster': cluster} if show_cluster else {}
+            record.update(
+                name=node['metadata']['name'],
+                status=node_status(node),
+                roles=node_roles(node) or ["worker"],
+                version=node['status']['nodeInfo']['kubeletVersion'],
+                cpu=allocatable.get('cpu', '0'),
+                memory_mi=parse_resource_value(allocatable.get('memory', '0'), 'memory'),
+                created=node['metadata']['creationTimestamp'],
+            )
+            yield record
 
 @click.command()
-def nodes():
-    """Lista todos os nós do cluster com informações detalhadas."""
+@cluster_options
+@output_option
+def nodes(clusters=None, all_clusters=False, output=None):
+    """Lista todos os nós do cluster com informações detalhadas.
+
+    Com --clusters (ou --all-clusters) lista os nós de vários clusters ao
+    mesmo tempo, com a coluna Cluster.
+    """
+    from rich.table import Table
+
+    output = resolve_output(output)
     try:
-        config.load_kube_config()
-        v1 = client.CoreV1Api()
+        if output == 'table':
+            console.print("\n🔄 Obtendo informações dos nós...", style="yellow")
         
-        console.print("\n🔄 Obtendo informações dos nós...", style="yellow")
+        groups = fetch_per_cluster(resolve_contexts(clusters, all_clusters), lambda context: gateway.list_nodes(context=context))
+        show_cluster = any(cluster for cluster, _ in groups)
         
-        nodes = v1.list_node()
+        if output != 'table':
+            write_records(node_records(groups, show_cluster), output)
+            return
         
         table = Table(title="📊 Nós do Cluster", show_header=True)
+        if show_cluster:
+            table.add_column("Cluster", style="blue")
         table.add_column("Nome", style="cyan")
         table.add_column("Status", justify="center")
         table.add_column("Roles", style="blue")
@@ -28,70 +74,61 @@ def nodes():
         table.add_column("Memória", justify="right")
         table.add_column("Idade", justify="right")
         
-        for node in nodes.items:
-            # Nome do nó
-            name = node.metadata.name
-            
-            # Status
-            status = "Ready"
-            status_style = "green"
-            for condition in node.status.conditions:
-                if condition.type == "Ready":
-                    if condition.status != "True":
-                        status = "NotReady"
-                        status_style = "red"
-                    break
-            
-            # Roles
-            roles = []
-            for label, value in node.metadata.labels.items():
-                if label.startswith("node-role.kubernetes.io/"):
-                    role = label.split("/")[1]
-                    roles.append(role)
-            roles = ", ".join(roles) if roles else "worker"
-            
-            # Versão do Kubernetes
-            version = node.status.node_info.kubelet_version
-            
-            # Recursos
-            allocatable_cpu = node.status.allocatable.get('cpu', '0')
-            allocatable_memory = node.status.allocatable.get('memory', '0')
-            
-            # Converte memória para GB
-            memory_bytes = parse_resource_value(allocatable_memory, 'memory')
-            memory_gb = round(memory_bytes / 1024, 1)  # Converte Mi para Gi
-            
-            # Idade
-            age = format_age(node.metadata.creation_timestamp)
-            
-            table.add_row(
-                name,
-                f"[{status_style}]{status}[/{status_style}]",
-                roles,
-                version,
-                f"{allocatable_cpu} cores",
-                f"{memory_gb}Gi",
-                age
-            )
+        for cluster, nodes in groups:
+            for node in nodes:
+                # Nome do nó
+                name = node['metadata']['name']
+            
+                # Status
+                status = node_status(node)
+                status_style = "green" if status == "Ready" else "red"
+            
+                # Roles
+                roles = ", ".join(node_roles(node)) or "worker"
+            
+                # Versão do Kubernetes
+                version = node['status']['nodeInfo']['kubeletVersion']
+            
+                # Recursos
+                allocatable_cpu = node['status']['allocatable'].get('cpu', '0')
+                allocatable_memory = node['status']['allocatable'].get('memory', '0')
+            
+                # Converte memória para GB
+                memory_bytes = parse_resource_value(allocatable_memory, 'memory')
+                memory_gb = round(memory_bytes / 1024, 1)  # Converte Mi para Gi
+            
+                # Idade
+                age = format_age(node['metadata']['creationTimestamp'])
+            
+                table.add_row(
+                    *([cluster] if show_cluster else []),
+                    name,
+                    f"[{status_style}]{status}[/{status_style}]",
+                    roles,
+                    version,
+                    f"{allocatable_cpu} cores",
+                    f"{memory_gb}Gi",
+                    age
+                )
         
         console.print()
         console.print(table)
         console.print()
         
     except Exception as e:
-        console.print(f"❌ Erro ao listar nós: {str(e)}", style="bold red")
+        report_error(output, f"Erro ao listar nós: {str(e)}")
 
 @click.command()
-@click.argument('node_name', required=False)
+@click.argument('node_name', required=False, shell_complete=complete_nodes)
 def describe_node(node_name=None):
     """Mostra informações detalhadas de um nó."""
+    from rich.table import Table
+    import inquirer
+
     try:
-        config.load_kube_config()
-        v1 = client.CoreV1Api()
-        
         # Lista todos os nós
-        nodes = v1.list_node()
-        node_names = [node.metadata.name for node in nodes.items]
+        nodes = gateway.list_nodes()
+        node_names = [node['metadata']['name'] for node in nodes]
         
         if not node_names:
             console.print("❌ Nenhum nó encontrado no cluster.", style="bold red")
@@ -120,7 +157,8 @@ def describe_node(node_name=None):
             return
         
         # Obtém os detalhes do nó
-        node = next(node for node in nodes.items if node.metadata.name == selected_node)
+        node = next(node for node in nodes if node['metadata']['name'] == selected_node)
+        node_info = node['status']['nodeInfo']
         
         # Cria a tabela de informações gerais
         table = Table(title=f"📊 Detalhes do Nó: [bold cyan]{selected_node}[/]", show_header=True)
@@ -128,39 +166,39 @@ def describe_node(node_name=None):
         table.add_column("Valor")
         
         # Informações básicas
-        table.add_row("Nome", node.metadata.name)
-        table.add_row("UID", str(node.metadata.uid))
-        table.add_row("Criado em", format_age(node.metadata.creation_timestamp))
+        table.add_row("Nome", node['metadata']['name'])
+        table.add_row("UID", str(node['metadata'].get('uid')))
+        table.add_row("Criado em", format_age(node['metadata']['creationTimestamp']))
         
         # Roles
         roles = []
-        for label, value in node.metadata.labels.items():
+        for label, value in (node['metadata'].get('labels') or {}).items():
             if label.startswith("node-role.kubernetes.io/"):
                 role = label.split("/")[1]
                 roles.append(role)
         table.add_row("Roles", ", ".join(roles) if roles else "worker")
         
         # Informações do sistema
-        table.add_row("Arquitetura", node.status.node_info.architecture)
-        table.add_row("Container Runtime", node.status.node_info.container_runtime_version)
-        table.add_row("Kernel Version", node.status.node_info.kernel_version)
-        table.add_row("OS Image", node.status.node_info.os_image)
-        table.add_row("Kubelet Version", node.status.node_info.kubelet_version)
+        table.add_row("Arquitetura", node_info.get('architecture'))
+        table.add_row("Container Runtime", node_info.get('containerRuntimeVersion'))
+        table.add_row("Kernel Version", node_info.get('kernelVersion'))
+        table.add_row("OS Image", node_info.get('osImage'))
+        table.add_row("Kubelet Version", node_info.get('kubeletVersion'))
         
         # Status
         status = "Ready"
         status_style = "green"
-        for condition in node.status.conditions:
-            if condition.type == "Ready":
-                if condition.status != "True":
+        for condition in node['status'].get('conditions') or []:
+            if condition['type'] == "Ready":
+                if condition['status'] != "True":
                     status = "NotReady"
                     status_style = "red"
                 break
         table.add_row("Status", f"[{status_style}]{status}[/{status_style}]")
         
         # Recursos
-        allocatable_cpu = node.status.allocatable.get('cpu', '0')
-        allocatable_memory = node.status.allocatable.get('memory', '0')
+        allocatable_cpu = node['status']['allocatable'].get('cpu', '0')
+        allocatable_memory = node['status']['allocatable'].get('memory', '0')
         memory_gb = round(parse_resource_value(allocatable_memory, 'memory') / 1024, 1)
         
         table.add_row("CPU Alocável", f"{allocatable_cpu} cores")
@@ -176,36 +214,37 @@ def describe_node(node_name=None):
         conditions_table.add_column("Última Transição", style="blue")
         conditions_table.add_column("Mensagem")
         
-        for condition in node.status.conditions:
-            status_style = "green" if condition.status == "True" else "red"
+        for condition in node['status'].get('conditions') or []:
+            status_style = "green" if condition['status'] == "True" else "red"
             conditions_table.add_row(
-                condition.type,
-                f"[{status_style}]{condition.status}[/{status_style}]",
-                format_age(condition.last_transition_time),
-                condition.message or "N/A"
+                condition['type'],
+                f"[{status_style}]{condition['status']}[/{status_style}]",
+                format_age(condition['lastTransitionTime']),
+                condition.get('message') or "N/A"
             )
         
         console.print()
         console.print(conditions_table)
         
         # Eventos relacionados ao nó
-        events = v1.list_event_for_all_namespaces(
+        events = gateway.list_events(
             field_selector=f'involvedObject.name={selected_node},involvedObject.kind=Node'
         )
         
-        if events.items:
+        if events:
             events_table = Table(title="\n📝 Eventos Recentes", show_header=True)
             events_table.add_column("Tipo", style="cyan")
             events_table.add_column("Razão", style="yellow")
             events_table.add_column("Idade", style="blue")
             events_table.add_column("Mensagem")
             
-            for event in events.items:
+            for event in events:
+                first_timestamp = event.get('firstTimestamp') or event.get('eventTime')
                 events_table.add_row(
-                    event.type,
-                    event.reason,
-                    format_age(event.first_timestamp),
-                    event.message
+                    event.get('type'),
+                    event.get('reason'),
+                    format_age(first_timestamp) if first_timestamp else "N/A",
+                    event.get('message')
                 )
             
             console.print()
@@ -218,175 +257,223 @@ def describe_node(node_name=None):
 
 # Mantém o comando "describe" para compatibilidade com versões anteriores
 @click.command(name="describe")
-@click.argument('node_name', required=False)
+@click.argument('node_name', required=False, shell_complete=complete_nodes)
 def describe(node_name=None):
     """Alias para describe-node. Mostra informações detalhadas de um nó."""
     return describe_node(node_name)
 
+def collect_node_metrics(node_name=None, context=None):
+    """Coleta o uso dos nós e os top 5 pods por CPU de cada nó; retorna (nós, métricas por nó)"""
+    # Obter lista de nós
+    nodes_list = gateway.list_nodes(context=context)
+    nodes_info = {}
+    
+    # Se um nó específico for fornecido, filtra a lista
+    if node_name:
+        nodes_list = [n for n in nodes_list if n['metadata']['name'] == node_name]
+        if not nodes_list:
+            return nodes_list, nodes_info
+    
+    allocatable_by_node = {n['metadata']['name']: n['status'].get('allocatable') or {} for n in nodes_list}
+    
+    # Obtém as métricas dos nós direto do metrics.k8s.io (o mesmo que `kubectl top nodes`)
+    try:
+        node_usage = gateway.list_node_metrics(context=context)
+    except Exception as e:
+        raise RuntimeError(f"Erro ao obter métricas de nós: {e}") from e
+    
+    for item in node_usage:
+        node_name = item['metadata']['name']
+        if node_name not in allocatable_by_node:
+            continue
+        
+        cpu_usage_m = parse_resource_value(item['usage'].get('cpu', '0'), 'cpu')
+        memory_usage_mi = int(parse_resource_value(item['usage'].get('memory', '0'), 'memory'))
+        allocatable_cpu_m = parse_resource_value(allocatable_by_node[node_name].get('cpu', '0'), 'cpu')
+        allocatable_memory_mi = parse_resource_value(allocatable_by_node[node_name].get('memory', '0'), 'memory')
+        
+        nodes_info[node_name] = {
+            'cpu_usage_m': cpu_usage_m,
+            'memory_usage_mi': memory_usage_mi,
+            'allocatable_cpu_m': allocatable_cpu_m,
+            'allocatable_memory_mi': allocatable_memory_mi,
+            'cpu_usage': f"{cpu_usage_m}m",
+            'cpu_percent': f"{int(cpu_usage_m / allocatable_cpu_m * 100)}%" if allocatable_cpu_m else "N/A",
+            'memory_usage': f"{memory_usage_mi}Mi",
+            'memory_percent': f"{int(memory_usage_mi / allocatable_memory_mi * 100)}%" if allocatable_memory_mi else "N/A",
+            'top_pods': [],
+            'total_cpu_request': 0,
+            'total_cpu_limit': 0,
+            'total_pods_cpu_usage': 0,
+            'total_pods_memory_usage': 0
+        }
+    
+    # Obtém todos os pods em todos os namespaces
+    all_pods = gateway.list_pods(context=context)
+    
+    # Métricas de todos os pods em uma única chamada, em vez de uma por namespace
+    pod_metrics_by_namespace = {}
+    try:
+        for item in gateway.list_pod_metrics(context=context):
+            cpu_value, memory_value = sum_container_usage(item)
+            pod_metrics_by_namespace[(item['metadata']['namespace'], item['metadata']['name'])] = {
+                'cpu': f"{cpu_value}m",
+                'cpu_value': cpu_value,
+                'memory': f"{memory_value}Mi",
+                'memory_value': memory_value
+            }
+    except Exception:
+        pass
+    
+    # Agrupa pods por nó
+    pods_by_node = {}
+    for pod in all_pods:
+        node = pod['spec'].get('nodeName')
+        if node not in pods_by_node:
+            pods_by_node[node] = []
+        pods_by_node[node].append(pod)
+    
+    # Para cada nó, obtém os top 5 pods que mais consomem CPU
+    for node_name, pods in pods_by_node.items():
+        if node_name not in nodes_info:
+            continue
+            
+        # Lista de todos os pods com seus namespaces
+        pods_with_namespaces = [(pod['metadata']['namespace'], pod['metadata']['name'], pod) for pod in pods]
+        
+        # Filtra apenas os pods que estão no nó atual e obtém limites de CPU
+        pod_metrics = []
+        total_cpu_request = 0
+        total_cpu_limit = 0
+        total_pods_cpu_usage = 0
+        total_pods_memory_usage = 0
+        
+        for ns_pod_obj in pods_with_namespaces:
+            ns, pod_name, pod_obj = ns_pod_obj
+            ns_pod = (ns, pod_name)
+            
+            if ns_pod in pod_metrics_by_namespace:
+                metrics = pod_metrics_by_namespace[ns_pod]
+                
+                # Obtém limites de CPU do pod
+                cpu_request = 0
+                cpu_limit = 0
+                
+                for container in pod_obj['spec'].get('containers') or []:
+                    resources = container.get('resources') or {}
+                    if 'cpu' in (resources.get('requests') or {}):
+                        cpu_request += parse_resource_value(resources['requests']['cpu'], 'cpu')
+                    if 'cpu' in (resources.get('limits') or {}):
+                        cpu_limit += parse_resource_value(resources['limits']['cpu'], 'cpu')
+                
+                # Acumula os totais
+                total_cpu_request += cpu_request
+                total_cpu_limit += cpu_limit
+                total_pods_cpu_usage += metrics['cpu_value']
+                total_pods_memory_usage += metrics['memory_value']
+                
+                pod_metrics.append({
+                    'namespace': ns,
+                    'name': pod_name,
+                    'cpu': metrics['cpu'],
+                    'cpu_value': metrics['cpu_value'],
+                    'cpu_request': cpu_request,
+                    'cpu_limit': cpu_limit,
+                    'memory': metrics['memory'],
+                    'memory_value': metrics['memory_value']
+                })
+        
+        # Ordena por uso de CPU (do maior para o menor)
+        pod_metrics.sort(key=lambda x: x['cpu_value'], reverse=True)
+        
+        # Armazena os top 5 pods e totais
+        nodes_info[node_name]['top_pods'] = pod_metrics[:5]
+        nodes_info[node_name]['total_cpu_request'] = total_cpu_request
+        nodes_info[node_name]['total_cpu_limit'] = total_cpu_limit
+        nodes_info[node_name]['total_pods_cpu_usage'] = total_pods_cpu_usage
+        nodes_info[node_name]['total_pods_memory_usage'] = total_pods_memory_usage
+    
+    return nodes_list, nodes_info
+
+def usage_percent(used, total):
+    """Uso em % do alocável, com uma casa decimal; None sem alocável"""
+    return round(used / total * 100, 1) if total else None
+
+def node_metric_records(groups, show_cluster):
+    """Gera um registro por nó do node-metrics para o -o json/ndjson/csv"""
+    for cluster, (nodes_list, nodes_info) in groups:
+        for node in nodes_list:
+            info = nodes_info.get(node['metadata']['name'])
+            if not info:
+                continue
+            record = {'cluster': cluster} if show_cluster else {}
+            record.update(
+                name=node['metadata']['name'],
+                status=node_status(node),
+                cpu_allocatable_m=info['allocatable_cpu_m'],
+                cpu_request_m=info['total_cpu_request'],
+                cpu_limit_m=info['total_cpu_limit'],
+                cpu_usage_m=info['cpu_usage_m'],
+                cpu_percent=usage_percent(info['cpu_usage_m'], info['allocatable_cpu_m']),
+                memory_allocatable_mi=info['allocatable_memory_mi'],
+                memory_usage_mi=info['memory_usage_mi'],
+                memory_percent=usage_percent(info['memory_usage_mi'], info['allocatable_memory_mi']),
+                pods_cpu_usage_m=info['total_pods_cpu_usage'],
+                pods_memory_usage_mi=info['total_pods_memory_usage'],
+                top_pods=[
+                    {
+                        'namespace': pod['namespace'],
+                        'name': pod['name'],
+                        'cpu_usage_m': pod['cpu_value'],
+                        'cpu_request_m': pod['cpu_request'],
+                        'cpu_limit_m': pod['cpu_limit'],
+                        'memory_usage_mi': pod['memory_value'],
+                    }
+                    for pod in info['top_pods']
+                ],
+            )
+            yield record
+
 @click.command(name="node-metrics")
-@click.argument('node_name', required=False)
-def node_metrics(node_name=None):
-    """Mostra métricas de utilização de CPU e memória por nó com os top 5 pods que mais consomem recursos."""
+@click.argument('node_name', required=False, shell_complete=complete_nodes)
+@cluster_options
+@output_option
+def node_metrics(node_name=None, clusters=None, all_clusters=False, output=None):
+    """Mostra métricas de utilização de CPU e memória por nó com os top 5 pods que mais consomem recursos.
+
+    Com --clusters (ou --all-clusters) consulta vários clusters ao mesmo tempo.
+
+    Exemplos:
+        $ jcli node-metrics
+        $ jcli node-metrics -o ndjson   # Um JSON por nó, com os top 5 pods
+    """
+    from rich.table import Table
+
+    output = resolve_output(output)
     try:
-        config.load_kube_config()
-        v1 = client.CoreV1Api()
-        
-        console.print("\n🔄 Obtendo informações de utilização dos nós...", style="yellow")
+        if output == 'table':
+            console.print("\n🔄 Obtendo informações de utilização dos nós...", style="yellow")
         
-        # Obter lista de nós
-        nodes_list = v1.list_node()
-        nodes_info = {}
-        
-        # Se um nó específico for fornecido, filtra a lista
-        if node_name:
-            nodes_list.items = [n for n in nodes_list.items if n.metadata.name == node_name]
-            if not nodes_list.items:
-                console.print(f"❌ Nó '{node_name}' não encontrado.", style="bold red")
-                return
+        groups = fetch_per_cluster(
+            resolve_contexts(clusters, all_clusters),
+            lambda context: collect_node_metrics(node_name, context)
+        )
+        show_cluster = any(cluster for cluster, _ in groups)
         
-        # Obtém informações de métricas dos nós
-        try:
-            result = subprocess.run(
-                ["kubectl", "top", "nodes"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            metrics_lines = result.stdout.strip().split('\n')[1:]  # Pula o cabeçalho
-            
-            for line in metrics_lines:
-                parts = line.split()
-                if len(parts) >= 5:
-                    node_name = parts[0]
-                    cpu_usage = parts[1]
-                    cpu_percent = parts[2]
-                    memory_usage = parts[3]
-                    memory_percent = parts[4]
-                    
-                    nodes_info[node_name] = {
-                        'cpu_usage': cpu_usage,
-                        'cpu_percent': cpu_percent,
-                        'memory_usage': memory_usage,
-                        'memory_percent': memory_percent,
-                        'top_pods': [],
-                        'total_cpu_request': 0,
-                        'total_cpu_limit': 0,
-                        'total_pods_cpu_usage': 0,
-                        'total_pods_memory_usage': 0
-                    }
-        except subprocess.CalledProcessError as e:
-            console.print(f"❌ Erro ao obter métricas de nós: {e}", style="bold red")
+        if node_name and not any(nodes_list for _, (nodes_list, _) in groups):
+            if output != 'table':
+                raise RuntimeError(f"nó '{node_name}' não encontrado")
+            console.print(f"❌ Nó '{node_name}' não encontrado.", style="bold red")
+            return
+
+        if output != 'table':
+            write_records(node_metric_records(groups, show_cluster), output)
             return
-        
-        # Obtém todos os pods em todos os namespaces
-        all_pods = v1.list_pod_for_all_namespaces(watch=False)
-        
-        # Agrupa pods por nó
-        pods_by_node = {}
-        for pod in all_pods.items:
-            node = pod.spec.node_name
-            if node not in pods_by_node:
-                pods_by_node[node] = []
-            pods_by_node[node].append(pod)
-        
-        # Para cada nó, obtém os top 5 pods que mais consomem CPU
-        for node_name, pods in pods_by_node.items():
-            if node_name not in nodes_info:
-                continue
-                
-            # Lista de todos os pods com seus namespaces
-            pods_with_namespaces = [(pod.metadata.namespace, pod.metadata.name, pod) for pod in pods]
-            
-            # Obter métricas de todos os pods por namespace
-            pod_metrics_by_namespace = {}
-            namespaces = set([ns for ns, _, _ in pods_with_namespaces])
-            
-            for namespace in namespaces:
-                try:
-                    result = subprocess.run(
-                        ["kubectl", "top", "pods", "-n", namespace],
-                        capture_output=True,
-                        text=True,
-                        check=True
-                    )
-                    metrics_lines = result.stdout.strip().split('\n')[1:]  # Pula o cabeçalho
-                    
-                    for line in metrics_lines:
-                        parts = line.split()
-                        if len(parts) >= 3:
-                            pod_name = parts[0]
-                            cpu = parts[1]
-                            memory = parts[2]
-                            
-                            # Remove o sufixo 'm' e converte para inteiro
-                            cpu_value = int(cpu.replace('m', ''))
-                            # Remove o sufixo 'Mi' e converte para inteiro
-                            memory_value = int(memory.replace('Mi', ''))
-                            
-                            pod_metrics_by_namespace[(namespace, pod_name)] = {
-                                'cpu': cpu,
-                                'cpu_value': cpu_value,
-                                'memory': memory,
-                                'memory_value': memory_value
-                            }
-                except subprocess.CalledProcessError:
-                    continue
-            
-            # Filtra apenas os pods que estão no nó atual e obtém limites de CPU
-            pod_metrics = []
-            total_cpu_request = 0
-            total_cpu_limit = 0
-            total_pods_cpu_usage = 0
-            total_pods_memory_usage = 0
-            
-            for ns_pod_obj in pods_with_namespaces:
-                ns, pod_name, pod_obj = ns_pod_obj
-                ns_pod = (ns, pod_name)
-                
-                if ns_pod in pod_metrics_by_namespace:
-                    metrics = pod_metrics_by_namespace[ns_pod]
-                    
-                    # Obtém limites de CPU do pod
-                    cpu_request = 0
-                    cpu_limit = 0
-                    
-                    if pod_obj.spec.containers:
-                        for container in pod_obj.spec.containers:
-                            if container.resources:
-                                if container.resources.requests and 'cpu' in container.resources.requests:
-                                    cpu_request += parse_resource_value(container.resources.requests.get('cpu', '0'), 'cpu')
-                                if container.resources.limits and 'cpu' in container.resources.limits:
-                                    cpu_limit += parse_resource_value(container.resources.limits.get('cpu', '0'), 'cpu')
-                    
-                    # Acumula os totais
-                    total_cpu_request += cpu_request
-                    total_cpu_limit += cpu_limit
-                    total_pods_cpu_usage += metrics['cpu_value']
-                    total_pods_memory_usage += metrics['memory_value']
-                    
-                    pod_metrics.append({
-                        'namespace': ns,
-                        'name': pod_name,
-                        'cpu': metrics['cpu'],
-                        'cpu_value': metrics['cpu_value'],
-                        'cpu_request': cpu_request,
-                        'cpu_limit': cpu_limit,
-                        'memory': metrics['memory'],
-                        'memory_value': metrics['memory_value']
-                    })
-            
-            # Ordena por uso de CPU (do maior para o menor)
-            pod_metrics.sort(key=lambda x: x['cpu_value'], reverse=True)
-            
-            # Armazena os top 5 pods e totais
-            nodes_info[node_name]['top_pods'] = pod_metrics[:5]
-            nodes_info[node_name]['total_cpu_request'] = total_cpu_request
-            nodes_info[node_name]['total_cpu_limit'] = total_cpu_limit
-            nodes_info[node_name]['total_pods_cpu_usage'] = total_pods_cpu_usage
-            nodes_info[node_name]['total_pods_memory_usage'] = total_pods_memory_usage
         
         # Cria tabela principal para nós
         nodes_table = Table(title="📊 Métricas de Utilização dos Nós", show_header=True)
+        if show_cluster:
+            nodes_table.add_column("Cluster", style="blue")
         nodes_table.add_column("Nome", style="cyan")
         nodes_table.add_column("Status", justify="center")
         nodes_table.add_column("CPU Alocável", justify="right", style="blue")
@@ -398,109 +485,112 @@ def node_metrics(node_name=None):
         nodes_table.add_column("Mem %", justify="right", style="yellow")
         
         # Exibe as informações para cada nó
-        for i, node in enumerate(nodes_list.items):
-            name = node.metadata.name
+        for cluster, (nodes_list, nodes_info) in groups:
+            for i, node in enumerate(nodes_list):
+                name = node['metadata']['name']
             
-            if name not in nodes_info:
-                continue
+                if name not in nodes_info:
+                    continue
             
-            node_metrics = nodes_info[name]
+                node_metrics = nodes_info[name]
             
-            # Obtém recursos alocáveis do nó
-            allocatable_cpu = node.status.allocatable.get('cpu', '0')
-            allocatable_memory = node.status.allocatable.get('memory', '0')
-            memory_gb = round(parse_resource_value(allocatable_memory, 'memory') / 1024, 1)
+                # Obtém recursos alocáveis do nó
+                allocatable_cpu = node['status']['allocatable'].get('cpu', '0')
+                allocatable_memory = node['status']['allocatable'].get('memory', '0')
+                memory_gb = round(parse_resource_value(allocatable_memory, 'memory') / 1024, 1)
             
-            # Status do nó
-            status = "Ready" if any(c.type == 'Ready' and c.status == 'True' for c in node.status.conditions) else "NotReady"
-            status_style = "green" if status == "Ready" else "red"
+                # Status do nó
+                status = "Ready" if any(c['type'] == 'Ready' and c['status'] == 'True' for c in node['status'].get('conditions') or []) else "NotReady"
+                status_style = "green" if status == "Ready" else "red"
             
-            # Prepara informações de CPU solicitada
-            total_cpu_request_m = node_metrics['total_cpu_request']
-            cpu_request_percent = "N/A"
+                # Prepara informações de CPU solicitada
+                total_cpu_request_m = node_metrics['total_cpu_request']
+                cpu_request_percent = "N/A"
             
-            # Converte allocatable_cpu para milicores para comparação
-            allocatable_cpu_m = parse_resource_value(allocatable_cpu, 'cpu')
+                # Converte allocatable_cpu para milicores para comparação
+                allocatable_cpu_m = parse_resource_value(allocatable_cpu, 'cpu')
             
-            if allocatable_cpu_m > 0:
-                request_percent = (total_cpu_request_m / allocatable_cpu_m) * 100
-                request_color = "yellow"
+                if allocatable_cpu_m > 0:
+                    request_percent = (total_cpu_request_m / allocatable_cpu_m) * 100
+                    request_color = "yellow"
                 
-                if request_percent > 100:
-                    request_color = "red bold"
+                    if request_percent > 100:
+                        request_color = "red bold"
                 
-                cpu_request_percent = f"({request_percent:.1f}%)"
-            
-            nodes_table.add_row(
-                name,
-                f"[{status_style}]{status}[/{status_style}]",
-                f"{allocatable_cpu} cores",
-                f"{total_cpu_request_m}m {cpu_request_percent}",
-                f"{node_metrics['cpu_usage']} ({node_metrics['total_pods_cpu_usage']}m)",
-                node_metrics['cpu_percent'],
-                f"{memory_gb}Gi",
-                f"{node_metrics['memory_usage']} ({node_metrics['total_pods_memory_usage']}Mi)",
-                node_metrics['memory_percent']
-            )
+                    cpu_request_percent = f"({request_percent:.1f}%)"
+            
+                nodes_table.add_row(
+                    *([cluster] if show_cluster else []),
+                    name,
+                    f"[{status_style}]{status}[/{status_style}]",
+                    f"{allocatable_cpu} cores",
+                    f"{total_cpu_request_m}m {cpu_request_percent}",
+                    f"{node_metrics['cpu_usage']} ({node_metrics['total_pods_cpu_usage']}m)",
+                    node_metrics['cpu_percent'],
+                    f"{memory_gb}Gi",
+                    f"{node_metrics['memory_usage']} ({node_metrics['total_pods_memory_usage']}Mi)",
+                    node_metrics['memory_percent']
+                )
         
         console.print()
         console.print(nodes_table)
         console.print()
         
         # Agora exibe os top 5 pods de cada nó
-        for node in nodes_list.items:
-            name = node.metadata.name
-            
-            if name not in nodes_info or not nodes_info[name]['top_pods']:
-                continue
+        for cluster, (nodes_list, nodes_info) in groups:
+            for node in nodes_list:
+                name = node['metadata']['name']
             
-            console.print(f"[bold cyan]Top 5 Pods por Consumo de CPU no Nó: {name}[/]")
-            
-            # Adiciona informações de CPU e memória total
-            node_metrics = nodes_info[name]
-            allocatable_cpu = node.status.allocatable.get('cpu', '0')
-            allocatable_cpu_m = parse_resource_value(allocatable_cpu, 'cpu')
-            
-            console.print(f"Total CPU: {node_metrics['total_pods_cpu_usage']}m de {allocatable_cpu_m}m alocáveis ({node_metrics['cpu_percent']})")
-            console.print(f"CPU Solicitado: {node_metrics['total_cpu_request']}m ({(node_metrics['total_cpu_request'] / allocatable_cpu_m * 100):.1f}% do total alocável)")
-            console.print(f"Total Memória: {node_metrics['total_pods_memory_usage']}Mi {node_metrics['memory_percent']}")
-            console.print()
-            
-            pods_table = Table(show_header=True)
-            pods_table.add_column("Rank", style="dim", width=4)
-            pods_table.add_column("Namespace", style="magenta")
-            pods_table.add_column("Pod", style="cyan")
-            pods_table.add_column("CPU Req", justify="right", style="blue")
-            pods_table.add_column("CPU Lim", justify="right", style="blue")
-            pods_table.add_column("CPU Uso", justify="right", style="green")
-            pods_table.add_column("CPU %", justify="right", style="yellow")
-            pods_table.add_column("Memória", justify="right", style="blue")
+                if name not in nodes_info or not nodes_info[name]['top_pods']:
+                    continue
             
-            for idx, pod in enumerate(nodes_info[name]['top_pods'], 1):
-                # Calcula porcentagem do uso em relação ao request
-                cpu_percent = "N/A"
-                if pod['cpu_request'] > 0:
-                    cpu_percent_value = (pod['cpu_value'] / pod['cpu_request']) * 100
-                    cpu_color = "yellow"
+                console.print(f"[bold cyan]Top 5 Pods por Consumo de CPU no Nó: {name}[/]" + (f" [blue]({cluster})[/]" if show_cluster else ""))
+            
+                # Adiciona informações de CPU e memória total
+                node_metrics = nodes_info[name]
+                allocatable_cpu = node['status']['allocatable'].get('cpu', '0')
+                allocatable_cpu_m = parse_resource_value(allocatable_cpu, 'cpu')
+            
+                console.print(f"Total CPU: {node_metrics['total_pods_cpu_usage']}m de {allocatable_cpu_m}m alocáveis ({node_metrics['cpu_percent']})")
+                console.print(f"CPU Solicitado: {node_metrics['total_cpu_request']}m ({(node_metrics['total_cpu_request'] / allocatable_cpu_m * 100):.1f}% do total alocável)")
+                console.print(f"Total Memória: {node_metrics['total_pods_memory_usage']}Mi {node_metrics['memory_percent']}")
+                console.print()
+            
+                pods_table = Table(show_header=True)
+                pods_table.add_column("Rank", style="dim", width=4)
+                pods_table.add_column("Namespace", style="magenta")
+                pods_table.add_column("Pod", style="cyan")
+                pods_table.add_column("CPU Req", justify="right", style="blue")
+                pods_table.add_column("CPU Lim", justify="right", style="blue")
+                pods_table.add_column("CPU Uso", justify="right", style="green")
+                pods_table.add_column("CPU %", justify="right", style="yellow")
+                pods_table.add_column("Memória", justify="right", style="blue")
+            
+                for idx, pod in enumerate(nodes_info[name]['top_pods'], 1):
+                    # Calcula porcentagem do uso em relação ao request
+                    cpu_percent = "N/A"
+                    if pod['cpu_request'] > 0:
+                        cpu_percent_value = (pod['cpu_value'] / pod['cpu_request']) * 100
+                        cpu_color = "yellow"
                     
-                    if cpu_percent_value > 100:
-                        cpu_color = "red bold"
+                        if cpu_percent_value > 100:
+                            cpu_color = "red bold"
                     
-                    cpu_percent = f"[{cpu_color}]{cpu_percent_value:.1f}%[/{cpu_color}]"
+                        cpu_percent = f"[{cpu_color}]{cpu_percent_value:.1f}%[/{cpu_color}]"
                 
-                pods_table.add_row(
-                    str(idx),
-                    pod['namespace'],
-                    pod['name'],
-                    f"{pod['cpu_request']}m" if pod['cpu_request'] > 0 else "0m",
-                    f"{pod['cpu_limit']}m" if pod['cpu_limit'] > 0 else "∞",
-                    pod['cpu'],
-                    cpu_percent,
-                    pod['memory']
-                )
+                    pods_table.add_row(
+                        str(idx),
+                        pod['namespace'],
+                        pod['name'],
+                        f"{pod['cpu_request']}m" if pod['cpu_request'] > 0 else "0m",
+                        f"{pod['cpu_limit']}m" if pod['cpu_limit'] > 0 else "∞",
+                        pod['cpu'],
+                        cpu_percent,
+                        pod['memory']
+                    )
             
-            console.print(pods_table)
-            console.print()
-        
+                console.print(pods_table)
+                console.print()
+
     except Exception as e:
-        console.print(f"❌ Erro ao obter métricas dos nós: {str(e)}", style="bold red") 
\ No newline at end of file
+        report_error(output, f"Erro ao obter métricas dos nós: {str(e)}") 
\ No newline at end of file
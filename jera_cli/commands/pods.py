@@ -1,21 +1,31 @@
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.live import Live
-import inquirer
-import yaml
-import os
-from kubernetes import client, config
-from ..utils.kubernetes import format_age, get_pod_metrics, parse_resource_value
+from ..utils.console import LazyConsole
+from ..utils.kubernetes import format_age
 from ..utils.common import load_namespace
+from ..utils.client import get_core_v1_api
+from ..utils.credentials import kubectl_env
+from ..utils import gateway
+from ..utils.completion import complete_pods, complete_namespaces
+from ..utils.multicluster import cluster_options, resolve_contexts, fetch_per_cluster
+from ..utils.output import output_option, resolve_output, write_records, report_error
 import subprocess
 import time
 
-console = Console()
+console = LazyConsole()
+
+def generate_pods_table(groups):
+    """Gera a tabela de pods para exibição.
+
+    `groups` é a lista [(cluster, pods)] de fetch_per_cluster; com mais de um
+    cluster consultado (--clusters) a tabela ganha a coluna Cluster.
+    """
+    from rich.table import Table
+
+    show_cluster = any(cluster for cluster, _ in groups)
 
-def generate_pods_table(v1, namespace):
-    """Gera a tabela de pods para exibição"""
     table = Table(show_header=True, header_style="bold magenta")
+    if show_cluster:
+        table.add_column("Cluster", style="blue")
     table.add_column("Nome do Pod")
     table.add_column("Ready", justify="center")
     table.add_column("Status")
@@ -23,89 +33,129 @@ def generate_pods_table(v1, namespace):
     table.add_column("Nó IP", style="green")
     table.add_column("Idade")
     
-    pods = v1.list_namespaced_pod(namespace)
-    
-    for pod in pods.items:
-        age_str = format_age(pod.metadata.creation_timestamp)
-        
-        # Calcula o status de Ready
-        ready_count = 0
-        container_count = len(pod.spec.containers)
-        for container_status in pod.status.container_statuses if pod.status.container_statuses else []:
-            if container_status.ready:
-                ready_count += 1
-        ready_status = f"{ready_count}/{container_count}"
-        
-        # Define o estilo baseado no status
-        ready_style = "green" if ready_count == container_count else "red"
-        
-        # Obtém o IP do nó
-        node_ip = "N/A"
-        if pod.status.host_ip:
-            node_ip = pod.status.host_ip
-        
-        table.add_row(
-            pod.metadata.name,
-            f"[{ready_style}]{ready_status}[/{ready_style}]",
-            pod.status.phase,
-            pod.status.pod_ip or "N/A",
-            node_ip,
-            age_str
-        )
+    for cluster, pods in groups:
+        for pod in pods:
+            metadata = pod['metadata']
+            status = pod.get('status') or {}
+            age_str = format_age(metadata['creationTimestamp'])
+            
+            # Calcula o status de Ready
+            ready_count = 0
+            container_count = len(pod['spec']['containers'])
+            for container_status in status.get('containerStatuses') or []:
+                if container_status.get('ready'):
+                    ready_count += 1
+            ready_status = f"{ready_count}/{container_count}"
+            
+            # Define o estilo baseado no status
+            ready_style = "green" if ready_count == container_count else "red"
+            
+            # Obtém o IP do nó
+            node_ip = "N/A"
+            if status.get('hostIP'):
+                node_ip = status['hostIP']
+            
+            table.add_row(
+                *([cluster] if show_cluster else []),
+                metadata['name'],
+                f"[{ready_style}]{ready_status}[/{ready_style}]",
+                status.get('phase'),
+                status.get('podIP') or "N/A",
+                node_ip,
+                age_str
+            )
     
     return table
 
+def pod_records(groups):
+    """Gera um registro por pod para o -o json/ndjson/csv, sem passar pela tabela"""
+    show_cluster = any(cluster for cluster, _ in groups)
+    for cluster, pods in groups:
+        for pod in pods:
+            metadata = pod['metadata']
+            status = pod.get('status') or {}
+            record = {'cluster': cluster} if show_cluster else {}
+            record.update(
+                namespace=metadata['namespace'],
+                name=metadata['name'],
+                ready=sum(1 for cs in status.get('containerStatuses') or [] if cs.get('ready')),
+                containers=len(pod['spec']['containers']),
+                status=status.get('phase'),
+                pod_ip=status.get('podIP'),
+                node=pod['spec'].get('nodeName'),
+                node_ip=status.get('hostIP'),
+                created=metadata['creationTimestamp'],
+            )
+            yield record
+
 @click.command()
 @click.option('-w', '--watch', is_flag=True, help='Atualiza a lista de pods em tempo real')
-def pods(watch):
-    """Lista todos os pods no namespace atual."""
+@cluster_options
+@output_option
+def pods(watch, clusters=None, all_clusters=False, output=None):
+    """Lista todos os pods no namespace atual.
+
+    Com --clusters (ou --all-clusters) consulta o mesmo namespace em vários
+    clusters ao mesmo tempo.
+
+    Exemplos:
+        $ jeracli pods
+        $ jeracli pods --clusters prod-br,prod-us
+        $ jeracli pods -o ndjson   # Um JSON por pod, para scripts
+    """
+    from rich.live import Live
+
+    output = resolve_output(output)
     try:
         namespace = load_namespace()
         if not namespace:
+            if output != 'table':
+                raise RuntimeError("namespace não definido. Use 'jeracli use <namespace>' primeiro.")
             console.print("❌ Namespace não definido. Use 'jeracli use <namespace>' primeiro.", style="bold red")
             return
 
-        config.load_kube_config()
-        v1 = client.CoreV1Api()
-        
+        contexts = resolve_contexts(clusters, all_clusters)
+
+        if output != 'table':
+            write_records(pod_records(fetch_per_cluster(contexts, lambda context: gateway.list_pods(namespace, context=context))), output)
+            return
+
+        def fetch_table():
+            return generate_pods_table(fetch_per_cluster(contexts, lambda context: gateway.list_pods(namespace, context=context)))
+
         if watch:
             console.print(f"\n🔄 Monitorando pods no namespace [bold green]{namespace}[/]...", style="yellow")
             console.print("Pressione Ctrl+C para parar\n", style="dim")
             
-            with Live(generate_pods_table(v1, namespace), refresh_per_second=1) as live:
+            with Live(fetch_table(), refresh_per_second=1) as live:
                 try:
                     while True:
-                        live.update(generate_pods_table(v1, namespace))
+                        live.update(fetch_table())
                         time.sleep(1)
                 except KeyboardInterrupt:
                     console.print("\n✅ Monitoramento finalizado!", style="bold green")
         else:
-            console.print(generate_pods_table(v1, namespace))
+            console.print(fetch_table())
             
     except Exception as e:
-        console.print(f"❌ Erro ao listar pods: {str(e)}", style="bold red")
+        report_error(output, f"Erro ao listar pods: {str(e)}")
 
 @click.command()
-@click.argument('pod_name', required=False)
+@click.argument('pod_name', required=False, shell_complete=complete_pods)
 @click.option('-f', '--follow', is_flag=True, help='Acompanha os logs em tempo real')
 @click.option('-n', '--tail', type=int, default=None, help='Número de linhas para mostrar (do final)')
 @click.option('-a', '--all', is_flag=True, help='Mostra logs de todos os pods')
 def logs(pod_name=None, follow=False, tail=None, all=False):
     """Visualiza logs de um pod no namespace atual."""
+    import inquirer
+
     try:
         namespace = load_namespace()
         if not namespace:
             console.print("❌ Namespace não definido. Use 'jeracli use <namespace>' primeiro.", style="bold red")
             return
 
-        result = subprocess.run(
-            ["kubectl", "get", "pods", "-n", namespace, "-o", "name"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        pod_names = [pod.replace('pod/', '') for pod in result.stdout.strip().split('\n') if pod]
+        pod_names = [pod['metadata']['name'] for pod in gateway.list_pods(namespace)]
         
         if not pod_names:
             console.print("❌ Nenhum pod encontrado no namespace atual.", style="bold red")
@@ -132,6 +182,7 @@ def logs(pod_name=None, follow=False, tail=None, all=False):
             return
             
         cmd = ["kubectl", "logs", "-n", namespace]
+        env = kubectl_env()
         
         if follow:
             cmd.append("-f")
@@ -144,31 +195,26 @@ def logs(pod_name=None, follow=False, tail=None, all=False):
             for pod in pod_names:
                 console.print(f"\n📋 Logs do pod [bold cyan]{pod}[/]:", style="yellow")
                 pod_cmd = cmd + [pod]
-                subprocess.run(pod_cmd)
+                subprocess.run(pod_cmd, env=env)
         else:
             cmd.append(selected_pod)
-            subprocess.run(cmd)
+            subprocess.run(cmd, env=env)
     except Exception as e:
         console.print(f"❌ Erro ao obter logs: {str(e)}", style="bold red")
 
 @click.command()
-@click.argument('pod_name', required=False)
+@click.argument('pod_name', required=False, shell_complete=complete_pods)
 def exec(pod_name=None):
     """Executa um shell interativo dentro de um pod."""
+    import inquirer
+
     try:
         namespace = load_namespace()
         if not namespace:
             console.print("❌ Namespace não definido. Use 'jeracli use <namespace>' primeiro.", style="bold red")
             return
 
-        result = subprocess.run(
-            ["kubectl", "get", "pods", "-n", namespace, "-o", "name"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        pod_names = [pod.replace('pod/', '') for pod in result.stdout.strip().split('\n') if pod]
+        pod_names = [pod['metadata']['name'] for pod in gateway.list_pods(namespace)]
         
         if not pod_names:
             console.print("❌ Nenhum pod encontrado no namespace atual.", style="bold red")
@@ -202,34 +248,52 @@ def exec(pod_name=None):
             "-it", selected_pod,
             "-n", namespace,
             "--", "/bin/sh"
-        ])
+        ], env=kubectl_env())
     except Exception as e:
         console.print(f"❌ Erro ao executar shell no pod: {str(e)}", style="bold red")
 
 @click.command(name="pods-by-node")
-@click.argument('namespace', required=False)
-def pods_by_node(namespace=None):
+@click.argument('namespace', required=False, shell_complete=complete_namespaces)
+@output_option
+def pods_by_node(namespace=None, output=None):
     """Lista todos os pods agrupados por nó, opcionalmente filtrados por namespace."""
+    from rich.table import Table
+
+    output = resolve_output(output)
     try:
-        config.load_kube_config()
-        v1 = client.CoreV1Api()
-        
+        if output != 'table':
+            # Um registro por pod, na ordem da API, sem agrupar antes de escrever
+            write_records((
+                {
+                    'node': pod['spec'].get('nodeName'),
+                    'namespace': pod['metadata']['namespace'],
+                    'name': pod['metadata']['name'],
+                    'status': (pod.get('status') or {}).get('phase'),
+                    'ready': sum(1 for cs in (pod.get('status') or {}).get('containerStatuses') or [] if cs.get('ready')),
+                    'containers': len(pod['spec']['containers']),
+                    'started': (pod.get('status') or {}).get('startTime'),
+                }
+                for pod in gateway.list_pods(namespace)
+            ), output)
+            return
+
         # Se nenhum namespace for especificado, busca todos os namespaces
         if not namespace:
             console.print("\n🔄 Listando pods em todos os namespaces por nó...", style="yellow")
-            pods = v1.list_pod_for_all_namespaces()
         else:
             console.print(f"\n🔄 Listando pods no namespace [bold green]{namespace}[/] por nó...", style="yellow")
-            pods = v1.list_namespaced_pod(namespace)
+        pods = gateway.list_pods(namespace)
         
         # Agrupa pods por nó
         nodes_pods = {}
-        for pod in pods.items:
-            node_name = pod.spec.node_name or "Não atribuído"
-            pod_namespace = pod.metadata.namespace
+        for pod in pods:
+            status = pod.get('status') or {}
+            container_statuses = status.get('containerStatuses')
+            node_name = pod['spec'].get('nodeName') or "Não atribuído"
+            pod_namespace = pod['metadata']['namespace']
             
             # Calcula o tempo de vida do pod
-            start_time = pod.status.start_time
+            start_time = status.get('startTime')
             if start_time:
                 lifetime = format_age(start_time)
             else:
@@ -239,10 +303,10 @@ def pods_by_node(namespace=None):
                 nodes_pods[node_name] = []
             
             nodes_pods[node_name].append({
-                'name': pod.metadata.name,
+                'name': pod['metadata']['name'],
                 'namespace': pod_namespace,
-                'status': pod.status.phase,
-                'ready': f"{sum(1 for status in pod.status.container_statuses if status.ready)}/{len(pod.spec.containers)}" if pod.status.container_statuses else "0/0",
+                'status': status.get('phase'),
+                'ready': f"{sum(1 for cs in container_statuses if cs.get('ready'))}/{len(pod['spec']['containers'])}" if container_statuses else "0/0",
                 'lifetime': lifetime
             })
         
@@ -280,10 +344,10 @@ def pods_by_node(namespace=None):
         console.print(f"Total de Pods: [bold green]{sum(len(pods) for pods in nodes_pods.values())}[/]")
         
     except Exception as e:
-        console.print(f"❌ Erro ao listar pods por nó: {str(e)}", style="bold red")
+        report_error(output, f"Erro ao listar pods por nó: {str(e)}")
 
 @click.command()
-@click.argument('pod_name', required=False)
+@click.argument('pod_name', required=False, shell_complete=complete_pods)
 def describe(pod_name=None):
     """Mostra informações detalhadas de um pod.
     
@@ -302,6 +366,9 @@ def describe(pod_name=None):
         $ jeracli describe              # Seleciona pod interativamente
         $ jeracli describe meu-pod      # Mostra detalhes do pod especificado
     """
+    from rich.table import Table
+    import inquirer
+
     try:
         # Carrega o namespace usando a função utilitária
         namespace = load_namespace()
@@ -309,15 +376,7 @@ def describe(pod_name=None):
             console.print("❌ Namespace não definido. Use 'jeracli use <namespace>' primeiro.", style="bold red")
             return
 
-        # Get list of pods using kubectl
-        result = subprocess.run(
-            ["kubectl", "get", "pods", "-n", namespace, "-o", "name"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        pod_names = [pod.replace('pod/', '') for pod in result.stdout.strip().split('\n') if pod]
+        pod_names = [pod['metadata']['name'] for pod in gateway.list_pods(namespace)]
         
         if not pod_names:
             console.print("❌ Nenhum pod encontrado no namespace atual.", style="bold red")
@@ -346,9 +405,11 @@ def describe(pod_name=None):
             return
             
         # Obtém os detalhes do pod
-        config.load_kube_config()
-        v1 = client.CoreV1Api()
-        pod = v1.read_namespaced_pod(selected_pod, namespace)
+        pod = gateway.get_pod(selected_pod, namespace)
+        metadata = pod['metadata']
+        spec = pod['spec']
+        status = pod.get('status') or {}
+        container_statuses = status.get('containerStatuses') or []
         
         # Cria tabelas para diferentes seções de informação
         console.print(f"\n🔍 Detalhes do Pod [bold cyan]{selected_pod}[/] no namespace [bold green]{namespace}[/]", style="bold")
@@ -358,33 +419,21 @@ def describe(pod_name=None):
         basic_table.add_column("Campo", style="cyan")
         basic_table.add_column("Valor", style="yellow")
         
-        basic_table.add_row("Nome", pod.metadata.name)
-        basic_table.add_row("Namespace", pod.metadata.namespace)
-        basic_table.add_row("Node", pod.spec.node_name or "N/A")
-        basic_table.add_row("IP do Pod", pod.status.pod_ip or "N/A")
-        basic_table.add_row("IP do Host", pod.status.host_ip or "N/A")
-        basic_table.add_row("QoS Class", pod.status.qos_class or "N/A")
-        
-        # Calcula a idade
-        creation_time = pod.metadata.creation_timestamp
-        age = time.time() - creation_time.timestamp()
-        if age < 60:  # menos de 1 minuto
-            age_str = f"{int(age)}s"
-        elif age < 3600:  # menos de 1 hora
-            age_str = f"{int(age/60)}m"
-        elif age < 86400:  # menos de 1 dia
-            age_str = f"{int(age/3600)}h"
-        else:
-            age_str = f"{int(age/86400)}d"
-        basic_table.add_row("Idade", age_str)
+        basic_table.add_row("Nome", metadata['name'])
+        basic_table.add_row("Namespace", metadata['namespace'])
+        basic_table.add_row("Node", spec.get('nodeName') or "N/A")
+        basic_table.add_row("IP do Pod", status.get('podIP') or "N/A")
+        basic_table.add_row("IP do Host", status.get('hostIP') or "N/A")
+        basic_table.add_row("QoS Class", status.get('qosClass') or "N/A")
+        basic_table.add_row("Idade", format_age(metadata['creationTimestamp']))
         
         console.print()
         console.print(basic_table)
         
         # Labels
-        if pod.metadata.labels:
+        if metadata.get('labels'):
             console.print("\n🏷️  [bold]Labels:[/]")
-            for key, value in pod.metadata.labels.items():
+            for key, value in metadata['labels'].items():
                 console.print(f"  • {key}: [yellow]{value}[/]")
         
         # Status e Condições
@@ -393,25 +442,14 @@ def describe(pod_name=None):
         status_table.add_column("Status", style="yellow")
         status_table.add_column("Última Transição", style="green")
         
-        for condition in pod.status.conditions:
+        for condition in status.get('conditions') or []:
             # Calcula o tempo desde a última transição
-            last_transition = condition.last_transition_time
-            if last_transition:
-                transition_age = time.time() - last_transition.timestamp()
-                if transition_age < 60:
-                    transition_str = f"{int(transition_age)}s"
-                elif transition_age < 3600:
-                    transition_str = f"{int(transition_age/60)}m"
-                elif transition_age < 86400:
-                    transition_str = f"{int(transition_age/3600)}h"
-                else:
-                    transition_str = f"{int(transition_age/86400)}d"
-            else:
-                transition_str = "N/A"
+            last_transition = condition.get('lastTransitionTime')
+            transition_str = format_age(last_transition) if last_transition else "N/A"
             
             status_table.add_row(
-                condition.type,
-                "✅" if condition.status == "True" else "❌",
+                condition['type'],
+                "✅" if condition['status'] == "True" else "❌",
                 transition_str
             )
         
@@ -419,68 +457,66 @@ def describe(pod_name=None):
         console.print(status_table)
         
         # Containers
-        for container in pod.spec.containers:
+        for container in spec['containers']:
             container_table = Table(
                 show_header=True,
                 header_style="bold magenta",
-                title=f"\n📦 Container: [bold cyan]{container.name}[/]"
+                title=f"\n📦 Container: [bold cyan]{container['name']}[/]"
             )
             container_table.add_column("Campo", style="cyan")
             container_table.add_column("Valor", style="yellow")
             
-            container_table.add_row("Image", container.image)
+            container_table.add_row("Image", container.get('image'))
             
             # Recursos
-            if container.resources:
-                if container.resources.requests:
-                    for resource, value in container.resources.requests.items():
-                        container_table.add_row(f"Requests {resource}", str(value))
-                if container.resources.limits:
-                    for resource, value in container.resources.limits.items():
-                        container_table.add_row(f"Limits {resource}", str(value))
+            resources = container.get('resources') or {}
+            for resource, value in (resources.get('requests') or {}).items():
+                container_table.add_row(f"Requests {resource}", str(value))
+            for resource, value in (resources.get('limits') or {}).items():
+                container_table.add_row(f"Limits {resource}", str(value))
             
             # Status do container
             container_status = next(
-                (status for status in pod.status.container_statuses
-                 if status.name == container.name),
+                (cs for cs in container_statuses if cs['name'] == container['name']),
                 None
             )
             if container_status:
                 container_table.add_row(
                     "Ready",
-                    "✅" if container_status.ready else "❌"
+                    "✅" if container_status.get('ready') else "❌"
                 )
                 container_table.add_row(
                     "Restart Count",
-                    str(container_status.restart_count)
+                    str(container_status.get('restartCount', 0))
                 )
                 
                 # Estado atual
-                state = container_status.state
-                if state.running:
+                state = container_status.get('state') or {}
+                if 'running' in state:
                     container_table.add_row("Estado", "🟢 Running")
-                elif state.waiting:
-                    container_table.add_row("Estado", f"⏳ Waiting ({state.waiting.reason})")
-                elif state.terminated:
-                    container_table.add_row("Estado", f"⭕ Terminated ({state.terminated.reason})")
+                elif 'waiting' in state:
+                    container_table.add_row("Estado", f"⏳ Waiting ({state['waiting'].get('reason')})")
+                elif 'terminated' in state:
+                    container_table.add_row("Estado", f"⭕ Terminated ({state['terminated'].get('reason')})")
             
             console.print()
             console.print(container_table)
         
         # Volumes
-        if pod.spec.volumes:
+        volumes = spec.get('volumes') or []
+        if volumes:
             volume_table = Table(show_header=True, header_style="bold magenta", title="\n💾 Volumes")
             volume_table.add_column("Nome", style="cyan")
             volume_table.add_column("Tipo", style="yellow")
             volume_table.add_column("Detalhes", style="green")
             
-            for volume in pod.spec.volumes:
-                volume_type = next((k for k in volume.to_dict().keys() if k != 'name'), "N/A")
-                volume_details = getattr(volume, volume_type, None)
+            for volume in volumes:
+                volume_type = next((k for k in volume.keys() if k != 'name'), "N/A")
+                volume_details = volume.get(volume_type)
                 details_str = str(volume_details) if volume_details else "N/A"
                 
                 volume_table.add_row(
-                    volume.name,
+                    volume['name'],
                     volume_type,
                     details_str
                 )
@@ -492,38 +528,36 @@ def describe(pod_name=None):
         secrets = []
         
         # Procura secrets nos volumes
-        if pod.spec.volumes:
-            for volume in pod.spec.volumes:
-                if hasattr(volume, 'secret') and volume.secret:
-                    secrets.append({
-                        'nome': volume.secret.secret_name,
-                        'tipo': 'Volume',
-                        'montagem': volume.name,
-                        'opcional': str(volume.secret.optional or False)
-                    })
+        for volume in volumes:
+            if volume.get('secret'):
+                secrets.append({
+                    'nome': volume['secret'].get('secretName'),
+                    'tipo': 'Volume',
+                    'montagem': volume['name'],
+                    'opcional': str(volume['secret'].get('optional', False))
+                })
         
         # Procura secrets nas env vars dos containers
-        for container in pod.spec.containers:
-            if container.env:
-                for env in container.env:
-                    if env.value_from and env.value_from.secret_key_ref:
-                        secrets.append({
-                            'nome': env.value_from.secret_key_ref.name,
-                            'tipo': 'Env',
-                            'montagem': f"{container.name}:{env.name}",
-                            'opcional': str(env.value_from.secret_key_ref.optional or False)
-                        })
+        for container in spec['containers']:
+            for env in container.get('env') or []:
+                secret_ref = (env.get('valueFrom') or {}).get('secretKeyRef')
+                if secret_ref:
+                    secrets.append({
+                        'nome': secret_ref.get('name'),
+                        'tipo': 'Env',
+                        'montagem': f"{container['name']}:{env['name']}",
+                        'opcional': str(secret_ref.get('optional', False))
+                    })
             
             # Procura secrets em envFrom
-            if container.env_from:
-                for env_from in container.env_from:
-                    if env_from.secret_ref:
-                        secrets.append({
-                            'nome': env_from.secret_ref.name,
-                            'tipo': 'EnvFrom',
-                            'montagem': container.name,
-                            'opcional': str(env_from.secret_ref.optional or False)
-                        })
+            for env_from in container.get('envFrom') or []:
+                if env_from.get('secretRef'):
+                    secrets.append({
+                        'nome': env_from['secretRef'].get('name'),
+                        'tipo': 'EnvFrom',
+                        'montagem': container['name'],
+                        'opcional': str(env_from['secretRef'].get('optional', False))
+                    })
         
         if secrets:
             secrets_table = Table(show_header=True, header_style="bold magenta", title="\n🔒 Secrets")
@@ -545,12 +579,12 @@ def describe(pod_name=None):
         
         # Eventos
         console.print("\n🔔 [bold]Eventos Recentes:[/]")
-        events = v1.list_namespaced_event(
+        events = gateway.list_events(
             namespace,
             field_selector=f'involvedObject.name={selected_pod}'
         )
         
-        if events.items:
+        if events:
             event_table = Table(show_header=True, header_style="bold magenta")
             event_table.add_column("Tipo", style="cyan", width=10)
             event_table.add_column("Razão", style="yellow", width=20)
@@ -558,28 +592,17 @@ def describe(pod_name=None):
             event_table.add_column("De", style="blue", width=20)
             event_table.add_column("Mensagem", style="white")
             
-            for event in events.items:
+            for event in events:
                 # Calcula a idade do evento
-                event_time = event.last_timestamp or event.event_time
-                if event_time:
-                    event_age = time.time() - event_time.timestamp()
-                    if event_age < 60:
-                        age_str = f"{int(event_age)}s"
-                    elif event_age < 3600:
-                        age_str = f"{int(event_age/60)}m"
-                    elif event_age < 86400:
-                        age_str = f"{int(event_age/3600)}h"
-                    else:
-                        age_str = f"{int(event_age/86400)}d"
-                else:
-                    age_str = "N/A"
+                event_time = event.get('lastTimestamp') or event.get('eventTime')
+                age_str = format_age(event_time) if event_time else "N/A"
                 
                 event_table.add_row(
-                    event.type,
-                    event.reason,
+                    event.get('type'),
+                    event.get('reason'),
                     age_str,
-                    event.source.component,
-                    event.message
+                    (event.get('source') or {}).get('component'),
+                    event.get('message')
                 )
             
             console.print()
@@ -593,7 +616,7 @@ def describe(pod_name=None):
         console.print(f"❌ Erro ao obter detalhes do pod: {str(e)}", style="bold red")
 
 @click.command()
-@click.argument('pod_names', nargs=-1)
+@click.argument('pod_names', nargs=-1, shell_complete=complete_pods)
 @click.option('--force', '-f', is_flag=True, help='Força a deleção do pod')
 @click.option('--all', '-a', is_flag=True, help='Deleta todos os pods do namespace')
 def delete(pod_names=None, force=False, all=False):
@@ -610,18 +633,19 @@ def delete(pod_names=None, force=False, all=False):
         $ jeracli delete --all             # Deleta todos os pods do namespace
         $ jeracli delete --all --force     # Força deleção de todos os pods
     """
+    import inquirer
+    from kubernetes import client
+
     try:
         namespace = load_namespace()
         if not namespace:
             console.print("❌ Namespace não definido. Use 'jeracli use <namespace>' primeiro.", style="bold red")
             return
 
-        config.load_kube_config()
-        v1 = client.CoreV1Api()
+        v1 = get_core_v1_api()
         
         # Busca todos os pods no namespace
-        pods = v1.list_namespaced_pod(namespace)
-        pod_list = [pod.metadata.name for pod in pods.items]
+        pod_list = [pod['metadata']['name'] for pod in gateway.list_pods(namespace)]
         
         # Se --all for usado, substitui a lista de pods
         if all:
@@ -0,0 +1,211 @@
+import os
+import shlex
+import threading
+import click
+from ..utils.console import LazyConsole
+from ..utils.common import load_namespace
+
+console = LazyConsole()
+
+HISTORY_PATH = os.path.expanduser('~/.jera/shell_history')
+# Validade (segundos) das respostas da API em cache durante a sessão
+SHELL_CACHE_TTL = 10
+# Intervalo (segundos) entre as atualizações em segundo plano dos nomes para o autocompletar
+PREFETCH_INTERVAL = 10
+
+# Comandos cujo argumento é um pod, um nó ou um namespace
+POD_COMMANDS = {'logs', 'exec', 'describe', 'delete'}
+NODE_COMMANDS = {'describe-node', 'node-metrics'}
+NAMESPACE_COMMANDS = {'use', 'pods-by-node', 'pod-metrics'}
+# Comandos só de leitura; depois dos demais (delete, use, use-cluster...) o cache é descartado
+READ_ONLY_COMMANDS = {
+    'pods', 'pods-by-node', 'describe', 'nodes', 'describe-node', 'node-metrics',
+    'pod-metrics', 'all-metrics', 'namespaces', 'urls', 'loadbalancer', 'lb',
+    'pvs', 'pvcs', 'storage', 'logs', 'exec', 'clusters',
+}
+BUILTINS = {'exit', 'quit', 'help', 'clear'}
+
+class ResourceNames:
+    """Nomes de pods, nós e namespaces usados no autocompletar, atualizados em segundo plano"""
+
+    def __init__(self):
+        self.pods = []
+        self.nodes = []
+        self.namespaces = []
+        self.wake = threading.Event()
+        self.stopped = threading.Event()
+
+    def refresh(self):
+        """Busca os nomes no cluster atual; também aquece o cache do gateway"""
+        from ..utils import gateway
+
+        namespace = load_namespace()
+        fetchers = {
+            'pods': lambda: gateway.list_pods(namespace) if namespace else [],
+            'nodes': gateway.list_nodes,
+            'namespaces': gateway.list_namespaces,
+        }
+        for attr, fetch in fetchers.items():
+            try:
+                setattr(self, attr, sorted(item['metadata']['name'] for item in fetch()))
+            except Exception:
+                pass
+
+    def run(self):
+        while not self.stopped.is_set():
+            self.refresh()
+            self.wake.wait(PREFETCH_INTERVAL)
+            self.wake.clear()
+
+    def start(self):
+        threading.Thread(target=self.run, name='jera-shell-prefetch', daemon=True).start()
+
+    def stop(self):
+        self.stopped.set()
+        self.wake.set()
+
+def _make_completer(cli, names):
+    """Cria o completer do readline: comandos, opções e nomes de recursos"""
+    ctx = click.Context(cli)
+    commands = sorted(set(cli.list_commands(ctx)) | BUILTINS)
+    matches = []
+
+    def candidates(line):
+        words = line.split()
+        if not words or (len(words) == 1 and not line.endswith(' ')):
+            return commands
+
+        name = words[0]
+        options = []
+        command = cli.get_command(ctx, name) if name not in BUILTINS else None
+        if command is not None:
+            for param in command.params:
+                if isinstance(param, click.Option):
+                    options.extend(param.opts)
+        if name in POD_COMMANDS:
+            return names.pods + options
+        if name in NODE_COMMANDS:
+            return names.nodes + options
+        if name in NAMESPACE_COMMANDS:
+            return names.namespaces + options
+        return options
+
+    def complete(text, state):
+        import readline
+
+        if state == 0:
+            line = readline.get_line_buffer()[:readline.get_begidx()]
+            matches[:] = [c + ' ' for c in candidates(line + text) if c.startswith(text)]
+        return matches[state] if state < len(matches) else None
+
+    return complete
+
+def _setup_readline(cli, names):
+    """Configura autocompletar e histórico; retorna o módulo readline ou None"""
+    try:
+        import readline
+    except ImportError:
+        return None
+
+    readline.set_completer(_make_completer(cli, names))
+    readline.set_completer_delims(' \t\n')
+    if 'libedit' in (readline.__doc__ or ''):
+        readline.parse_and_bind('bind ^I rl_complete')
+    else:
+        readline.parse_and_bind('tab: complete')
+    try:
+        readline.read_history_file(HISTORY_PATH)
+    except OSError:
+        pass
+    readline.set_history_length(1000)
+    return readline
+
+def _prompt():
+    """Monta o prompt com o contexto e o namespace atuais"""
+    from ..utils.kubeconfig import load_kubeconfig
+
+    try:
+        context = load_kubeconfig().get('current-context') or '-'
+    except Exception:
+        context = '-'
+    return f"jera:{context}/{load_namespace() or '-'}> "
+
+def _run(cli, args):
+    """Executa um comando da CLI na sessão, sem encerrar o shell em caso de erro"""
+    try:
+        cli.main(args=args, prog_name='jeracli', standalone_mode=False)
+    except click.ClickException as e:
+        e.show()
+    except (click.Abort, KeyboardInterrupt):
+        console.print("\n⚠️ Operação cancelada", style="bold yellow")
+    except Exception as e:
+        console.print(f"❌ Erro ao executar o comando: {str(e)}", style="bold red")
+
+@click.command()
+def shell():
+    """Abre uma sessão interativa que reaproveita conexões e cache.
+
+    Os comandos são os mesmos da CLI, sem o prefixo `jeracli`. O cliente da API,
+    os tokens e as respostas recentes ficam em memória durante a sessão, e os
+    nomes de pods, nós e namespaces são atualizados em segundo plano para o
+    autocompletar (Tab).
+
+    Exemplos:
+        $ jeracli shell
+        jera:meu-cluster/production> pods
+        jera:meu-cluster/production> logs <Tab>
+        jera:meu-cluster/production> exit
+    """
+    from ..cli import cli
+    from ..utils.gateway import set_cache_ttl, clear_cache
+
+    set_cache_ttl(SHELL_CACHE_TTL)
+    names = ResourceNames()
+    names.start()
+    readline = _setup_readline(cli, names)
+
+    console.print("\n🚀 Jera CLI shell. Use Tab para completar, 'help' para ajuda e 'exit' para sair.", style="bold blue")
+    try:
+        while True:
+            try:
+                line = input(_prompt())
+            except KeyboardInterrupt:
+                console.print()
+                continue
+            except EOFError:
+                console.print()
+                break
+
+            try:
+                args = shlex.split(line)
+            except ValueError as e:
+                console.print(f"❌ Comando inválido: {str(e)}", style="bold red")
+                continue
+            if not args:
+                continue
+
+            name = args[0]
+            if name in ('exit', 'quit'):
+                break
+            if name == 'help':
+                _run(cli, ['--help'])
+                continue
+            if name == 'clear':
+                console.clear()
+                continue
+            if name == 'shell':
+                console.print("ℹ️ Você já está no shell da Jera CLI.", style="bold yellow")
+                continue
+
+            _run(cli, args)
+            if name not in READ_ONLY_COMMANDS:
+                clear_cache()
+                names.wake.set()
+    finally:
+        names.stop()
+        if readline is not None:
+            try:
+                os.makedirs(os.path.dirname(HISTORY_PATH), exist_ok=True)
+                readline.write_history_file(HISTORY_PATH)
+            except OSError:
+                pass
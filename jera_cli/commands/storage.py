@@ -1,104 +1,204 @@
 import click
-from rich.console import Console
-from rich.table import Table
-import subprocess
-import json
-import inquirer
-from ..utils.common import load_namespace
+from ..utils.console import LazyConsole
+from ..utils import gateway
+from ..utils.kubernetes import format_age, parse_quantity
+from ..utils.multicluster import cluster_options, resolve_contexts, fetch_per_cluster
+from ..utils.output import output_option, resolve_output, write_records, report_error
 
-console = Console()
+console = LazyConsole()
+
+ALL_NAMESPACES = "* Todos os namespaces"
+
+# Nós consultados ao mesmo tempo no storage --usage
+STATS_WORKERS = 16
+# Tempo máximo (segundos) da leitura do stats/summary de cada nó
+STATS_TIMEOUT = 15
+# Uso (%) a partir do qual um volume é considerado cheio
+FULL_PERCENT = 95
+# Minutos sem anexar para o storage audit considerar um VolumeAttachment travado
+ATTACH_STUCK_MINUTES = 10
+
+def select_namespace():
+    """Pergunta o namespace; retorna o nome, None para todos ou False se cancelado"""
+    import inquirer
+
+    # Lista todos os namespaces disponíveis, com a opção de todos no topo
+    namespaces = sorted(item['metadata']['name'] for item in gateway.list_namespaces())
+    namespaces.insert(0, ALL_NAMESPACES)
+    
+    questions = [
+        inquirer.List('namespace',
+                     message="Selecione o namespace",
+                     choices=namespaces,
+                     )
+    ]
+    answers = inquirer.prompt(questions)
+    if not answers:
+        return False
+    return None if answers['namespace'] == ALL_NAMESPACES else answers['namespace']
+
+def volume_type(pv):
+    """Tipo do volume: a chave de origem no spec do PV (csi, awsElasticBlockStore, hostPath...)"""
+    volume_types = [k for k in pv['spec'].keys() if k not in
+                   ['accessModes', 'capacity', 'claimRef', 'persistentVolumeReclaimPolicy',
+                    'storageClassName', 'volumeMode', 'mountOptions', 'nodeAffinity']]
+    return volume_types[0] if volume_types else "N/A"
+
+# Fases em que o pod já terminou e não monta mais os volumes (Jobs concluídos ou com falha)
+FINISHED_POD_PHASES = ('Succeeded', 'Failed')
+
+def index_claims(pvs_items, pods, active_only=False):
+    """Monta os índices claim→volume e claim→pods, ambos por (namespace, PVC).
+
+    Cada lista é percorrida uma única vez; depois cada PVC encontra seu PV e
+    seus pods com uma consulta em dict, em vez de varrer PVs e pods de novo.
+    Com active_only, pods que já terminaram (Succeeded/Failed) ficam de fora.
+    """
+    volumes = {pv['metadata']['name']: pv for pv in pvs_items}
+    volumes_by_claim = {}
+    for pv in pvs_items:
+        claim_ref = pv['spec'].get('claimRef')
+        if claim_ref:
+            volumes_by_claim[(claim_ref.get('namespace'), claim_ref.get('name'))] = pv
+
+    pods_by_claim = {}
+    for pod in pods:
+        if active_only and (pod.get('status') or {}).get('phase') in FINISHED_POD_PHASES:
+            continue
+        pod_namespace = pod['metadata']['namespace']
+        for volume in (pod.get('spec') or {}).get('volumes') or []:
+            claim = volume.get('persistentVolumeClaim')
+            if claim:
+                pods_by_claim.setdefault((pod_namespace, claim['claimName']), []).append(pod)
+    return volumes, volumes_by_claim, pods_by_claim
+
+def collect_volume_usage(node_names):
+    """Lê o stats/summary do kubelet de cada nó ao mesmo tempo, com no máximo STATS_WORKERS em paralelo.
+
+    Retorna ({(namespace, PVC): uso}, {nó: erro}); o uso traz usedBytes,
+    capacityBytes, inodesUsed e inodes do volume, como o kubelet reporta.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from ..utils.multicluster import describe_error
+
+    def fetch(node_name):
+        try:
+            return node_name, gateway.get_node_stats_summary(node_name, timeout=STATS_TIMEOUT), None
+        except Exception as e:
+            return node_name, None, describe_error(e)
+
+    usage, errors = {}, {}
+    with ThreadPoolExecutor(max_workers=STATS_WORKERS) as executor:
+        for node_name, summary, error in executor.map(fetch, node_names):
+            if error:
+                errors[node_name] = error
+                continue
+            for pod in summary.get('pods') or []:
+                for volume in pod.get('volume') or []:
+                    ref = volume.get('pvcRef')
+                    if ref and volume.get('capacityBytes'):
+                        usage[(ref.get('namespace'), ref.get('name'))] = {
+                            field: volume.get(field) for field in ('usedBytes', 'capacityBytes', 'inodesUsed', 'inodes')
+                        }
+    return usage, errors
+
+def fill_percent(used, total):
+    """Percentual de uso, ou None sem os dois valores"""
+    return used * 100 / total if used is not None and total else None
+
+def format_bytes(value):
+    """Formata bytes em Ki/Mi/Gi/Ti"""
+    for unit in ('Ki', 'Mi', 'Gi', 'Ti'):
+        value /= 1024
+        if value < 1024 or unit == 'Ti':
+            return f"{value:.1f}{unit}"
+
+def abbreviate(names, limit=3):
+    """Junta os nomes com vírgula, mostrando no máximo `limit` e quantos sobraram"""
+    text = ", ".join(names[:limit])
+    if len(names) > limit:
+        text += f" (+{len(names) - limit})"
+    return text or "-"
+
+def pvc_records(groups, show_cluster):
+    """Gera um registro por PVC para o -o json/ndjson/csv"""
+    for cluster, pvcs_items in groups:
+        for pvc in pvcs_items:
+            spec = pvc['spec']
+            record = {'cluster': cluster} if show_cluster else {}
+            record.update(
+                namespace=pvc['metadata']['namespace'],
+                name=pvc['metadata']['name'],
+                status=pvc['status']['phase'],
+                volume=spec.get('volumeName'),
+                capacity=spec['resources']['requests'].get('storage'),
+                access_modes=spec.get('accessModes') or [],
+                storage_class=spec.get('storageClassName'),
+                created=pvc['metadata']['creationTimestamp'],
+            )
+            yield record
+
+def pv_records(pvs_items):
+    """Gera um registro por PV para o -o json/ndjson/csv, já com o claim e o tipo de volume"""
+    for pv in pvs_items:
+        spec = pv['spec']
+        claim = spec.get('claimRef') or {}
+        yield {
+            'name': pv['metadata']['name'],
+            'status': pv['status']['phase'],
+            'capacity': spec['capacity'].get('storage'),
+            'access_modes': spec.get('accessModes') or [],
+            'storage_class': spec.get('storageClassName'),
+            'reclaim_policy': spec.get('persistentVolumeReclaimPolicy'),
+            'claim_namespace': claim.get('namespace'),
+            'claim_name': claim.get('name'),
+            'volume_type': volume_type(pv),
+        }
 
 @click.command()
 @click.option('--namespace', '-n', help='Filtra por namespace específico')
 @click.option('--select', '-s', is_flag=True, help='Seleciona o namespace interativamente')
-def pvcs(namespace=None, select=False):
+@cluster_options
+@output_option
+def pvcs(namespace=None, select=False, clusters=None, all_clusters=False, output=None):
     """Mostra os Persistent Volume Claims (PVCs) no cluster.
     
     Por padrão, mostra PVCs de todos os namespaces.
     Use a opção --namespace para filtrar por um namespace específico,
     ou use --select para escolher o namespace interativamente.
+    Com --clusters (ou --all-clusters) junta os PVCs de vários clusters.
     
     Exemplos:
         $ jcli pvcs                    # Mostra PVCs de todos os namespaces
         $ jcli pvcs -n production      # Mostra PVCs do namespace production
         $ jcli pvcs -s                 # Seleciona o namespace interativamente
+        $ jcli pvcs --clusters a,b     # Mostra PVCs dos clusters a e b
+        $ jcli pvcs -o csv             # Um PVC por linha, em CSV
     """
+    from rich.table import Table
+
+    output = resolve_output(output)
     try:
+
         # Se foi pedido para selecionar o namespace interativamente
         if select:
-            # Lista todos os namespaces disponíveis
-            ns_cmd = ["kubectl", "get", "namespaces", "-o", "json"]
-            ns_result = subprocess.run(
-                ns_cmd,
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            
-            if ns_result.returncode != 0:
-                console.print(f"❌ Erro ao listar namespaces: {ns_result.stderr}", style="bold red")
-                return
-                
-            namespaces_json = json.loads(ns_result.stdout)
-            namespaces = [item['metadata']['name'] for item in namespaces_json['items']]
-            namespaces.sort()
-            
-            # Adiciona opção para todos os namespaces
-            namespaces.insert(0, "* Todos os namespaces")
-            
-            # Permite selecionar o namespace
-            questions = [
-                inquirer.List('namespace',
-                             message="Selecione o namespace",
-                             choices=namespaces,
-                             )
-            ]
-            answers = inquirer.prompt(questions)
-            
-            if answers:
-                if answers['namespace'] == "* Todos os namespaces":
-                    namespace = None
-                else:
-                    namespace = answers['namespace']
-            else:
+            namespace = select_namespace()
+            if namespace is False:
                 return
 
         # Se foi especificado um namespace ou selecionado interativamente
         show_all = namespace is None
         
-        # Executa o comando kubectl para obter os PVCs
-        cmd = ["kubectl", "get", "pvc"]
+        contexts = resolve_contexts(clusters, all_clusters)
+        groups = fetch_per_cluster(contexts, lambda context: gateway.list_pvcs(namespace, context=context))
+        show_cluster = contexts is not None
         
-        if namespace:
-            cmd.extend(["-n", namespace])
-        else:
-            cmd.append("--all-namespaces")
-            
-        cmd.extend(["-o", "json"])
-        
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=False
-        )
-        
-        if result.returncode != 0:
-            # Verifica se o erro é por falta de recursos
-            if "No resources found" in result.stderr:
-                if show_all:
-                    console.print("ℹ️ Nenhum PVC encontrado em nenhum namespace.", style="bold yellow")
-                else:
-                    console.print(f"ℹ️ Nenhum PVC encontrado no namespace '{namespace}'.", style="bold yellow")
-                return
-            else:
-                console.print(f"❌ Erro ao obter PVCs: {result.stderr}", style="bold red")
-                return
-        
-        pvcs_json = json.loads(result.stdout)
+        if output != 'table':
+            write_records(pvc_records(groups, show_cluster), output)
+            return
         
         # Se não houver PVCs
-        if not pvcs_json.get('items'):
+        if not any(pvcs_items for _, pvcs_items in groups):
             if show_all:
                 console.print("ℹ️ Nenhum PVC encontrado em nenhum namespace.", style="bold yellow")
             else:
@@ -108,6 +208,8 @@ def pvcs(namespace=None, select=False):
         # Cria a tabela para exibir os resultados
         table = Table(show_header=True, header_style="bold magenta")
         
+        if show_cluster:
+            table.add_column("Cluster", style="blue")
         if show_all:
             table.add_column("Namespace", style="blue")
         
@@ -119,63 +221,68 @@ def pvcs(namespace=None, select=False):
         table.add_column("StorageClass", style="dim")
         table.add_column("Idade", style="dim")
         
-        # Processa cada PVC
-        for pvc in pvcs_json['items']:
-            pvc_name = pvc['metadata']['name']
-            pvc_namespace = pvc['metadata']['namespace']
+        # Processa cada PVC de cada cluster
+        for cluster, pvcs_items in groups:
+            prefix = [cluster] if show_cluster else []
             
-            # Obtém o status
-            status = pvc['status']['phase']
-            status_style = "green" if status == "Bound" else "yellow" if status == "Pending" else "red"
-            status_formatted = f"[{status_style}]{status}[/{status_style}]"
+            for pvc in pvcs_items:
+                pvc_name = pvc['metadata']['name']
+                pvc_namespace = pvc['metadata']['namespace']
             
-            # Volume vinculado
-            volume = pvc['spec'].get('volumeName', 'N/A')
+                # Obtém o status
+                status = pvc['status']['phase']
+                status_style = "green" if status == "Bound" else "yellow" if status == "Pending" else "red"
+                status_formatted = f"[{status_style}]{status}[/{status_style}]"
             
-            # Capacidade solicitada
-            capacity = pvc['spec']['resources']['requests'].get('storage', 'N/A')
+                # Volume vinculado
+                volume = pvc['spec'].get('volumeName', 'N/A')
             
-            # Modos de acesso
-            access_modes = ", ".join(pvc['spec'].get('accessModes', ['N/A']))
+                # Capacidade solicitada
+                capacity = pvc['spec']['resources']['requests'].get('storage', 'N/A')
             
-            # StorageClass
-            storage_class = pvc['spec'].get('storageClassName', 'default')
+                # Modos de acesso
+                access_modes = ", ".join(pvc['spec'].get('accessModes', ['N/A']))
             
-            # Idade - cálculo simplificado
-            from datetime import datetime
-            creation_time = datetime.fromisoformat(pvc['metadata']['creationTimestamp'].replace('Z', '+00:00'))
-            now = datetime.now().astimezone()
-            age_seconds = (now - creation_time).total_seconds()
+                # StorageClass
+                storage_class = pvc['spec'].get('storageClassName', 'default')
             
-            if age_seconds < 3600:  # menos de 1 hora
-                age = f"{int(age_seconds / 60)}m"
-            elif age_seconds < 86400:  # menos de 1 dia
-                age = f"{int(age_seconds / 3600)}h"
-            else:
-                age = f"{int(age_seconds / 86400)}d"
+                # Idade - cálculo simplificado
+                from datetime import datetime
+                creation_time = datetime.fromisoformat(pvc['metadata']['creationTimestamp'].replace('Z', '+00:00'))
+                now = datetime.now().astimezone()
+                age_seconds = (now - creation_time).total_seconds()
             
-            # Adiciona à tabela
-            if show_all:
-                table.add_row(
-                    pvc_namespace,
-                    pvc_name,
-                    status_formatted,
-                    volume,
-                    capacity,
-                    access_modes,
-                    storage_class,
-                    age
-                )
-            else:
-                table.add_row(
-                    pvc_name,
-                    status_formatted,
-                    volume,
-                    capacity,
-                    access_modes,
-                    storage_class,
-                    age
-                )
+                if age_seconds < 3600:  # menos de 1 hora
+                    age = f"{int(age_seconds / 60)}m"
+                elif age_seconds < 86400:  # menos de 1 dia
+                    age = f"{int(age_seconds / 3600)}h"
+                else:
+                    age = f"{int(age_seconds / 86400)}d"
+            
+                # Adiciona à tabela
+                if show_all:
+                    table.add_row(
+                        *prefix,
+                        pvc_namespace,
+                        pvc_name,
+                        status_formatted,
+                        volume,
+                        capacity,
+                        access_modes,
+                        storage_class,
+                        age
+                    )
+                else:
+                    table.add_row(
+                        *prefix,
+                        pvc_name,
+                        status_formatted,
+                        volume,
+                        capacity,
+                        access_modes,
+                        storage_class,
+                        age
+                    )
         
         # Título da tabela
         if show_all:
@@ -187,11 +294,12 @@ def pvcs(namespace=None, select=False):
         console.print(table)
             
     except Exception as e:
-        console.print(f"❌ Erro ao listar PVCs: {str(e)}", style="bold red")
+        report_error(output, f"Erro ao listar PVCs: {str(e)}")
 
 @click.command()
 @click.option('--detailed', '-d', is_flag=True, help='Exibe informações detalhadas sobre os volumes')
-def pvs(detailed=False):
+@output_option
+def pvs(detailed=False, output=None):
     """Mostra os Persistent Volumes (PVs) no cluster.
     
     Os PVs são recursos globais no Kubernetes e não pertencem a namespaces.
@@ -200,31 +308,20 @@ def pvs(detailed=False):
     Exemplos:
         $ jcli pvs                # Mostra lista básica de PVs
         $ jcli pvs -d             # Mostra detalhes dos PVs
+        $ jcli pvs -o ndjson      # Um JSON por PV, com os campos do -d
     """
+    from rich.table import Table
+
+    output = resolve_output(output)
     try:
-        # Executa o comando kubectl para obter os PVs
-        cmd = ["kubectl", "get", "pv", "-o", "json"]
-        
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=False
-        )
-        
-        if result.returncode != 0:
-            # Verifica se o erro é por falta de recursos
-            if "No resources found" in result.stderr:
-                console.print("ℹ️ Nenhum Persistent Volume encontrado no cluster.", style="bold yellow")
-                return
-            else:
-                console.print(f"❌ Erro ao obter PVs: {result.stderr}", style="bold red")
-                return
+        pvs_items = gateway.list_pvs()
         
-        pvs_json = json.loads(result.stdout)
+        if output != 'table':
+            write_records(pv_records(pvs_items), output)
+            return
         
         # Se não houver PVs
-        if not pvs_json.get('items'):
+        if not pvs_items:
             console.print("ℹ️ Nenhum Persistent Volume encontrado no cluster.", style="bold yellow")
             return
         
@@ -244,7 +341,7 @@ def pvs(detailed=False):
             table.add_column("Tipo de Volume", style="green")
         
         # Processa cada PV
-        for pv in pvs_json['items']:
+        for pv in pvs_items:
             pv_name = pv['metadata']['name']
             
             # Obtém o status
@@ -269,16 +366,10 @@ def pvs(detailed=False):
                 # PVC vinculado
                 pvc = "N/A"
                 namespace = "N/A"
-                if status == "Bound" and 'claimRef' in pv:
+                if status == "Bound" and 'claimRef' in pv['spec']:
                     pvc = pv['spec']['claimRef'].get('name', 'N/A')
                     namespace = pv['spec']['claimRef'].get('namespace', 'N/A')
                 
-                # Tipo de volume (primeira chave após volumeType no spec, como awsElasticBlockStore, hostPath, etc)
-                volume_types = [k for k in pv['spec'].keys() if k not in 
-                               ['accessModes', 'capacity', 'claimRef', 'persistentVolumeReclaimPolicy', 
-                                'storageClassName', 'volumeMode']]
-                volume_type = volume_types[0] if volume_types else "N/A"
-                
                 table.add_row(
                     pv_name,
                     status_formatted,
@@ -288,7 +379,7 @@ def pvs(detailed=False):
                     reclaim_policy,
                     pvc,
                     namespace,
-                    volume_type
+                    volume_type(pv)
                 )
             else:
                 table.add_row(
@@ -310,84 +401,446 @@ def pvs(detailed=False):
         console.print(table)
             
     except Exception as e:
-        console.print(f"❌ Erro ao listar PVs: {str(e)}", style="bold red")
+        report_error(output, f"Erro ao listar PVs: {str(e)}")
 
-@click.command()
+# Campos do -o do storage: PVCs e PVs sem PVC no mesmo formato, separados por `kind`
+STORAGE_FIELDS = ['kind', 'namespace', 'name', 'status', 'volume', 'capacity', 'storage_class', 'access_modes',
+                  'reclaim_policy', 'volume_type', 'claim', 'pods', 'nodes', 'created']
+STORAGE_USAGE_FIELDS = ['used_bytes', 'capacity_bytes', 'used_percent', 'inodes_percent']
+
+def storage_records(pvcs, pvs_items, indexes, volume_usage, usage, namespace=None):
+    """Gera a visão consolidada do storage para o -o json/ndjson/csv.
+
+    Um registro por PVC (na ordem recebida), com o volume, os pods e nós que
+    o montam e, com usage, o uso lido do kubelet; depois os PVs sem PVC.
+    """
+    volumes, volumes_by_claim, pods_by_claim = indexes
+    claimed = set()
+    for pvc in pvcs:
+        key = (pvc['metadata']['namespace'], pvc['metadata']['name'])
+        spec = pvc['spec']
+        pv = volumes.get(spec.get('volumeName')) or volumes_by_claim.get(key)
+        if pv:
+            claimed.add(pv['metadata']['name'])
+        mounted_by = pods_by_claim.get(key, [])
+        record = {
+            'kind': 'pvc',
+            'namespace': key[0],
+            'name': key[1],
+            'status': (pvc.get('status') or {}).get('phase'),
+            'volume': spec.get('volumeName'),
+            'capacity': ((pvc.get('status') or {}).get('capacity') or {}).get('storage') or spec['resources']['requests'].get('storage'),
+            'storage_class': spec.get('storageClassName'),
+            'access_modes': spec.get('accessModes') or [],
+            'reclaim_policy': pv['spec'].get('persistentVolumeReclaimPolicy') if pv else None,
+            'volume_type': volume_type(pv) if pv else None,
+            'claim': None,
+            'pods': [pod['metadata']['name'] for pod in mounted_by],
+            'nodes': sorted({pod['spec'].get('nodeName') for pod in mounted_by if pod['spec'].get('nodeName')}),
+            'created': pvc['metadata']['creationTimestamp'],
+        }
+        if usage:
+            stats = volume_usage.get(key) or {}
+            percent = fill_percent(stats.get('usedBytes'), stats.get('capacityBytes'))
+            inodes = fill_percent(stats.get('inodesUsed'), stats.get('inodes'))
+            record.update(
+                used_bytes=stats.get('usedBytes'),
+                capacity_bytes=stats.get('capacityBytes'),
+                used_percent=round(percent, 1) if percent is not None else None,
+                inodes_percent=round(inodes, 1) if inodes is not None else None,
+            )
+        yield record
+
+    for pv in sorted(pvs_items, key=lambda p: p['metadata']['name']):
+        claim = pv['spec'].get('claimRef') or {}
+        if pv['metadata']['name'] in claimed or (namespace is not None and claim.get('namespace') != namespace):
+            continue
+        record = {
+            'kind': 'pv',
+            'namespace': None,
+            'name': pv['metadata']['name'],
+            'status': (pv.get('status') or {}).get('phase'),
+            'volume': pv['metadata']['name'],
+            'capacity': (pv['spec'].get('capacity') or {}).get('storage'),
+            'storage_class': pv['spec'].get('storageClassName'),
+            'access_modes': pv['spec'].get('accessModes') or [],
+            'reclaim_policy': pv['spec'].get('persistentVolumeReclaimPolicy'),
+            'volume_type': volume_type(pv),
+            'claim': f"{claim.get('namespace')}/{claim.get('name')}" if claim else None,
+            'pods': [],
+            'nodes': [],
+            'created': pv['metadata']['creationTimestamp'],
+        }
+        if usage:
+            record.update(dict.fromkeys(STORAGE_USAGE_FIELDS))
+        yield record
+
+@click.group(invoke_without_command=True)
 @click.option('--namespace', '-n', help='Filtra por namespace específico')
 @click.option('--select', '-s', is_flag=True, help='Seleciona o namespace interativamente')
 @click.option('--detailed', '-d', is_flag=True, help='Exibe informações detalhadas sobre os volumes')
-def storage(namespace=None, select=False, detailed=False):
+@click.option('--usage', '-u', is_flag=True, help='Mostra o uso real de cada PVC (bytes e inodes), lido do kubelet dos nós')
+@click.option('--sort', type=click.Choice(['nome', 'uso']), default='nome', show_default=True,
+              help='Ordena por namespace/nome ou pelo percentual de uso (implica --usage)')
+@output_option
+@click.pass_context
+def storage(ctx, namespace=None, select=False, detailed=False, usage=False, sort='nome', output=None):
     """Mostra informações sobre armazenamento no cluster (PVs e PVCs).
     
-    Combina as informações de PVs e PVCs em uma visão consolidada.
+    Combina PVs, PVCs e pods em uma visão consolidada: cada PVC aparece com
+    seu volume e os pods e nós que o montam, seguido dos PVs sem PVC.
     Por padrão, mostra PVCs de todos os namespaces e todos os PVs.
+    Com --usage lê o stats/summary do kubelet de cada nó que monta os PVCs
+    (em paralelo) e mostra o uso real em bytes e inodes.
     
     Exemplos:
         $ jcli storage                 # Visão geral de armazenamento
         $ jcli storage -n production   # Filtra PVCs por namespace
         $ jcli storage -s              # Seleciona o namespace interativamente
         $ jcli storage -d              # Mostra detalhes adicionais
+        $ jcli storage --sort uso      # Uso real, dos volumes mais cheios primeiro
+        $ jcli storage audit           # Volumes órfãos e VolumeAttachments travados
+        $ jcli storage -u -o ndjson    # Um JSON por PVC (e PV sem PVC), com o uso
     """
+    from rich.table import Table
+
+    output = resolve_output(output)
+    # Com um subcomando (storage audit) a visão geral não é mostrada
+    if ctx.invoked_subcommand is not None:
+        if output != 'table':
+            raise click.UsageError(f"'storage {ctx.invoked_subcommand}' não aceita -o {output}", ctx)
+        return
+    
     try:
-        # Reutiliza a mesma lógica dos comandos pvs e pvcs
-        # Primeiro, chama a lógica para obter os PVCs
-        pvcs_cmd = ["kubectl", "get", "pvc"]
-        
         # Se foi pedido para selecionar o namespace interativamente
         if select:
-            # Lista todos os namespaces disponíveis
-            ns_cmd = ["kubectl", "get", "namespaces", "-o", "json"]
-            ns_result = subprocess.run(
-                ns_cmd,
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            
-            if ns_result.returncode != 0:
-                console.print(f"❌ Erro ao listar namespaces: {ns_result.stderr}", style="bold red")
+            namespace = select_namespace()
+            if namespace is False:
                 return
-                
-            namespaces_json = json.loads(ns_result.stdout)
-            namespaces = [item['metadata']['name'] for item in namespaces_json['items']]
-            namespaces.sort()
+
+        show_all = namespace is None
+        
+        if output == 'table':
+            console.print("\n🔍 Analisando recursos de armazenamento...", style="bold blue")
+        
+        # PVs, PVCs e pods numa só ida à API
+        pvs_items, pvcs_items, pods = gateway.fetch_concurrently(
+            gateway.list_pvs,
+            lambda: gateway.list_pvcs(namespace),
+            lambda: gateway.list_pods(namespace),
+        )
+        volumes, volumes_by_claim, pods_by_claim = index_claims(pvs_items, pods)
+        
+        usage = usage or sort == 'uso'
+        volume_usage = {}
+        if usage:
+            # Só os nós que montam algum dos PVCs listados
+            node_names = sorted({
+                pod['spec']['nodeName']
+                for pvc in pvcs_items
+                for pod in pods_by_claim.get((pvc['metadata']['namespace'], pvc['metadata']['name']), [])
+                if pod['spec'].get('nodeName')
+            })
+            if output == 'table':
+                console.print(f"🔄 Lendo o uso dos volumes em {len(node_names)} nó(s)...", style="yellow")
+            volume_usage, usage_errors = collect_volume_usage(node_names)
+            if usage_errors:
+                failed = ", ".join(f"{node} ({error})" for node, error in sorted(usage_errors.items()))
+                # Fora da tabela o aviso vai para o stderr, longe dos registros
+                (console if output == 'table' else LazyConsole(stderr=True)).print(
+                    f"⚠️ Sem estatísticas de {len(usage_errors)} nó(s): {failed}", style="bold yellow")
+        
+        def claim_key(pvc):
+            return (pvc['metadata']['namespace'], pvc['metadata']['name'])
+        
+        def fill_key(pvc):
+            stats = volume_usage.get(claim_key(pvc)) or {}
+            percent = fill_percent(stats.get('usedBytes'), stats.get('capacityBytes'))
+            return (percent is None, -(percent or 0), claim_key(pvc))
+        
+        if output != 'table':
+            write_records(storage_records(
+                sorted(pvcs_items, key=fill_key if sort == 'uso' else claim_key), pvs_items,
+                (volumes, volumes_by_claim, pods_by_claim), volume_usage, usage, namespace,
+            ), output, STORAGE_FIELDS + (STORAGE_USAGE_FIELDS if usage else []))
+            return
+        
+        if not pvcs_items and not pvs_items:
+            console.print("ℹ️ Nenhum PV ou PVC encontrado no cluster.", style="bold yellow")
+            return
+        
+        table = Table(show_header=True, header_style="bold magenta")
+        if show_all:
+            table.add_column("Namespace", style="blue")
+        table.add_column("PVC", style="cyan")
+        table.add_column("Status", style="yellow")
+        table.add_column("Volume", style="green")
+        table.add_column("Capacidade", style="bold white")
+        table.add_column("StorageClass", style="dim")
+        if detailed:
+            table.add_column("Modo de Acesso", style="dim")
+            table.add_column("Reclaim Policy", style="dim")
+            table.add_column("Tipo de Volume", style="green")
+        if usage:
+            table.add_column("Uso", justify="right")
+            table.add_column("Uso %", justify="right")
+            table.add_column("Inodes %", justify="right")
+        table.add_column("Pods")
+        table.add_column("Nós", style="dim")
+        table.add_column("Idade", style="dim")
+        
+        claimed = set()
+        full = 0
+        for pvc in sorted(pvcs_items, key=fill_key if sort == 'uso' else claim_key):
+            key = claim_key(pvc)
+            spec = pvc['spec']
+            pv = volumes.get(spec.get('volumeName')) or volumes_by_claim.get(key)
+            if pv:
+                claimed.add(pv['metadata']['name'])
             
-            # Adiciona opção para todos os namespaces
-            namespaces.insert(0, "* Todos os namespaces")
+            status = (pvc.get('status') or {}).get('phase', 'N/A')
+            status_style = "green" if status == "Bound" else "yellow" if status == "Pending" else "red"
+            mounted_by = pods_by_claim.get(key, [])
+            nodes = sorted({pod['spec'].get('nodeName') for pod in mounted_by if pod['spec'].get('nodeName')})
             
-            # Permite selecionar o namespace
-            questions = [
-                inquirer.List('namespace',
-                             message="Selecione o namespace",
-                             choices=namespaces,
-                             )
+            row = [key[0]] if show_all else []
+            row += [
+                key[1],
+                f"[{status_style}]{status}[/{status_style}]",
+                spec.get('volumeName') or "N/A",
+                ((pvc.get('status') or {}).get('capacity') or {}).get('storage') or spec['resources']['requests'].get('storage', 'N/A'),
+                spec.get('storageClassName', 'default'),
             ]
-            answers = inquirer.prompt(questions)
-            
-            if answers:
-                if answers['namespace'] == "* Todos os namespaces":
-                    namespace = None
+            if detailed:
+                row += [
+                    ", ".join(spec.get('accessModes', ['N/A'])),
+                    pv['spec'].get('persistentVolumeReclaimPolicy', 'N/A') if pv else "N/A",
+                    volume_type(pv) if pv else "N/A",
+                ]
+            if usage:
+                stats = volume_usage.get(key)
+                if stats:
+                    # Volumes em modo Block têm capacidade mas não têm usedBytes nem inodes
+                    used = stats.get('usedBytes')
+                    percent = fill_percent(used, stats['capacityBytes'])
+                    inodes = fill_percent(stats.get('inodesUsed'), stats.get('inodes'))
+                    full += (percent or 0) >= FULL_PERCENT or (inodes or 0) >= FULL_PERCENT
+                    percent_style = "bold red" if (percent or 0) >= FULL_PERCENT else "yellow" if (percent or 0) >= 80 else "green"
+                    inodes_style = "bold red" if (inodes or 0) >= FULL_PERCENT else "yellow" if (inodes or 0) >= 80 else "green"
+                    row += [
+                        f"{format_bytes(used) if used is not None else '-'} / {format_bytes(stats['capacityBytes'])}",
+                        f"[{percent_style}]{percent:.1f}%[/]" if percent is not None else "-",
+                        f"[{inodes_style}]{inodes:.1f}%[/]" if inodes is not None else "-",
+                    ]
                 else:
-                    namespace = answers['namespace']
+                    row += ["-", "-", "-"]
+            row += [
+                abbreviate([pod['metadata']['name'] for pod in mounted_by]) if mounted_by else "[dim]não montado[/]",
+                abbreviate(nodes),
+                format_age(pvc['metadata']['creationTimestamp']),
+            ]
+            table.add_row(*row)
+        
+        if pvcs_items:
+            if show_all:
+                console.print("\n💾 Armazenamento (todos os namespaces):", style="bold blue")
             else:
-                return
+                console.print(f"\n💾 Armazenamento no namespace [bold green]{namespace}[/]:", style="bold blue")
+            console.print(table)
+            if full:
+                console.print(f"\n⚠️ {full} volume(s) com {FULL_PERCENT}% ou mais de uso (bytes ou inodes).", style="bold yellow")
+        elif show_all:
+            console.print("ℹ️ Nenhum PVC encontrado em nenhum namespace.", style="bold yellow")
+        else:
+            console.print(f"ℹ️ Nenhum PVC encontrado no namespace '{namespace}'.", style="bold yellow")
+        
+        # PVs sem PVC listado (livres, liberados ou de claims que não existem mais)
+        unclaimed = [
+            pv for pv in pvs_items
+            if pv['metadata']['name'] not in claimed
+            and (show_all or (pv['spec'].get('claimRef') or {}).get('namespace') == namespace)
+        ]
+        if unclaimed:
+            pv_table = Table(show_header=True, header_style="bold magenta")
+            pv_table.add_column("PV", style="cyan")
+            pv_table.add_column("Status", style="yellow")
+            pv_table.add_column("Capacidade", style="bold white")
+            pv_table.add_column("StorageClass", style="dim")
+            pv_table.add_column("Reclaim Policy", style="dim")
+            pv_table.add_column("PVC anterior", style="blue")
+            if detailed:
+                pv_table.add_column("Tipo de Volume", style="green")
+            for pv in sorted(unclaimed, key=lambda p: p['metadata']['name']):
+                status = (pv.get('status') or {}).get('phase', 'N/A')
+                status_style = "green" if status == "Bound" else "yellow" if status in ["Available", "Released"] else "red"
+                claim_ref = pv['spec'].get('claimRef')
+                row = [
+                    pv['metadata']['name'],
+                    f"[{status_style}]{status}[/{status_style}]",
+                    pv['spec'].get('capacity', {}).get('storage', 'N/A'),
+                    pv['spec'].get('storageClassName', 'N/A'),
+                    pv['spec'].get('persistentVolumeReclaimPolicy', 'N/A'),
+                    f"{claim_ref.get('namespace')}/{claim_ref.get('name')}" if claim_ref else "-",
+                ]
+                if detailed:
+                    row.append(volume_type(pv))
+                pv_table.add_row(*row)
+            console.print("\n📦 Persistent Volumes sem PVC:", style="bold blue")
+            console.print(pv_table)
+        
+    except Exception as e:
+        report_error(output, f"Erro ao analisar armazenamento: {str(e)}")
 
-        # Se foi especificado um namespace ou selecionado interativamente
-        show_all_ns = namespace is None
+@storage.command()
+@click.option('--namespace', '-n', help='Filtra os PVCs por namespace específico')
+@click.option('--stuck-after', type=click.IntRange(min=0), default=ATTACH_STUCK_MINUTES, show_default=True,
+              help='Minutos sem anexar para considerar um VolumeAttachment travado')
+def audit(namespace=None, stuck_after=ATTACH_STUCK_MINUTES):
+    """Procura armazenamento órfão ou vazando no cluster.
+    
+    Lê PVs, PVCs, pods, nós e VolumeAttachments uma vez cada, ao mesmo tempo,
+    e cruza tudo por índices. Reporta PVs Released/Available/Failed (que
+    continuam custando), PVCs que nenhum pod monta e VolumeAttachments
+    travados: com erro, sem anexar há muito tempo, de PVs ou nós que não
+    existem mais ou presos a um nó sem nenhum pod usando o volume.
+    
+    Exemplos:
+        $ jcli storage audit              # Audita o cluster inteiro
+        $ jcli storage audit -n production # PVCs só do namespace production
+    """
+    from rich.table import Table
+    import datetime
+    from ..utils.kubernetes import parse_timestamp
+
+    try:
+        console.print("\n🔍 Auditando armazenamento do cluster...", style="bold blue")
         
-        console.print("\n🔍 Analisando recursos de armazenamento...", style="bold blue")
+        pvs_items, pvcs_items, pods, nodes, attachments = gateway.fetch_concurrently(
+            gateway.list_pvs,
+            lambda: gateway.list_pvcs(namespace),
+            lambda: gateway.list_pods(namespace),
+            gateway.list_nodes,
+            gateway.list_volume_attachments,
+        )
+        # Só pods que ainda montam o volume: um Job concluído não conta como uso
+        volumes, volumes_by_claim, pods_by_claim = index_claims(pvs_items, pods, active_only=True)
+        claims = {(pvc['metadata']['namespace'], pvc['metadata']['name']): pvc for pvc in pvcs_items}
+        node_names = {node['metadata']['name'] for node in nodes}
         
-        # Primeiro, imprime os PVs
-        console.print("\n=== Persistent Volumes ===", style="bold cyan")
-        pvs(detailed)
+        # 1. PVs que não estão em uso, mas continuam existindo (e custando)
+        idle_pvs = [pv for pv in pvs_items if (pv.get('status') or {}).get('phase') in ('Released', 'Available', 'Failed')]
+        idle_pvs.sort(key=lambda pv: parse_quantity(pv['spec'].get('capacity', {}).get('storage')), reverse=True)
         
-        # Em seguida, imprime os PVCs
-        if show_all_ns:
-            console.print("\n=== Persistent Volume Claims (todos os namespaces) ===", style="bold cyan")
-        else:
-            console.print(f"\n=== Persistent Volume Claims (namespace: {namespace}) ===", style="bold cyan")
+        # 2. PVCs que nenhum pod monta
+        unmounted = [pvc for key, pvc in claims.items() if not pods_by_claim.get(key)]
+        unmounted.sort(key=lambda pvc: pvc['metadata']['creationTimestamp'])
+        
+        # 3. VolumeAttachments travados
+        now = datetime.datetime.now(datetime.timezone.utc)
+        stuck = []
+        for attachment in attachments:
+            spec = attachment.get('spec') or {}
+            status = attachment.get('status') or {}
+            pv_name = (spec.get('source') or {}).get('persistentVolumeName')
+            node_name = spec.get('nodeName')
+            age = now - parse_timestamp(attachment['metadata']['creationTimestamp'])
             
-        pvcs(namespace, select=False)  # não queremos selecionar novamente
+            reason = None
+            if status.get('attachError'):
+                reason = f"erro ao anexar: {status['attachError'].get('message', '')}"
+            elif status.get('detachError'):
+                reason = f"erro ao desanexar: {status['detachError'].get('message', '')}"
+            elif node_name not in node_names:
+                reason = "nó inexistente"
+            elif pv_name and pv_name not in volumes:
+                reason = "PV inexistente"
+            elif not status.get('attached') and age.total_seconds() > stuck_after * 60:
+                reason = f"não anexado há {format_age(attachment['metadata']['creationTimestamp'])}"
+            elif status.get('attached') and pv_name and namespace is None:
+                # Anexado a um nó onde nenhum pod usa o volume
+                claim_ref = volumes[pv_name]['spec'].get('claimRef') or {}
+                users = pods_by_claim.get((claim_ref.get('namespace'), claim_ref.get('name')), [])
+                if not any(pod['spec'].get('nodeName') == node_name for pod in users):
+                    reason = "nenhum pod no nó usa o volume"
+            if reason:
+                stuck.append((attachment, pv_name, node_name, reason))
+        
+        if not idle_pvs and not unmounted and not stuck:
+            console.print("✅ Nenhum volume órfão ou VolumeAttachment travado encontrado.", style="bold green")
+            return
+        
+        if idle_pvs:
+            table = Table(show_header=True, header_style="bold magenta")
+            table.add_column("PV", style="cyan")
+            table.add_column("Status", style="yellow")
+            table.add_column("Capacidade", style="bold white", justify="right")
+            table.add_column("StorageClass", style="dim")
+            table.add_column("Reclaim Policy", style="dim")
+            table.add_column("PVC anterior", style="blue")
+            table.add_column("Idade", style="dim")
+            for pv in idle_pvs:
+                claim_ref = pv['spec'].get('claimRef')
+                table.add_row(
+                    pv['metadata']['name'],
+                    pv['status']['phase'],
+                    pv['spec'].get('capacity', {}).get('storage', 'N/A'),
+                    pv['spec'].get('storageClassName', 'N/A'),
+                    pv['spec'].get('persistentVolumeReclaimPolicy', 'N/A'),
+                    f"{claim_ref.get('namespace')}/{claim_ref.get('name')}" if claim_ref else "-",
+                    format_age(pv['metadata']['creationTimestamp']),
+                )
+            total = sum(parse_quantity(pv['spec'].get('capacity', {}).get('storage')) for pv in idle_pvs)
+            console.print(f"\n💸 PVs sem uso ({len(idle_pvs)}, {format_bytes(total)} no total):", style="bold blue")
+            console.print(table)
         
+        if unmounted:
+            table = Table(show_header=True, header_style="bold magenta")
+            table.add_column("Namespace", style="blue")
+            table.add_column("PVC", style="cyan")
+            table.add_column("Status", style="yellow")
+            table.add_column("Volume", style="green")
+            table.add_column("Capacidade", style="bold white", justify="right")
+            table.add_column("StorageClass", style="dim")
+            table.add_column("Idade", style="dim")
+            for pvc in unmounted:
+                pvc_status = pvc.get('status') or {}
+                table.add_row(
+                    pvc['metadata']['namespace'],
+                    pvc['metadata']['name'],
+                    pvc_status.get('phase', 'N/A'),
+                    pvc['spec'].get('volumeName') or "-",
+                    (pvc_status.get('capacity') or {}).get('storage') or pvc['spec']['resources']['requests'].get('storage', 'N/A'),
+                    pvc['spec'].get('storageClassName', 'default'),
+                    format_age(pvc['metadata']['creationTimestamp']),
+                )
+            total = sum(
+                parse_quantity(((pvc.get('status') or {}).get('capacity') or {}).get('storage')
+                                    or pvc['spec']['resources']['requests'].get('storage'))
+                for pvc in unmounted
+            )
+            console.print(f"\n📭 PVCs que nenhum pod monta ({len(unmounted)}, {format_bytes(total)} no total):", style="bold blue")
+            console.print(table)
+        
+        if stuck:
+            table = Table(show_header=True, header_style="bold magenta")
+            table.add_column("VolumeAttachment", style="cyan")
+            table.add_column("PV", style="green")
+            table.add_column("Nó", style="blue")
+            table.add_column("Anexado")
+            table.add_column("Problema", style="red")
+            table.add_column("Idade", style="dim")
+            for attachment, pv_name, node_name, reason in stuck:
+                attached = (attachment.get('status') or {}).get('attached')
+                table.add_row(
+                    attachment['metadata']['name'],
+                    pv_name or "-",
+                    node_name or "-",
+                    "[green]sim[/]" if attached else "[red]não[/]",
+                    reason,
+                    format_age(attachment['metadata']['creationTimestamp']),
+                )
+            console.print(f"\n🔒 VolumeAttachments travados ({len(stuck)}):", style="bold blue")
+            console.print(table)
+            
     except Exception as e:
-        console.print(f"❌ Erro ao analisar armazenamento: {str(e)}", style="bold red") 
\ No newline at end of file
+        console.print(f"❌ Erro ao auditar armazenamento: {str(e)}", style="bold red")
@@ -0,0 +1,70 @@
+import json
+import os
+import sys
+import tempfile
+import time
+
+CACHE_DIR = os.path.expanduser('~/.jera/cache')
+
+def cache_path(name):
+    """Retorna o caminho de um arquivo no cache da Jera CLI, criando o diretório (0700)"""
+    os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+    return os.path.join(CACHE_DIR, name)
+
+def read_json(name):
+    """Lê um arquivo JSON do cache; retorna None se não existir ou estiver corrompido"""
+    path = cache_path(name)
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_json(name, data):
+    """Grava um arquivo JSON no cache de forma atômica e com permissão 0600"""
+    path = cache_path(name)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, prefix='.tmp-')
+    try:
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return path
+
+def spawn_refresh(lock_name, module, *args, timeout=30):
+    """Roda `python -m module args` desanexado para atualizar um cache em segundo plano.
+
+    Um arquivo de trava no cache evita disparar a mesma atualização de novo
+    enquanto ela estiver em andamento (ou por `timeout` segundos, se o processo
+    morrer sem liberar a trava). Retorna True se o processo foi iniciado.
+    """
+    lock_path = cache_path(lock_name)
+    try:
+        if time.time() - os.path.getmtime(lock_path) < timeout:
+            return False
+    except OSError:
+        pass
+    with open(lock_path, 'w'):
+        pass
+
+    import subprocess
+
+    subprocess.Popen(
+        [sys.executable, '-m', module, *args],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+    return True
+
+def release_refresh(lock_name):
+    """Libera a trava de uma atualização em segundo plano"""
+    try:
+        os.unlink(cache_path(lock_name))
+    except OSError:
+        pass
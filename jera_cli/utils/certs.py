@@ -0,0 +1,189 @@
+import asyncio
+import datetime
+import ipaddress
+import ssl
+import time
+from .cache import read_json, write_json
+from .defaults import CERTS_CACHE_TTL
+
+# Handshakes simultâneos no urls --certs
+CERTS_WORKERS = 16
+# Tempo máximo (segundos) de cada handshake
+CERTS_TIMEOUT = 10
+CERTS_CACHE_FILE = 'certs.json'
+
+_NAME_OIDS = {b'\x55\x04\x03': 'CN', b'\x55\x04\x0a': 'O'}
+_SAN_OID = b'\x55\x1d\x11'
+
+# Mensagens de verificação do OpenSSL mais comuns
+_VERIFY_ERRORS = (
+    ('certificate has expired', "expirado"),
+    ('Hostname mismatch', "não vale para o host"),
+    ('self-signed', "autoassinado"),
+    ('self signed', "autoassinado"),
+    ('unable to get local issuer', "cadeia incompleta"),
+    ('not yet valid', "ainda não válido"),
+)
+
+def _der_items(data):
+    """Percorre os elementos DER de `data`, gerando (tag, conteúdo).
+
+    Comprimentos acima de 127 bytes vêm na forma longa (0x81, 0x82...);
+    um elemento que passa do fim dos dados gera ValueError.
+    """
+    pos = 0
+    while pos < len(data):
+        if pos + 2 > len(data):
+            raise ValueError("DER truncado")
+        tag, length = data[pos], data[pos + 1]
+        pos += 2
+        if length & 0x80:
+            size = length & 0x7f
+            if not size or pos + size > len(data):
+                raise ValueError("DER com comprimento inválido")
+            length = int.from_bytes(data[pos:pos + size], 'big')
+            pos += size
+        if pos + length > len(data):
+            raise ValueError("DER truncado")
+        yield tag, data[pos:pos + length]
+        pos += length
+
+def _der_time(tag, value):
+    text = value.decode('ascii')
+    if tag == 0x17:  # UTCTime: ano com dois dígitos, 50-99 é 19xx (RFC 5280)
+        moment = datetime.datetime.strptime(text, '%y%m%d%H%M%SZ')
+        if int(text[:2]) >= 50:
+            moment = moment.replace(year=1900 + int(text[:2]))
+    else:  # GeneralizedTime
+        moment = datetime.datetime.strptime(text, '%Y%m%d%H%M%SZ')
+    return moment.replace(tzinfo=datetime.timezone.utc).timestamp()
+
+def _der_name(data):
+    attributes = {}
+    for _, rdn in _der_items(data):
+        for _, attribute in _der_items(rdn):
+            (_, oid), (tag, value) = list(_der_items(attribute))[:2]
+            if oid in _NAME_OIDS:
+                attributes[_NAME_OIDS[oid]] = value.decode('utf-16-be' if tag == 0x1e else 'utf-8', 'replace')
+    return attributes
+
+def decode_certificate(der):
+    """Extrai emissor, SANs e validade de um certificado X.509 em DER.
+
+    O ssl só devolve os campos do certificado (getpeercert) quando a
+    verificação passou; lendo o DER dá para mostrar também a data de
+    certificados expirados ou não confiáveis.
+    """
+    certificate = next(_der_items(der))[1]
+    fields = list(_der_items(next(_der_items(certificate))[1]))
+    if fields[0][0] == 0xa0:  # versão explícita
+        fields = fields[1:]
+    issuer, validity, subject = fields[2], fields[3], fields[4]
+
+    not_before, not_after = (_der_time(tag, value) for tag, value in _der_items(validity[1]))
+    sans = []
+    for tag, extensions in fields[5:]:
+        if tag != 0xa3:
+            continue
+        for _, extension in _der_items(next(_der_items(extensions))[1]):
+            parts = list(_der_items(extension))
+            if parts[0][1] != _SAN_OID:
+                continue
+            for name_tag, value in _der_items(next(_der_items(parts[-1][1]))[1]):
+                if name_tag == 0x82:  # dNSName
+                    sans.append(value.decode('ascii', 'replace'))
+                elif name_tag == 0x87:  # iPAddress
+                    sans.append(str(ipaddress.ip_address(value)))
+
+    issuer_name = _der_name(issuer[1])
+    return {
+        'issuer': issuer_name.get('O') or issuer_name.get('CN'),
+        'subject': _der_name(subject[1]).get('CN'),
+        'sans': sans,
+        'not_before': not_before,
+        'not_after': not_after,
+    }
+
+def _describe_verify_error(error):
+    message = getattr(error, 'verify_message', None) or str(error)
+    for text, description in _VERIFY_ERRORS:
+        if text in message:
+            return description
+    return message
+
+async def _handshake(host, port, context, timeout):
+    """Faz o handshake TLS e retorna o certificado do servidor em DER"""
+    _, writer = await asyncio.wait_for(
+        asyncio.open_connection(host, port, ssl=context, server_hostname=host), timeout
+    )
+    try:
+        return writer.get_extra_info('ssl_object').getpeercert(binary_form=True)
+    finally:
+        writer.close()
+
+async def _check_host(target, semaphore, timeout):
+    from .multicluster import describe_error
+
+    host, _, port = target.partition(':')
+    port = int(port or 443)
+    result = {'host': target, 'checked': time.time(), 'verify_error': None}
+    async with semaphore:
+        try:
+            try:
+                der = await _handshake(host, port, ssl.create_default_context(), timeout)
+            except ssl.SSLCertVerificationError as e:
+                # Repete sem verificar só para ler a validade do certificado recusado
+                result['verify_error'] = _describe_verify_error(e)
+                insecure = ssl.create_default_context()
+                insecure.check_hostname = False
+                insecure.verify_mode = ssl.CERT_NONE
+                der = await _handshake(host, port, insecure, timeout)
+        except Exception as e:
+            result['error'] = describe_error(e)
+            return result
+    try:
+        result.update(decode_certificate(der))
+    except Exception:
+        # Um certificado que o decodificador não entende vira erro só deste host
+        result['error'] = "certificado ilegível"
+    return result
+
+async def _check_all(targets, workers, timeout):
+    semaphore = asyncio.Semaphore(workers)
+    return await asyncio.gather(*(_check_host(target, semaphore, timeout) for target in targets))
+
+def check_certificates(hosts, cache_ttl=CERTS_CACHE_TTL, workers=CERTS_WORKERS, timeout=CERTS_TIMEOUT):
+    """Lê o certificado TLS de cada host (host ou host:porta) com handshakes simultâneos.
+
+    Hosts verificados há menos de `cache_ttl` segundos vêm de
+    ~/.jera/cache/certs.json sem abrir conexão; falhas não ficam em cache.
+    Retorna {host: resultado}, com issuer, subject, sans, not_before e
+    not_after (epoch), verify_error (certificado recusado) ou error.
+    """
+    hosts = list(dict.fromkeys(hosts))
+    cache = (read_json(CERTS_CACHE_FILE) or {}) if cache_ttl > 0 else {}
+    now = time.time()
+
+    results = {}
+    for host in hosts:
+        cached = cache.get(host)
+        if cached and now - cached.get('checked', 0) < cache_ttl:
+            results[host] = cached
+
+    pending = [host for host in hosts if host not in results]
+    if pending:
+        for result in asyncio.run(_check_all(pending, workers, timeout)):
+            results[result['host']] = result
+            if 'error' not in result:
+                cache[result['host']] = result
+        if cache_ttl > 0:
+            write_json(CERTS_CACHE_FILE, {
+                host: entry for host, entry in cache.items() if now - entry.get('checked', 0) < cache_ttl
+            })
+    return results
+
+def days_left(result):
+    """Dias até o vencimento do certificado (negativo se já venceu), ou None"""
+    if result.get('not_after') is None:
+        return None
+    return (result['not_after'] - time.time()) / 86400
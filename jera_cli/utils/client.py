@@ -0,0 +1,83 @@
+import threading
+from .kubeconfig import build_kubeconfig, get_kubeconfig_paths, load_kubeconfig
+
+# Tamanho do pool de conexões HTTP de cada cliente. Precisa cobrir as
+# requisições concorrentes dos comandos que fazem fan-out (métricas, storage...)
+POOL_MAXSIZE = 32
+
+_lock = threading.Lock()
+_api_clients = {}
+
+def get_api_client(context=None):
+    """Retorna o ApiClient compartilhado para o contexto do kubeconfig.
+
+    O kubeconfig é lido uma única vez por processo e contexto; as chamadas
+    seguintes reutilizam o mesmo cliente e o mesmo pool de conexões keep-alive.
+    Com context=None usa o contexto atual do kubeconfig. O cache é indexado
+    pelo nome do contexto e pelos arquivos de kubeconfig, então processos
+    longos (daemon, shell) acompanham trocas de contexto.
+
+    Para usuários com plugin exec (aws eks get-token, kubelogin) o token vem
+    do cache em ~/.jera/cache e é renovado pelo hook só perto de expirar,
+    em vez de executar o plugin a cada processo.
+    """
+    key = (tuple(get_kubeconfig_paths()), context or load_kubeconfig().get('current-context'))
+
+    with _lock:
+        api_client = _api_clients.get(key)
+        if api_client is not None:
+            return api_client
+
+        from kubernetes import client, config
+        from .credentials import get_token_kubeconfig, make_refresh_hook
+
+        configuration = client.Configuration()
+        kubeconfig, resolved = get_token_kubeconfig(context)
+        if kubeconfig:
+            config.load_kube_config_from_dict(
+                kubeconfig,
+                context=resolved['name'],
+                client_configuration=configuration
+            )
+            configuration.refresh_api_key_hook = make_refresh_hook(resolved)
+        else:
+            try:
+                config.load_kube_config(
+                    context=resolved['name'] if resolved else context,
+                    client_configuration=configuration
+                )
+            except config.ConfigException:
+                # Contexto que só existe nos clusters guardados em ~/.jera/config
+                if not resolved:
+                    raise
+                config.load_kube_config_from_dict(
+                    build_kubeconfig(resolved),
+                    context=resolved['name'],
+                    client_configuration=configuration
+                )
+        configuration.connection_pool_maxsize = POOL_MAXSIZE
+
+        api_client = client.ApiClient(configuration)
+        _api_clients[key] = api_client
+        return api_client
+
+def list_api_clients():
+    """Retorna os contextos que já têm um cliente aquecido neste processo"""
+    with _lock:
+        return sorted({context for _, context in _api_clients if context})
+
+def get_core_v1_api(context=None):
+    """Retorna um CoreV1Api usando o cliente compartilhado"""
+    from kubernetes import client
+
+    return client.CoreV1Api(get_api_client(context))
+
+def reset_api_clients():
+    """Descarta os clientes em cache (ex.: após trocar de cluster no modo shell)"""
+    with _lock:
+        for api_client in _api_clients.values():
+            try:
+                api_client.close()
+            except Exception:
+                pass
+        _api_clients.clear()
@@ -0,0 +1,120 @@
+import hashlib
+import os
+import sys
+import time
+from .cache import cache_path, read_json, write_json, spawn_refresh, release_refresh
+from .config_store import load_config
+
+# Tempo máximo (segundos) da verificação de conexão feita em segundo plano
+PROBE_TIMEOUT = 10
+
+def remember_cluster(config_data, cluster_type, **info):
+    """Guarda em config_data o contexto que o AWS/Azure CLI acabou de gravar no kubeconfig.
+
+    O endpoint, o CA e o método de autenticação do cluster ficam em
+    config_data['clusters'], indexados pelo nome do contexto, junto com
+    `info` (name, region, profile / resource_group, subscription). Na próxima
+    troca para o mesmo cluster basta apontar para o contexto guardado, sem
+    rodar o update-kubeconfig/get-credentials. Retorna o nome do contexto.
+    """
+    from .kubeconfig import load_kubeconfig, resolve_context
+
+    kubeconfig = load_kubeconfig()
+    context = kubeconfig.get('file-current-context')
+    resolved = resolve_context(context, kubeconfig)
+    if not resolved:
+        return None
+
+    config_data.setdefault('clusters', {})[context] = dict(
+        info,
+        type=cluster_type,
+        cluster_name=resolved['cluster_name'],
+        cluster=resolved['cluster'],
+        user_name=resolved['user_name'],
+        user=resolved['user'],
+        context=resolved['context'],
+        saved=time.time(),
+    )
+    config_data['current_context'] = context
+    config_data['kubeconfig_context'] = context
+    # Credenciais renovadas: a falha da verificação anterior não vale mais
+    try:
+        os.unlink(cache_path(_liveness_name(context)))
+    except OSError:
+        pass
+    return context
+
+def find_known_clusters(cluster_type, **match):
+    """Retorna [(contexto, dados)] dos clusters guardados que batem com os valores informados"""
+    found = []
+    for context, stored in (load_config().get('clusters') or {}).items():
+        if stored.get('type') != cluster_type:
+            continue
+        if all(stored.get(field) == value for field, value in match.items() if value is not None):
+            found.append((context, stored))
+    return found
+
+def use_known_cluster(config_data, context):
+    """Aponta config_data para um contexto guardado, sem tocar no kubeconfig"""
+    from .kubeconfig import load_kubeconfig
+
+    config_data['current_context'] = context
+    config_data['kubeconfig_context'] = load_kubeconfig().get('file-current-context')
+
+def _liveness_name(context):
+    return f"liveness-{hashlib.sha256(context.encode()).hexdigest()[:16]}.json"
+
+def get_liveness(context):
+    """Resultado da última verificação de conexão do contexto ({'ok', 'checked', ...}) ou None"""
+    return read_json(_liveness_name(context))
+
+def probe_in_background(context):
+    """Verifica em um processo separado se o cluster responde (GET /version)"""
+    return spawn_refresh(_liveness_name(context) + '.lock', 'jera_cli.utils.cluster_store', context,
+                         timeout=PROBE_TIMEOUT * 3)
+
+def probe_cluster(context, timeout=PROBE_TIMEOUT):
+    """Faz o GET /version no contexto e grava o resultado no cache.
+
+    Retorna {'ok', 'version' ou 'error', 'seconds', 'context', 'checked'};
+    `seconds` mede só a requisição, sem a criação do cliente e do token.
+    """
+    from . import gateway
+    from .client import get_api_client
+    from .multicluster import describe_error
+
+    start = None
+    try:
+        get_api_client(context)
+        start = time.perf_counter()
+        version = gateway.request('/version', context=context, timeout=timeout)
+        result = {'ok': True, 'version': version.get('gitVersion')}
+    except Exception as e:
+        result = {'ok': False, 'status': getattr(e, 'status', None), 'error': describe_error(e)}
+    result.update(
+        context=context,
+        checked=time.time(),
+        seconds=time.perf_counter() - start if start is not None else None,
+    )
+    write_json(_liveness_name(context), result)
+    return result
+
+def probe_clusters(contexts, timeout=PROBE_TIMEOUT):
+    """Verifica vários contextos ao mesmo tempo; retorna {contexto: resultado}.
+
+    Um cluster que não responde (retentativas de conexão, plugin exec
+    travado) não segura a resposta além de `timeout`.
+    """
+    from .multicluster import run_per_context
+
+    results = run_per_context(contexts, lambda context: probe_cluster(context, timeout), timeout)
+    return {
+        context: result or {'ok': False, 'error': error, 'seconds': None}
+        for context, (result, error) in results.items()
+    }
+
+if __name__ == '__main__':
+    try:
+        probe_cluster(sys.argv[1])
+    finally:
+        release_refresh(_liveness_name(sys.argv[1]) + '.lock')
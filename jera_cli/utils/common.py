@@ -1,11 +1,5 @@
-import yaml
-import os
+from .config_store import get_config_value
 
 def load_namespace():
     """Carrega o namespace salvo na configuração"""
-    config_path = os.path.expanduser('~/.jera/config')
-    if os.path.exists(config_path):
-        with open(config_path) as f:
-            config_data = yaml.safe_load(f) or {}
-            return config_data.get('namespace')
-    return None 
\ No newline at end of file
+    return get_config_value('namespace')
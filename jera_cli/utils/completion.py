@@ -0,0 +1,139 @@
+import hashlib
+import os
+import sys
+import time
+from .cache import read_json, write_json, spawn_refresh, release_refresh
+
+# Este módulo roda a cada Tab: no topo só a biblioteca padrão e o cache.
+# Os comandos que usam os callbacks também não importam o rich no topo
+# (veja utils/console.py), senão o import dele domina o tempo do Tab.
+
+# Idade máxima (segundos) dos nomes em cache antes de disparar uma atualização
+NAMES_TTL = 60
+# Tempo (segundos) em que uma atualização em andamento impede outra do mesmo recurso
+REFRESH_TIMEOUT = 30
+
+def _stat_key(paths):
+    """Identifica o estado dos arquivos pelo mtime e tamanho, sem lê-los"""
+    key = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            key.append([path, stat.st_mtime_ns, stat.st_size])
+        except OSError:
+            key.append([path, None, None])
+    return key
+
+def _cluster_short_name(name):
+    """Nome do cluster como usado no use-cluster (o ARN do EKS vira só o nome)"""
+    return name.rsplit('cluster/', 1)[-1] if name.startswith('arn:') else name
+
+def get_local_state():
+    """Retorna o contexto atual, o namespace salvo e os nomes dos clusters.
+
+    O resultado fica em ~/.jera/cache enquanto o kubeconfig e ~/.jera/config
+    não mudarem, para que o autocompletar não precise importar e rodar o
+    parser de YAML a cada Tab.
+    """
+    from .config_store import CONFIG_PATH
+    from .kubeconfig import get_kubeconfig_paths, load_kubeconfig
+
+    key = _stat_key(get_kubeconfig_paths() + [CONFIG_PATH])
+    state = read_json('completion-state.json')
+    if state and state.get('key') == key:
+        return state
+
+    from .common import load_namespace
+
+    kubeconfig = load_kubeconfig()
+    state = {
+        'key': key,
+        'context': kubeconfig.get('current-context'),
+        'namespace': load_namespace(),
+        'clusters': sorted({_cluster_short_name(c['name']) for c in kubeconfig['clusters'] if c.get('name')}),
+    }
+    write_json('completion-state.json', state)
+    return state
+
+def names_cache_name(kind, context, namespace=None):
+    """Nome do arquivo de cache com os nomes de um recurso em um contexto/namespace"""
+    digest = hashlib.sha256(f"{context}|{kind}|{namespace or ''}".encode()).hexdigest()[:16]
+    return f"names-{kind}-{digest}.json"
+
+def get_cached_names(kind, context, namespace=None):
+    """Retorna os nomes em cache (mesmo vencidos) e agenda a atualização se preciso"""
+    data = read_json(names_cache_name(kind, context, namespace))
+    if not data or time.time() - data.get('updated', 0) > NAMES_TTL:
+        spawn_refresh(
+            names_cache_name(kind, context, namespace) + '.lock',
+            'jera_cli.utils.completion', kind, context or '', namespace or '',
+            timeout=REFRESH_TIMEOUT
+        )
+    return data.get('names', []) if data else []
+
+def refresh_names(kind, context, namespace=None):
+    """Busca os nomes na API e grava no cache (roda no processo de atualização)"""
+    from . import gateway
+
+    name = names_cache_name(kind, context, namespace)
+    # A trava sai mesmo se a API falhar, para a próxima tecla Tab tentar de novo
+    try:
+        if kind == 'pods':
+            items = gateway.list_pods(namespace, context=context)
+        elif kind == 'nodes':
+            items = gateway.list_nodes(context=context)
+        elif kind == 'namespaces':
+            items = gateway.list_namespaces(context=context)
+        else:
+            raise ValueError(f"Recurso desconhecido: {kind}")
+
+        write_json(name, {
+            'updated': time.time(),
+            'names': sorted(item['metadata']['name'] for item in items),
+        })
+    finally:
+        release_refresh(name + '.lock')
+
+def _complete(kind, incomplete, needs_namespace=False):
+    try:
+        state = get_local_state()
+        if not state.get('context') or (needs_namespace and not state.get('namespace')):
+            return []
+        namespace = state['namespace'] if needs_namespace else None
+        names = get_cached_names(kind, state['context'], namespace)
+    except Exception:
+        return []
+    return [name for name in names if name.startswith(incomplete)]
+
+def complete_pods(ctx, param, incomplete):
+    """Completa nomes de pods do namespace atual"""
+    return _complete('pods', incomplete, needs_namespace=True)
+
+def complete_nodes(ctx, param, incomplete):
+    """Completa nomes de nós do cluster atual"""
+    return _complete('nodes', incomplete)
+
+def complete_namespaces(ctx, param, incomplete):
+    """Completa nomes de namespaces do cluster atual"""
+    return _complete('namespaces', incomplete)
+
+def complete_clusters(ctx, param, incomplete):
+    """Completa nomes dos clusters do kubeconfig e dos inventários de clusters EKS e AKS"""
+    try:
+        clusters = set(get_local_state().get('clusters') or [])
+        for inventory_file in ('clusters.json', 'aks-clusters.json'):
+            inventory = read_json(inventory_file) or {}
+            clusters.update(c['name'] for c in inventory.get('clusters') or [])
+    except Exception:
+        return []
+    return sorted(name for name in clusters if name.startswith(incomplete))
+
+def complete_cluster_list(ctx, param, incomplete):
+    """Completa o último nome de uma lista de clusters separada por vírgula (--clusters a,b)"""
+    prefix, _, last = incomplete.rpartition(',')
+    prefix = prefix + ',' if prefix else ''
+    chosen = set(prefix.split(','))
+    return [prefix + name for name in complete_clusters(ctx, param, last) if name not in chosen]
+
+if __name__ == '__main__':
+    refresh_names(sys.argv[1], sys.argv[2] or None, sys.argv[3] if len(sys.argv) > 3 and sys.argv[3] else None)
@@ -0,0 +1,109 @@
+import copy
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem trava consultiva, a escrita continua atômica
+    fcntl = None
+
+CONFIG_DIR = os.path.expanduser('~/.jera')
+CONFIG_PATH = os.path.join(CONFIG_DIR, 'config')
+# A trava fica em um arquivo separado: o rename troca o inode de ~/.jera/config
+LOCK_PATH = os.path.join(CONFIG_DIR, 'config.lock')
+
+_cache = {'key': None, 'data': {}}
+_cache_lock = threading.RLock()
+
+def _yaml():
+    """Retorna (yaml, Loader, Dumper), usando o parser em C (libyaml) se disponível"""
+    import yaml
+
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+    return yaml, loader, dumper
+
+def _stat_key():
+    try:
+        stat = os.stat(CONFIG_PATH)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+@contextmanager
+def _file_lock(exclusive=True):
+    """Trava consultiva (flock) em ~/.jera/config.lock entre processos"""
+    if fcntl is None:
+        yield
+        return
+    os.makedirs(CONFIG_DIR, exist_ok=True)
+    with open(LOCK_PATH, 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+def _read():
+    """Lê o arquivo se ele mudou desde a última leitura (inode, mtime e tamanho)"""
+    key = _stat_key()
+    if key is None:
+        _cache['key'], _cache['data'] = None, {}
+    elif key != _cache['key']:
+        yaml, loader, _ = _yaml()
+        with open(CONFIG_PATH) as f:
+            data = yaml.load(f, Loader=loader) or {}
+        _cache['key'], _cache['data'] = key, data if isinstance(data, dict) else {}
+    return _cache['data']
+
+def load_config():
+    """Retorna uma cópia da configuração da Jera CLI (~/.jera/config).
+
+    O arquivo só é lido e parseado de novo quando muda; como a escrita é
+    atômica, a leitura nunca encontra um arquivo pela metade.
+    """
+    with _cache_lock:
+        return copy.deepcopy(_read())
+
+def get_config_value(key, default=None):
+    """Retorna um valor da configuração sem copiar o restante"""
+    with _cache_lock:
+        return copy.deepcopy(_read().get(key, default))
+
+def _write(data):
+    yaml, _, dumper = _yaml()
+    os.makedirs(CONFIG_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=CONFIG_DIR, prefix='.config-')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            yaml.dump(data, f, Dumper=dumper, default_flow_style=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, CONFIG_PATH)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    _cache['key'], _cache['data'] = _stat_key(), copy.deepcopy(data)
+
+@contextmanager
+def update_config():
+    """Lê, altera e grava a configuração sob a trava exclusiva.
+
+    A configuração é relida dentro da trava, então alterações feitas por
+    outros processos enquanto o comando rodava não são perdidas:
+
+        with update_config() as config:
+            config['namespace'] = 'production'
+    """
+    with _cache_lock, _file_lock():
+        data = copy.deepcopy(_read())
+        yield data
+        _write(data)
+
+def save_config(data):
+    """Grava a configuração inteira de forma atômica (arquivo temporário + rename)"""
+    with _cache_lock, _file_lock():
+        _write(data)
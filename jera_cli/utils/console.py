@@ -0,0 +1,18 @@
+class LazyConsole:
+    """Console do rich criado só no primeiro uso.
+
+    Os módulos de comandos são importados a cada Tab do autocompletar, mas só
+    imprimem ao rodar o comando; importar o rich custa mais que todo o resto
+    do autocompletar. Aceita as mesmas opções do Console (ex.: stderr=True).
+    """
+
+    def __init__(self, **options):
+        self._options = options
+        self._console = None
+
+    def __getattr__(self, name):
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console(**self._options)
+        return getattr(self._console, name)
@@ -0,0 +1,151 @@
+import datetime
+import hashlib
+import json
+import os
+import subprocess
+import threading
+import time
+from .cache import read_json, write_json
+from .kubeconfig import build_kubeconfig, load_kubeconfig, resolve_context
+
+# Tokens a menos de EXPIRY_MARGIN segundos de expirar não são reutilizados
+EXPIRY_MARGIN = 60
+
+_lock = threading.Lock()
+_tokens = {}
+
+def _exec_profile(exec_config):
+    """Obtém o profile usado pelo plugin (AWS_PROFILE no env ou --profile nos args)"""
+    for item in exec_config.get('env') or []:
+        if item.get('name') == 'AWS_PROFILE':
+            return item.get('value')
+
+    args = exec_config.get('args') or []
+    for i, arg in enumerate(args):
+        if arg == '--profile' and i + 1 < len(args):
+            return args[i + 1]
+        if arg.startswith('--profile='):
+            return arg.split('=', 1)[1]
+    return os.environ.get('AWS_PROFILE', 'default')
+
+def _cache_key(cluster_name, exec_config):
+    """Chave do token: cluster + profile (+ comando, para não misturar plugins)"""
+    profile = _exec_profile(exec_config)
+    spec = json.dumps([exec_config.get('command'), exec_config.get('args') or []])
+    digest = hashlib.sha256(f"{cluster_name}|{profile}|{spec}".encode()).hexdigest()[:24]
+    return f"token-{digest}.json", profile
+
+def _parse_expiration(value):
+    """Converte o expirationTimestamp (RFC 3339) em epoch"""
+    if not value:
+        return None
+    value = value.replace('Z', '+00:00')
+    return datetime.datetime.fromisoformat(value).timestamp()
+
+def _run_exec_plugin(exec_config):
+    """Executa o plugin de credenciais (aws eks get-token, kubelogin...) e retorna (token, expira_em)"""
+    env = dict(os.environ)
+    for item in exec_config.get('env') or []:
+        env[item['name']] = item['value']
+    env['KUBERNETES_EXEC_INFO'] = json.dumps({
+        'apiVersion': exec_config.get('apiVersion'),
+        'kind': 'ExecCredential',
+        'spec': {'interactive': False},
+    })
+
+    # stderr não é capturado para que mensagens de login (device code) apareçam
+    result = subprocess.run(
+        [exec_config['command']] + list(exec_config.get('args') or []),
+        stdout=subprocess.PIPE,
+        text=True,
+        env=env,
+        check=True
+    )
+    status = json.loads(result.stdout).get('status') or {}
+    return status.get('token'), _parse_expiration(status.get('expirationTimestamp'))
+
+def get_exec_token(cluster_name, exec_config, force=False):
+    """Retorna (token, expira_em) do plugin exec, usando o cache em ~/.jera/cache.
+
+    O token fica em memória e em disco (0600) até EXPIRY_MARGIN segundos antes
+    de expirar; só então o plugin é executado novamente.
+    """
+    cache_name, profile = _cache_key(cluster_name, exec_config)
+
+    with _lock:
+        now = time.time()
+        if not force:
+            cached = _tokens.get(cache_name) or read_json(cache_name)
+            if cached and cached.get('token') and cached.get('expires_at', 0) - EXPIRY_MARGIN > now:
+                _tokens[cache_name] = cached
+                return cached['token'], cached['expires_at']
+
+        token, expires_at = _run_exec_plugin(exec_config)
+        if not token:
+            return None, None
+
+        # Sem data de expiração o token não é guardado em disco
+        if expires_at:
+            entry = {
+                'cluster': cluster_name,
+                'profile': profile,
+                'token': token,
+                'expires_at': expires_at,
+            }
+            _tokens[cache_name] = entry
+            write_json(cache_name, entry)
+        return token, expires_at
+
+def get_token_kubeconfig(context=None):
+    """Gera um kubeconfig mínimo do contexto usando o token em cache no lugar do plugin exec.
+
+    Retorna (kubeconfig, resolved) ou (None, resolved) quando o usuário do
+    contexto não usa plugin exec ou o plugin não devolve um token.
+    """
+    resolved = resolve_context(context)
+    if not resolved or not resolved['user'].get('exec'):
+        return None, resolved
+
+    try:
+        token, _ = get_exec_token(resolved['cluster_name'], resolved['user']['exec'])
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return None, resolved
+    if not token:
+        return None, resolved
+
+    kubeconfig = build_kubeconfig(resolved, user={'token': token})
+    return kubeconfig, resolved
+
+def make_refresh_hook(resolved):
+    """Cria o hook que renova o token do cliente da API antes de cada requisição"""
+    cluster_name = resolved['cluster_name']
+    exec_config = resolved['user']['exec']
+
+    def refresh(configuration):
+        token, _ = get_exec_token(cluster_name, exec_config)
+        if token:
+            configuration.api_key['authorization'] = f"Bearer {token}"
+
+    return refresh
+
+def kubectl_env(context=None):
+    """Ambiente para chamadas ao kubectl que reaproveita o token em cache.
+
+    Aponta KUBECONFIG para um kubeconfig gerado (0600) com o token, evitando
+    que o kubectl execute o plugin exec a cada chamada. Também gera o
+    kubeconfig quando o contexto não é o current-context do arquivo (cluster
+    escolhido pelo use-cluster sem reescrever o kubeconfig). Retorna None
+    quando o kubectl pode usar o ambiente atual.
+    """
+    kubeconfig, resolved = get_token_kubeconfig(context)
+    if not kubeconfig:
+        if not resolved or resolved['name'] == load_kubeconfig().get('file-current-context'):
+            return None
+        kubeconfig = build_kubeconfig(resolved)
+
+    digest = hashlib.sha256(resolved['name'].encode()).hexdigest()[:24]
+    path = write_json(f"kubeconfig-{digest}.json", kubeconfig)
+
+    env = dict(os.environ)
+    env['KUBECONFIG'] = path
+    return env
@@ -0,0 +1,286 @@
+import os
+import sys
+
+JERA_DIR = os.path.expanduser('~/.jera')
+SOCKET_PATH = os.path.join(JERA_DIR, 'daemon.sock')
+PID_PATH = os.path.join(JERA_DIR, 'daemon.pid')
+LOG_PATH = os.path.join(JERA_DIR, 'daemon.log')
+
+# O daemon encerra sozinho depois de IDLE_TIMEOUT segundos sem requisições
+IDLE_TIMEOUT = 30 * 60
+# Validade (segundos) das respostas da API em cache no daemon
+DEFAULT_CACHE_TTL = 5
+# Tempo máximo para conectar ao socket antes de cair para o modo direto
+CONNECT_TIMEOUT = 0.5
+
+# Comandos de leitura, não interativos, que podem ser atendidos pelo daemon
+DAEMON_COMMANDS = {
+    'pods', 'pods-by-node', 'describe', 'nodes', 'describe-node', 'node-metrics',
+    'pod-metrics', 'all-metrics', 'namespaces', 'urls', 'loadbalancer', 'lb',
+    'pvs', 'pvcs', 'storage',
+}
+# Comandos que abrem uma seleção interativa quando chamados sem argumento
+NEEDS_ARGUMENT = {'describe', 'describe-node', 'pod-metrics'}
+# Opções que tornam o comando interativo (seleção, watch)
+INTERACTIVE_OPTIONS = {'-w', '--watch', '-s', '--select', '--help'}
+# Com -o json/ndjson/csv a saída é escrita registro a registro; pelo daemon só chegaria no fim
+OUTPUT_OPTIONS = ('-o', '--output')
+# Variáveis de ambiente do cliente aplicadas ao executar o comando no daemon
+FORWARDED_ENV = ('KUBECONFIG', 'AWS_PROFILE', 'JERA_API_TRACE')
+
+def should_use_daemon(args):
+    """Indica se o comando pode ser enviado ao daemon em vez de rodar neste processo"""
+    if os.environ.get('JERA_NO_DAEMON') or not args:
+        return False
+    name = args[0]
+    if name not in DAEMON_COMMANDS:
+        return False
+    if any(arg in INTERACTIVE_OPTIONS for arg in args[1:]):
+        return False
+    if any(arg.startswith(OUTPUT_OPTIONS) for arg in args[1:]):
+        return False
+    if name in NEEDS_ARGUMENT and not any(not arg.startswith('-') for arg in args[1:]):
+        return False
+    return os.path.exists(SOCKET_PATH)
+
+def send_request(payload, timeout=None):
+    """Envia uma requisição ao daemon e retorna a resposta (dict) ou None se ele não responder"""
+    import json
+    import socket
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(SOCKET_PATH)
+        sock.settimeout(timeout)
+        sock.sendall(json.dumps(payload).encode() + b'\n')
+        with sock.makefile('rb') as f:
+            line = f.readline()
+        return json.loads(line) if line else None
+    except (OSError, ValueError):
+        return None
+    finally:
+        sock.close()
+
+def run_in_daemon(args):
+    """Executa o comando no daemon e retorna o exit code, ou None para cair no modo direto"""
+    try:
+        width = os.get_terminal_size(sys.stdout.fileno()).columns
+    except (OSError, ValueError, AttributeError):
+        width = int(os.environ.get('COLUMNS', '80')) if os.environ.get('COLUMNS', '').isdigit() else 80
+
+    response = send_request({
+        'action': 'run',
+        'argv': list(args),
+        'env': {k: os.environ[k] for k in FORWARDED_ENV if k in os.environ},
+        'width': width,
+        'color': sys.stdout.isatty(),
+    })
+    if response is None or 'exit_code' not in response:
+        return None
+
+    sys.stdout.write(response.get('stdout', ''))
+    sys.stdout.flush()
+    sys.stderr.write(response.get('stderr', ''))
+    return response['exit_code']
+
+def get_status():
+    """Retorna o status do daemon em execução, ou None se não houver daemon"""
+    return send_request({'action': 'status'}, timeout=5)
+
+def start(cache_ttl=DEFAULT_CACHE_TTL, wait=15):
+    """Inicia o daemon em segundo plano e aguarda ele responder; retorna o status ou None"""
+    import subprocess
+    import time
+
+    os.makedirs(JERA_DIR, exist_ok=True)
+    env = dict(os.environ, JERA_NO_DAEMON='1')
+    with open(LOG_PATH, 'ab') as log:
+        subprocess.Popen(
+            [sys.executable, '-m', 'jera_cli', 'daemon', 'run', '--cache-ttl', str(cache_ttl)],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            env=env,
+            start_new_session=True
+        )
+
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        status = get_status()
+        if status:
+            return status
+        time.sleep(0.1)
+    return None
+
+def stop():
+    """Pede ao daemon para encerrar; retorna True se ele estava rodando"""
+    return send_request({'action': 'stop'}, timeout=5) is not None
+
+def _strip_ansi(text):
+    """Remove os códigos de cor quando a saída do cliente não é um terminal"""
+    import re
+
+    return re.sub(r'\x1b\[[0-9;?]*[A-Za-z]', '', text)
+
+def _run_command(cli, argv, env, width, color):
+    """Executa um comando da CLI neste processo capturando stdout e stderr"""
+    import io
+    import traceback
+    from contextlib import redirect_stdout, redirect_stderr
+    import click
+
+    saved = {k: os.environ.get(k) for k in FORWARDED_ENV + ('COLUMNS',)}
+    for k in FORWARDED_ENV:
+        if k in env:
+            os.environ[k] = env[k]
+        else:
+            os.environ.pop(k, None)
+    # Os consoles do rich leem COLUMNS a cada impressão
+    os.environ['COLUMNS'] = str(width)
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code = 0
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                rv = cli.main(args=argv, prog_name='jeracli', standalone_mode=False)
+                if isinstance(rv, int):
+                    exit_code = rv
+            except click.ClickException as e:
+                e.show()
+                exit_code = e.exit_code
+            except click.Abort:
+                print("Aborted!", file=sys.stderr)
+                exit_code = 1
+            except Exception:
+                traceback.print_exc()
+                exit_code = 1
+    finally:
+        for k, v in saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+    out, err = stdout.getvalue(), stderr.getvalue()
+    if not color:
+        out, err = _strip_ansi(out), _strip_ansi(err)
+    return {'exit_code': exit_code, 'stdout': out, 'stderr': err}
+
+def _warm_up(cli):
+    """Importa os comandos e abre a conexão com o cluster atual antes da primeira requisição"""
+    import click
+    import importlib
+    from .client import get_api_client
+
+    # Os comandos só importam o rich ao imprimir (veja utils/console.py); no daemon já fica carregado
+    for module in ('rich.console', 'rich.table', 'rich.live'):
+        importlib.import_module(module)
+    ctx = click.Context(cli)
+    for name in DAEMON_COMMANDS:
+        cli.get_command(ctx, name)
+    try:
+        get_api_client()
+    except Exception as e:
+        print(f"Aviso: não foi possível conectar ao cluster atual: {e}", file=sys.stderr)
+
+def serve(cache_ttl=DEFAULT_CACHE_TTL, idle_timeout=IDLE_TIMEOUT):
+    """Roda o daemon em primeiro plano, atendendo requisições no socket Unix.
+
+    As requisições são atendidas uma por vez: o comando roda neste processo,
+    reaproveitando clientes da API, tokens e respostas em cache, e a saída
+    capturada é devolvida ao cliente.
+    """
+    import json
+    import socket
+    import time
+    from .client import list_api_clients
+    from .gateway import set_cache_ttl, get_request_stats
+    from ..cli import cli
+
+    # Sem COLUMNS fixo os consoles acompanham a largura de cada cliente;
+    # FORCE_COLOR mantém as cores mesmo sem terminal (removidas no envio se preciso)
+    os.environ.pop('COLUMNS', None)
+    os.environ.pop('LINES', None)
+    os.environ['FORCE_COLOR'] = '1'
+    os.environ['JERA_NO_DAEMON'] = '1'
+    set_cache_ttl(cache_ttl)
+
+    os.makedirs(JERA_DIR, exist_ok=True)
+    if os.path.exists(SOCKET_PATH):
+        os.unlink(SOCKET_PATH)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)  # socket acessível apenas pelo usuário (0600)
+    try:
+        server.bind(SOCKET_PATH)
+    finally:
+        os.umask(old_umask)
+    server.listen(16)
+    server.settimeout(60)
+
+    with open(PID_PATH, 'w') as f:
+        f.write(str(os.getpid()))
+
+    _warm_up(cli)
+
+    started = last_request = time.time()
+    requests = 0
+    running = True
+    try:
+        while running:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                if time.time() - last_request > idle_timeout:
+                    break
+                continue
+
+            with conn:
+                conn.settimeout(None)
+                try:
+                    with conn.makefile('rb') as f:
+                        payload = json.loads(f.readline() or b'{}')
+                except (OSError, ValueError):
+                    continue
+
+                action = payload.get('action')
+                if action == 'run':
+                    requests += 1
+                    last_request = time.time()
+                    response = _run_command(
+                        cli,
+                        payload.get('argv') or [],
+                        payload.get('env') or {},
+                        payload.get('width') or 80,
+                        payload.get('color', False)
+                    )
+                elif action == 'status':
+                    api_requests, api_seconds, _ = get_request_stats()
+                    response = {
+                        'pid': os.getpid(),
+                        'uptime': time.time() - started,
+                        'requests': requests,
+                        'contexts': list_api_clients(),
+                        'api_requests': api_requests,
+                        'api_seconds': api_seconds,
+                        'cache_ttl': cache_ttl,
+                    }
+                elif action == 'stop':
+                    running = False
+                    response = {'stopped': True}
+                else:
+                    response = {'error': f"ação desconhecida: {action}"}
+
+                try:
+                    conn.sendall(json.dumps(response).encode() + b'\n')
+                except OSError:
+                    pass
+    finally:
+        server.close()
+        for path in (SOCKET_PATH, PID_PATH):
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
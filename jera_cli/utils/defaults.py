@@ -0,0 +1,8 @@
+# Valores padrão compartilhados entre os comandos e os módulos que os implementam.
+# Este módulo não importa nada, para que a ajuda dos comandos (--help) possa
+# mostrar os padrões sem carregar asyncio, ssl e afins.
+
+# Tempo máximo (segundos) de cada requisição do urls --probe
+URLS_PROBE_TIMEOUT = 10
+# Por quanto tempo (segundos) o certificado de um host fica em cache no urls --certs
+CERTS_CACHE_TTL = 6 * 3600
@@ -0,0 +1,189 @@
+import json
+import os
+import sys
+import threading
+import time
+from .client import get_api_client
+from .kubeconfig import get_kubeconfig_paths, load_kubeconfig
+
+# Estatísticas de todas as requisições feitas pela CLI à API do Kubernetes
+_stats_lock = threading.Lock()
+_stats = []
+
+# Pede à API só os metadados dos objetos (PartialObjectMetadataList), com fallback para a lista completa
+METADATA_ACCEPT = 'application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1,application/json'
+
+# Cache opcional das respostas, ligado por processos longos (daemon, shell)
+_cache_lock = threading.Lock()
+_cache = {}
+_cache_ttl = 0
+
+def set_cache_ttl(seconds):
+    """Liga (seconds > 0) ou desliga o cache das respostas da API neste processo"""
+    global _cache_ttl
+    with _cache_lock:
+        _cache_ttl = seconds
+        _cache.clear()
+
+def clear_cache():
+    """Descarta as respostas em cache"""
+    with _cache_lock:
+        _cache.clear()
+
+def request(path, params=None, context=None, headers=None, timeout=None):
+    """Faz um GET na API do Kubernetes e retorna o JSON como dict.
+
+    Todas as leituras da CLI passam por aqui: a resposta não é convertida nos
+    modelos do cliente kubernetes (os registros são os mesmos do
+    `kubectl get -o json`) e cada requisição é contada e cronometrada.
+    Com JERA_API_TRACE=1 cada requisição é registrada no stderr.
+
+    Com o cache ligado (set_cache_ttl) respostas recentes são reutilizadas;
+    o dict retornado pode ser compartilhado e não deve ser alterado.
+    `timeout` (segundos) limita a conexão e a leitura da resposta.
+    """
+    header_params = {'Accept': 'application/json'}
+    if headers:
+        header_params.update(headers)
+    query = [(k, v) for k, v in (params or {}).items() if v is not None]
+
+    cache_key = None
+    if _cache_ttl:
+        context_name = context or load_kubeconfig().get('current-context')
+        cache_key = (tuple(get_kubeconfig_paths()), context_name, path, tuple(query), tuple(sorted(header_params.items())))
+        with _cache_lock:
+            cached = _cache.get(cache_key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+
+    data = _get(path, query, header_params, context, timeout)
+    if cache_key is not None:
+        with _cache_lock:
+            _cache[cache_key] = (time.monotonic() + _cache_ttl, data)
+    return data
+
+def _get(path, query, header_params, context, timeout=None):
+    """Executa o GET, registrando status e duração nas estatísticas"""
+    api_client = get_api_client(context)
+
+    start = time.perf_counter()
+    status = None
+    try:
+        response = api_client.call_api(
+            path, 'GET',
+            query_params=query,
+            header_params=header_params,
+            auth_settings=['BearerToken'],
+            _preload_content=False,
+            _return_http_data_only=True,
+            _request_timeout=timeout
+        )
+        status = response.status
+        return json.loads(response.data)
+    except Exception as e:
+        status = getattr(e, 'status', None) or type(e).__name__
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        with _stats_lock:
+            _stats.append({'path': path, 'context': context, 'status': status, 'seconds': elapsed})
+        if os.environ.get('JERA_API_TRACE'):
+            print(f"[api] GET {path} {status} {elapsed * 1000:.1f}ms", file=sys.stderr)
+
+def get_request_stats():
+    """Retorna (total de requisições, tempo total em segundos, lista de requisições)"""
+    with _stats_lock:
+        calls = list(_stats)
+    return len(calls), sum(c['seconds'] for c in calls), calls
+
+def reset_request_stats():
+    """Zera as estatísticas de requisições"""
+    with _stats_lock:
+        _stats.clear()
+
+def fetch_concurrently(*fetches):
+    """Executa as leituras (funções sem argumentos) ao mesmo tempo e retorna os resultados na ordem.
+
+    Para montar uma visão com vários recursos do mesmo cluster o tempo total
+    passa a ser o da leitura mais lenta, e não a soma. Erros são propagados.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if len(fetches) < 2:
+        return [fetch() for fetch in fetches]
+    with ThreadPoolExecutor(max_workers=len(fetches)) as executor:
+        futures = [executor.submit(fetch) for fetch in fetches]
+        return [future.result() for future in futures]
+
+def _list(group_path, resource, namespace=None, context=None, headers=None, **params):
+    """Lista um recurso em um namespace (ou em todos, com namespace=None) e retorna os items"""
+    if namespace:
+        path = f"{group_path}/namespaces/{namespace}/{resource}"
+    else:
+        path = f"{group_path}/{resource}"
+    return request(path, params, context, headers).get('items') or []
+
+def list_metadata(group_path, resource, namespace=None, context=None):
+    """Lista só os metadados (nome, namespace, labels...) de um recurso.
+
+    A resposta não traz spec nem status, então é bem menor que a lista
+    completa; serve para contar objetos por namespace.
+    """
+    return _list(group_path, resource, namespace, context, headers={'Accept': METADATA_ACCEPT})
+
+def list_namespaces(context=None):
+    """Lista os namespaces do cluster"""
+    return _list('/api/v1', 'namespaces', context=context)
+
+def list_pods(namespace=None, context=None, field_selector=None, label_selector=None):
+    """Lista os pods de um namespace (ou de todos)"""
+    return _list('/api/v1', 'pods', namespace, context,
+                 fieldSelector=field_selector, labelSelector=label_selector)
+
+def get_pod(name, namespace, context=None):
+    """Obtém um pod pelo nome"""
+    return request(f"/api/v1/namespaces/{namespace}/pods/{name}", context=context)
+
+def list_nodes(context=None):
+    """Lista os nós do cluster"""
+    return _list('/api/v1', 'nodes', context=context)
+
+def list_events(namespace=None, context=None, field_selector=None):
+    """Lista os eventos de um namespace (ou de todos)"""
+    return _list('/api/v1', 'events', namespace, context, fieldSelector=field_selector)
+
+def list_pvcs(namespace=None, context=None):
+    """Lista os Persistent Volume Claims de um namespace (ou de todos)"""
+    return _list('/api/v1', 'persistentvolumeclaims', namespace, context)
+
+def list_pvs(context=None):
+    """Lista os Persistent Volumes do cluster"""
+    return _list('/api/v1', 'persistentvolumes', context=context)
+
+def list_volume_attachments(context=None):
+    """Lista os VolumeAttachments do cluster (volumes CSI anexados aos nós)"""
+    return _list('/apis/storage.k8s.io/v1', 'volumeattachments', context=context)
+
+def list_services(namespace=None, context=None):
+    """Lista os Services de um namespace (ou de todos)"""
+    return _list('/api/v1', 'services', namespace, context)
+
+def list_endpoint_slices(namespace=None, context=None):
+    """Lista as EndpointSlices de um namespace (ou de todos)"""
+    return _list('/apis/discovery.k8s.io/v1', 'endpointslices', namespace, context)
+
+def list_ingresses(namespace=None, context=None):
+    """Lista os Ingresses de um namespace (ou de todos)"""
+    return _list('/apis/networking.k8s.io/v1', 'ingresses', namespace, context)
+
+def get_node_stats_summary(node_name, context=None, timeout=None):
+    """Lê o stats/summary do kubelet de um nó pelo proxy da API (uso de volumes, inodes...)"""
+    return request(f"/api/v1/nodes/{node_name}/proxy/stats/summary", context=context, timeout=timeout)
+
+def list_node_metrics(context=None):
+    """Lista as métricas de uso dos nós (metrics.k8s.io, o mesmo que `kubectl top nodes`)"""
+    return _list('/apis/metrics.k8s.io/v1beta1', 'nodes', context=context)
+
+def list_pod_metrics(namespace=None, context=None):
+    """Lista as métricas de uso dos pods (metrics.k8s.io, o mesmo que `kubectl top pods`)"""
+    return _list('/apis/metrics.k8s.io/v1beta1', 'pods', namespace, context)
@@ -0,0 +1,256 @@
+import asyncio
+import math
+import ssl
+import time
+from urllib.parse import urlsplit
+from .defaults import URLS_PROBE_TIMEOUT
+
+# Tempo máximo (segundos) de cada requisição do urls --probe
+PROBE_TIMEOUT = URLS_PROBE_TIMEOUT
+# Requisições simultâneas no total e por host
+MAX_CONCURRENCY = 32
+PER_HOST_LIMIT = 4
+# Corpo máximo lido de uma resposta GET; acima disso a conexão é descartada
+MAX_BODY = 1024 * 1024
+
+class _Protocol(asyncio.Protocol):
+    """Entrega os bytes recebidos a um StreamReader e continua valendo após o start_tls"""
+
+    def __init__(self):
+        self.reader = asyncio.StreamReader()
+        self.closed = False
+
+    def data_received(self, data):
+        self.reader.feed_data(data)
+
+    def eof_received(self):
+        self.reader.feed_eof()
+
+    def connection_lost(self, exc):
+        self.closed = True
+        if exc:
+            self.reader.set_exception(exc)
+        else:
+            self.reader.feed_eof()
+
+class _Pool:
+    """Conexões keep-alive ociosas por (esquema, host, porta) e limites de concorrência"""
+
+    def __init__(self, ssl_context, per_host=PER_HOST_LIMIT, total=MAX_CONCURRENCY):
+        self.ssl_context = ssl_context
+        self.per_host = per_host
+        self.total = asyncio.Semaphore(total)
+        self.limits = {}
+        self.idle = {}
+
+    def limit(self, key):
+        if key not in self.limits:
+            self.limits[key] = asyncio.Semaphore(self.per_host)
+        return self.limits[key]
+
+    def take(self, key):
+        idle = self.idle.get(key) or []
+        while idle:
+            transport, protocol = idle.pop()
+            if not protocol.closed and not transport.is_closing():
+                return transport, protocol
+        return None
+
+    def give(self, key, connection):
+        self.idle.setdefault(key, []).append(connection)
+
+    def close(self):
+        for connections in self.idle.values():
+            for transport, _ in connections:
+                transport.close()
+        self.idle.clear()
+
+def _target(url):
+    """Retorna ((esquema, host, porta), valor do Host, caminho) de uma URL"""
+    parts = urlsplit(url)
+    scheme = parts.scheme or 'https'
+    port = parts.port or (443 if scheme == 'https' else 80)
+    path = parts.path or '/'
+    if parts.query:
+        path += '?' + parts.query
+    return (scheme, parts.hostname, port), parts.netloc.rpartition('@')[2], path
+
+async def _connect(pool, key, timings):
+    scheme, host, port = key
+    loop = asyncio.get_running_loop()
+
+    start = time.perf_counter()
+    transport, protocol = await loop.create_connection(_Protocol, host, port)
+    timings['connect'] = (time.perf_counter() - start) * 1000
+
+    if scheme == 'https':
+        start = time.perf_counter()
+        try:
+            transport = await loop.start_tls(transport, protocol, pool.ssl_context, server_hostname=host)
+        except BaseException:
+            transport.close()
+            raise
+        timings['tls'] = (time.perf_counter() - start) * 1000
+    return transport, protocol
+
+async def _read_response(reader, method):
+    """Lê a resposta; retorna (status, instante do primeiro byte, conexão reaproveitável)"""
+    status_line = await reader.readline()
+    first_byte = time.perf_counter()
+    if not status_line:
+        raise ConnectionError("conexão fechada pelo servidor")
+
+    version, status = status_line.decode('latin-1').split(None, 2)[:2]
+    status = int(status)
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+    if method == 'HEAD' or status in (204, 304):
+        return status, first_byte, keep_alive
+
+    # O corpo precisa ser lido até o fim para a conexão voltar ao pool
+    if 'chunked' in headers.get('transfer-encoding', '').lower():
+        read = 0
+        while True:
+            size = int((await reader.readline()).split(b';')[0].strip() or b'0', 16)
+            if size == 0:
+                while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    pass
+                break
+            read += size
+            if read > MAX_BODY:
+                return status, first_byte, False
+            await reader.readexactly(size + 2)
+    elif 'content-length' in headers:
+        length = int(headers['content-length'])
+        if length > MAX_BODY:
+            return status, first_byte, False
+        await reader.readexactly(length)
+    else:
+        read = 0
+        while read <= MAX_BODY:
+            chunk = await reader.read(65536)
+            if not chunk:
+                break
+            read += len(chunk)
+        keep_alive = False
+    return status, first_byte, keep_alive
+
+async def _request(pool, url, method, timings):
+    """Faz uma requisição reaproveitando uma conexão do pool quando houver.
+
+    Se a conexão reaproveitada tiver sido fechada pelo servidor enquanto
+    estava ociosa, tenta de novo uma única vez com uma conexão nova.
+    """
+    key, host_header, path = _target(url)
+    request = (
+        f"{method} {path} HTTP/1.1\r\n"
+        f"Host: {host_header}\r\n"
+        "User-Agent: jera-cli\r\n"
+        "Accept: */*\r\n"
+        "\r\n"
+    ).encode('latin-1')
+
+    for attempt in range(2):
+        connection = pool.take(key) if attempt == 0 else None
+        reused = connection is not None
+        if connection is None:
+            connection = await _connect(pool, key, timings)
+        transport, protocol = connection
+
+        try:
+            sent = time.perf_counter()
+            transport.write(request)
+            status, first_byte, keep_alive = await _read_response(protocol.reader, method)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            transport.close()
+            if reused:
+                continue
+            raise
+        except BaseException:
+            transport.close()
+            raise
+
+        timings['ttfb'] = (first_byte - sent) * 1000
+        if keep_alive:
+            pool.give(key, connection)
+        else:
+            transport.close()
+        return status
+
+async def _probe_once(pool, url, timeout):
+    from .multicluster import describe_error
+
+    timings = {'connect': None, 'tls': None, 'ttfb': None}
+    key = _target(url)[0]
+    async with pool.total, pool.limit(key):
+        start = time.perf_counter()
+        try:
+            status = await asyncio.wait_for(_request(pool, url, 'HEAD', timings), timeout)
+            if status in (405, 501):
+                # Servidor não aceita HEAD: repete com GET
+                status = await asyncio.wait_for(_request(pool, url, 'GET', timings), timeout)
+        except Exception as e:
+            return {'ok': False, 'error': describe_error(e)}
+        timings.update(ok=True, status=status, total=(time.perf_counter() - start) * 1000)
+        return timings
+
+async def _probe_all(urls, repeat, timeout, verify, per_host):
+    ssl_context = ssl.create_default_context()
+    if not verify:
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+
+    pool = _Pool(ssl_context, per_host)
+    samples = {url: [] for url in urls}
+    try:
+        # As rodadas são sequenciais para que as seguintes reaproveitem as conexões
+        for _ in range(repeat):
+            results = await asyncio.gather(*(_probe_once(pool, url, timeout) for url in urls))
+            for url, result in zip(urls, results):
+                samples[url].append(result)
+    finally:
+        pool.close()
+    return samples
+
+def percentile(values, pct):
+    """Percentil pelo método nearest-rank (p50 de [1, 2, 3, 4] é 2)"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+def probe_urls(urls, repeat=1, timeout=PROBE_TIMEOUT, verify=True, per_host=PER_HOST_LIMIT):
+    """Faz HEAD (ou GET, se o HEAD for recusado) em todas as URLs ao mesmo tempo.
+
+    Usa asyncio com conexões keep-alive reaproveitadas e no máximo
+    `per_host` requisições simultâneas por host. Com repeat > 1 faz várias
+    rodadas. Retorna {url: resumo}, com os tempos em milissegundos:
+    'statuses', 'errors', 'error' (último erro), 'tls' (handshake da
+    primeira conexão), 'ttfb' (mediana, do envio ao primeiro byte da
+    resposta), 'total' (mediana) e 'total_p95'.
+    """
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return {}
+    samples = asyncio.run(_probe_all(urls, repeat, timeout, verify, per_host))
+
+    summary = {}
+    for url, results in samples.items():
+        ok = [r for r in results if r['ok']]
+        errors = [r['error'] for r in results if not r['ok']]
+        handshakes = [r['tls'] for r in ok if r['tls'] is not None]
+        summary[url] = {
+            'statuses': sorted({r['status'] for r in ok}),
+            'errors': len(errors),
+            'error': errors[-1] if errors else None,
+            'tls': handshakes[0] if handshakes else None,
+            'ttfb': percentile([r['ttfb'] for r in ok], 50) if ok else None,
+            'total': percentile([r['total'] for r in ok], 50) if ok else None,
+            'total_p95': percentile([r['total'] for r in ok], 95) if ok else None,
+        }
+    return summary
@@ -0,0 +1,228 @@
+import os
+import time
+from .cache import read_json, write_json, spawn_refresh, release_refresh
+
+INVENTORY_FILE = 'clusters.json'
+AKS_INVENTORY_FILE = 'aks-clusters.json'
+# Idade máxima (segundos) do inventário antes de atualizá-lo em segundo plano
+INVENTORY_TTL = 60 * 60
+# Regiões consultadas além das configuradas nos profiles (JERA_EKS_REGIONS sobrescreve, separadas por vírgula)
+DEFAULT_EKS_REGIONS = ('us-east-1', 'us-east-2', 'us-west-2', 'sa-east-1')
+# Número máximo de `aws eks list-clusters` rodando ao mesmo tempo
+INVENTORY_WORKERS = 16
+# Tempo máximo (segundos) de cada `aws eks list-clusters` / `az aks list`
+LIST_CLUSTERS_TIMEOUT = 20
+# Consulta do Azure Resource Graph que lista os AKS de todas as assinaturas de uma vez
+AKS_GRAPH_QUERY = (
+    "Resources | where type =~ 'microsoft.containerservice/managedclusters' "
+    "| project name, resourceGroup, location, subscriptionId"
+)
+
+def get_eks_regions(profiles_config=None):
+    """Regiões a consultar: JERA_EKS_REGIONS, ou as padrão mais as regiões dos profiles"""
+    env_regions = os.environ.get('JERA_EKS_REGIONS')
+    if env_regions:
+        return [r.strip() for r in env_regions.split(',') if r.strip()]
+
+    regions = list(DEFAULT_EKS_REGIONS)
+    for profile_config in (profiles_config or {}).values():
+        region = profile_config.get('region')
+        if region and region not in regions:
+            regions.append(region)
+    return regions
+
+def _list_clusters(profile, region):
+    """Lista os clusters EKS de um profile em uma região; retorna (nomes, erro)"""
+    import json
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            ["aws", "eks", "list-clusters", "--region", region, "--profile", profile, "--output", "json"],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            timeout=LIST_CLUSTERS_TIMEOUT
+        )
+    except subprocess.TimeoutExpired:
+        return [], f"timeout após {LIST_CLUSTERS_TIMEOUT}s"
+    except OSError as e:
+        return [], str(e)
+
+    if result.returncode != 0:
+        return [], result.stderr.strip().splitlines()[-1] if result.stderr.strip() else f"código {result.returncode}"
+    try:
+        return json.loads(result.stdout).get('clusters', []), None
+    except ValueError:
+        return [], "resposta inválida do AWS CLI"
+
+def build_eks_inventory(profiles=None, regions=None):
+    """Consulta todos os profiles × regiões em paralelo e grava o inventário em ~/.jera/cache.
+
+    Cada cluster aparece uma vez por conta e região (o primeiro profile com
+    acesso vence). Se todas as consultas falharem o inventário anterior é
+    mantido. Retorna o inventário: {'updated', 'clusters', 'errors'}.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from .kubernetes import read_aws_config, get_aws_profiles
+
+    profiles_config, _ = read_aws_config()
+    profiles = profiles or get_aws_profiles()
+    regions = regions or get_eks_regions(profiles_config)
+    combos = [(profile, region) for profile in profiles for region in regions]
+
+    with ThreadPoolExecutor(max_workers=INVENTORY_WORKERS) as executor:
+        results = list(executor.map(lambda combo: (combo, _list_clusters(*combo)), combos))
+
+    clusters, errors, seen = [], [], set()
+    for (profile, region), (names, error) in results:
+        if error:
+            errors.append({'profile': profile, 'region': region, 'error': error})
+            continue
+        account = profiles_config.get(profile, {}).get('sso_account_id') or profile
+        for name in names:
+            if (account, region, name) in seen:
+                continue
+            seen.add((account, region, name))
+            clusters.append({'name': name, 'region': region, 'profile': profile, 'account': account})
+
+    clusters.sort(key=lambda c: (c['name'], c['region'], c['profile']))
+    inventory = {'updated': time.time(), 'clusters': clusters, 'errors': errors}
+    if clusters or not errors:
+        write_json(INVENTORY_FILE, inventory)
+    return inventory
+
+def _az_json(args, timeout=LIST_CLUSTERS_TIMEOUT):
+    """Executa um comando do Azure CLI com saída JSON; retorna (dados, erro)"""
+    import json
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            ["az", *args, "-o", "json", "--only-show-errors"],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            # Sem a extensão, o az perguntaria se deve instalá-la e ficaria parado até o timeout
+            env=dict(os.environ, AZURE_EXTENSION_USE_DYNAMIC_INSTALL='no')
+        )
+    except subprocess.TimeoutExpired:
+        return None, f"timeout após {timeout}s"
+    except OSError as e:
+        return None, str(e)
+
+    if result.returncode != 0:
+        return None, result.stderr.strip().splitlines()[-1] if result.stderr.strip() else f"código {result.returncode}"
+    try:
+        return json.loads(result.stdout), None
+    except ValueError:
+        return None, "resposta inválida do Azure CLI"
+
+def build_aks_inventory():
+    """Lista os clusters AKS de todas as assinaturas e grava o inventário em ~/.jera/cache.
+
+    Usa uma única consulta ao Azure Resource Graph (extensão resource-graph do
+    az) quando disponível; senão roda `az aks list` em todas as assinaturas em
+    paralelo. Retorna o inventário: {'updated', 'clusters', 'errors',
+    'warnings'}; `warnings` explica por que o Resource Graph não foi usado.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=INVENTORY_WORKERS) as executor:
+        accounts_future = executor.submit(
+            _az_json, ["account", "list", "--query", "[?state=='Enabled'].{id:id, name:name}"]
+        )
+        graph_future = executor.submit(
+            _az_json, ["graph", "query", "-q", AKS_GRAPH_QUERY, "--first", "1000"]
+        )
+        accounts, accounts_error = accounts_future.result()
+        graph, graph_error = graph_future.result()
+
+        if accounts_error:
+            return {'updated': time.time(), 'clusters': [], 'errors': [{'subscription': None, 'error': accounts_error}], 'warnings': []}
+        names_by_id = {a['id']: a['name'] for a in accounts}
+
+        errors = []
+        warnings = []
+        if graph_error:
+            if 'extension' in graph_error or 'resource-graph' in graph_error or 'not recognized' in graph_error:
+                warnings.append("extensão resource-graph do az não instalada; listando assinatura por assinatura "
+                                "(instale com 'az extension add -n resource-graph')")
+            else:
+                warnings.append(f"Azure Resource Graph indisponível ({graph_error}); listando assinatura por assinatura")
+        if graph is not None:
+            rows = graph.get('data', []) if isinstance(graph, dict) else graph
+            found = [dict(row, subscription=names_by_id.get(row.get('subscriptionId'), row.get('subscriptionId'))) for row in rows]
+        else:
+            query = "[].{name:name, resourceGroup:resourceGroup, location:location}"
+            results = list(executor.map(
+                lambda account: (account, _az_json(["aks", "list", "--subscription", account['id'], "--query", query])),
+                accounts
+            ))
+            found = []
+            for account, (rows, error) in results:
+                if error:
+                    errors.append({'subscription': account['name'], 'error': error})
+                    continue
+                found.extend(dict(row, subscriptionId=account['id'], subscription=account['name']) for row in rows)
+
+    clusters = sorted(
+        (
+            {
+                'name': c['name'],
+                'resource_group': c['resourceGroup'],
+                'location': c.get('location'),
+                'subscription': c['subscription'],
+                'subscription_id': c.get('subscriptionId'),
+            }
+            for c in found
+        ),
+        key=lambda c: (c['name'], c['subscription'], c['resource_group'])
+    )
+    inventory = {'updated': time.time(), 'clusters': clusters, 'errors': errors, 'warnings': warnings}
+    if clusters or not errors:
+        write_json(AKS_INVENTORY_FILE, inventory)
+    return inventory
+
+_BUILDERS = {
+    'eks': (INVENTORY_FILE, build_eks_inventory),
+    'aks': (AKS_INVENTORY_FILE, build_aks_inventory),
+}
+
+def refresh_inventory_in_background(kind='eks'):
+    """Atualiza o inventário em um processo separado, se não houver outra atualização em andamento"""
+    filename, _ = _BUILDERS[kind]
+    return spawn_refresh(filename + '.lock', 'jera_cli.utils.inventory', kind, timeout=LIST_CLUSTERS_TIMEOUT * 3)
+
+def _get_inventory(kind, max_age):
+    filename, build = _BUILDERS[kind]
+    inventory = read_json(filename)
+    if inventory is None:
+        return build()
+    if time.time() - inventory.get('updated', 0) > max_age:
+        refresh_inventory_in_background(kind)
+    return inventory
+
+def get_eks_inventory(max_age=INVENTORY_TTL):
+    """Retorna o inventário de clusters EKS.
+
+    Com cache, responde na hora (mesmo vencido) e, se tiver mais de
+    `max_age` segundos, agenda a atualização em segundo plano. Sem cache,
+    monta o inventário antes de retornar.
+    """
+    return _get_inventory('eks', max_age)
+
+def get_aks_inventory(max_age=INVENTORY_TTL):
+    """Retorna o inventário de clusters AKS, com o mesmo cache de get_eks_inventory"""
+    return _get_inventory('aks', max_age)
+
+if __name__ == '__main__':
+    import sys
+
+    kind = sys.argv[1] if len(sys.argv) > 1 else 'eks'
+    filename, build = _BUILDERS[kind]
+    try:
+        build()
+    finally:
+        release_refresh(filename + '.lock')
@@ -0,0 +1,133 @@
+import os
+import threading
+from .config_store import CONFIG_PATH, load_config
+
+# Campos com caminhos de arquivo que podem ser relativos ao kubeconfig
+_PATH_FIELDS = {
+    'clusters': ('certificate-authority',),
+    'users': ('client-certificate', 'client-key', 'tokenFile'),
+}
+
+_lock = threading.Lock()
+_cache = {'key': None, 'data': None}
+
+def get_kubeconfig_paths():
+    """Retorna os arquivos de kubeconfig em uso (KUBECONFIG ou ~/.kube/config)"""
+    paths = os.environ.get('KUBECONFIG')
+    if paths:
+        return [os.path.expanduser(p) for p in paths.split(os.pathsep) if p]
+    return [os.path.expanduser('~/.kube/config')]
+
+def load_kubeconfig():
+    """Lê e mescla os arquivos de kubeconfig, como o kubectl faz.
+
+    A primeira definição de cada cluster/contexto/usuário vence. Caminhos
+    relativos são resolvidos a partir do arquivo onde aparecem. Os clusters
+    guardados pelo use-cluster em ~/.jera/config entram depois dos arquivos,
+    e o contexto escolhido nele substitui o current-context enquanto o
+    kubeconfig não for trocado por outra ferramenta (o valor do arquivo fica
+    em 'file-current-context'). O resultado fica em cache enquanto os
+    arquivos não forem modificados.
+    """
+    paths = get_kubeconfig_paths()
+    key = []
+    for path in paths + [CONFIG_PATH]:
+        try:
+            stat = os.stat(path)
+            key.append((path, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            key.append((path, None, None))
+    key = tuple(key)
+
+    with _lock:
+        if _cache['key'] == key:
+            return _cache['data']
+
+    import yaml
+
+    merged = {'current-context': None, 'clusters': [], 'contexts': [], 'users': []}
+    seen = {'clusters': set(), 'contexts': set(), 'users': set()}
+
+    for path, mtime, _ in key[:-1]:
+        if mtime is None:
+            continue
+        with open(path) as f:
+            data = yaml.safe_load(f) or {}
+
+        if not merged['current-context']:
+            merged['current-context'] = data.get('current-context')
+
+        base_dir = os.path.dirname(os.path.abspath(path))
+        for section in ('clusters', 'contexts', 'users'):
+            for entry in data.get(section) or []:
+                name = entry.get('name')
+                if name in seen[section]:
+                    continue
+                seen[section].add(name)
+
+                inner_key = section[:-1]
+                inner = dict(entry.get(inner_key) or {})
+                for field in _PATH_FIELDS.get(section, ()):
+                    if inner.get(field) and not os.path.isabs(inner[field]):
+                        inner[field] = os.path.join(base_dir, inner[field])
+                merged[section].append({'name': name, inner_key: inner})
+
+    jera_config = load_config()
+    for context_name, stored in (jera_config.get('clusters') or {}).items():
+        for section, inner_key, name in (
+            ('clusters', 'cluster', stored.get('cluster_name')),
+            ('users', 'user', stored.get('user_name')),
+            ('contexts', 'context', context_name),
+        ):
+            if name and name not in seen[section]:
+                seen[section].add(name)
+                merged[section].append({'name': name, inner_key: dict(stored.get(inner_key) or {})})
+
+    merged['file-current-context'] = merged['current-context']
+    pointer = jera_config.get('current_context')
+    if pointer in seen['contexts'] and jera_config.get('kubeconfig_context') == merged['current-context']:
+        merged['current-context'] = pointer
+
+    with _lock:
+        _cache['key'] = key
+        _cache['data'] = merged
+    return merged
+
+def resolve_context(context=None, kubeconfig=None):
+    """Retorna o contexto (padrão: o atual) com seu cluster e usuário.
+
+    O retorno é um dict com as chaves name, context, cluster, cluster_name,
+    user e user_name, ou None se o contexto não existir.
+    """
+    kubeconfig = kubeconfig or load_kubeconfig()
+    name = context or kubeconfig.get('current-context')
+    if not name:
+        return None
+
+    entry = next((c for c in kubeconfig['contexts'] if c['name'] == name), None)
+    if entry is None:
+        return None
+
+    ctx = entry['context']
+    cluster = next((c['cluster'] for c in kubeconfig['clusters'] if c['name'] == ctx.get('cluster')), {})
+    user = next((u['user'] for u in kubeconfig['users'] if u['name'] == ctx.get('user')), {})
+
+    return {
+        'name': name,
+        'context': ctx,
+        'cluster_name': ctx.get('cluster'),
+        'cluster': cluster,
+        'user_name': ctx.get('user'),
+        'user': user,
+    }
+
+def build_kubeconfig(resolved, user=None):
+    """Monta um kubeconfig mínimo só com o contexto resolvido (user substitui o usuário)"""
+    return {
+        'apiVersion': 'v1',
+        'kind': 'Config',
+        'current-context': resolved['name'],
+        'clusters': [{'name': resolved['cluster_name'], 'cluster': resolved['cluster']}],
+        'contexts': [{'name': resolved['name'], 'context': resolved['context']}],
+        'users': [{'name': resolved['user_name'], 'user': user if user is not None else resolved['user']}],
+    }
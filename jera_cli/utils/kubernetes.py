@@ -1,11 +1,10 @@
-from kubernetes import client, config
-from rich.console import Console
+from .console import LazyConsole
 import subprocess
 import time
 import os
-import yaml
+from datetime import datetime
 
-console = Console()
+console = LazyConsole()
 
 def check_aws_sso_config():
     """Check if AWS SSO is configured properly"""
@@ -39,65 +38,257 @@ def check_aws_sso_config():
         console.print(f"Erro ao verificar configuração SSO: {str(e)}", style="bold red")
         return False
 
+# Tempo máximo (segundos) de cada `aws sts get-caller-identity` na verificação da sessão
+STS_PROBE_TIMEOUT = 10
+# Número máximo de profiles verificados ao mesmo tempo via STS
+STS_PROBE_PARALLEL = 8
+
+def _aws_config_paths():
+    """Retorna os caminhos do config e do credentials da AWS (respeitando as variáveis do AWS CLI)"""
+    config_file = os.environ.get('AWS_CONFIG_FILE') or os.path.join(os.path.expanduser("~"), ".aws", "config")
+    credentials_file = os.environ.get('AWS_SHARED_CREDENTIALS_FILE') or os.path.join(os.path.expanduser("~"), ".aws", "credentials")
+    return os.path.expanduser(config_file), os.path.expanduser(credentials_file)
+
+def read_aws_config():
+    """Lê o ~/.aws/config e retorna (profiles, sso_sessions) como dicts de seções"""
+    import configparser
+
+    config_file, _ = _aws_config_paths()
+    parser = configparser.RawConfigParser()
+    parser.read(config_file)
+
+    profiles, sso_sessions = {}, {}
+    for section in parser.sections():
+        if section == 'default':
+            profiles['default'] = dict(parser.items(section))
+        elif section.startswith('profile '):
+            profiles[section[len('profile '):].strip()] = dict(parser.items(section))
+        elif section.startswith('sso-session '):
+            sso_sessions[section[len('sso-session '):].strip()] = dict(parser.items(section))
+    return profiles, sso_sessions
+
+def get_aws_profiles():
+    """Lista os profiles da AWS, como `aws configure list-profiles`, sem executar o AWS CLI"""
+    import configparser
+
+    profiles = list(read_aws_config()[0])
+    _, credentials_file = _aws_config_paths()
+    parser = configparser.RawConfigParser()
+    parser.read(credentials_file)
+    for section in parser.sections():
+        if section not in profiles:
+            profiles.append(section)
+    return profiles
+
+def _parse_aws_expiration(value):
+    """Converte o expiresAt do cache do SSO (ex.: 2024-01-01T00:00:00Z ou ...UTC) em datetime"""
+    from datetime import timezone
+
+    value = value.strip().replace('UTC', 'Z')
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment
+
+def _sso_token_status(profile_config, sso_sessions):
+    """Verifica o token do SSO de um profile direto no ~/.aws/sso/cache.
+
+    Retorna True (token válido), False (profile SSO sem token válido nem
+    renovável) ou None (não dá para saber sem chamar o STS: profile sem SSO,
+    ou token vencido que o AWS CLI ainda consegue renovar).
+    """
+    import hashlib
+    import json
+    from datetime import timezone
+
+    session_name = profile_config.get('sso_session')
+    if session_name:
+        if session_name not in sso_sessions:
+            return False
+        cache_key = session_name
+    elif profile_config.get('sso_start_url'):
+        cache_key = profile_config['sso_start_url']
+    else:
+        return None
+
+    cache_file = os.path.join(
+        os.path.expanduser("~"), ".aws", "sso", "cache",
+        hashlib.sha1(cache_key.encode('utf-8')).hexdigest() + '.json'
+    )
+    try:
+        with open(cache_file) as f:
+            token = json.load(f)
+        now = datetime.now(timezone.utc)
+        if _parse_aws_expiration(token['expiresAt']) > now:
+            return True
+        # Sessões sso-session têm refresh token: o AWS CLI renova sozinho enquanto o registro valer
+        if session_name and token.get('refreshToken') and token.get('registrationExpiresAt'):
+            if _parse_aws_expiration(token['registrationExpiresAt']) > now:
+                return None
+        return False
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+
+def _probe_aws_profiles(profiles):
+    """Executa `aws sts get-caller-identity` nos profiles em paralelo; True no primeiro sucesso"""
+    pending = list(profiles)
+    running = []
+    deadline = time.monotonic() + STS_PROBE_TIMEOUT
+    try:
+        while (pending or running) and time.monotonic() < deadline:
+            while pending and len(running) < STS_PROBE_PARALLEL:
+                running.append(subprocess.Popen(
+                    ["aws", "sts", "get-caller-identity", "--profile", pending.pop(0)],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                ))
+            for proc in list(running):
+                returncode = proc.poll()
+                if returncode is None:
+                    continue
+                running.remove(proc)
+                if returncode == 0:
+                    return True
+            time.sleep(0.05)
+        return False
+    finally:
+        for proc in running:
+            proc.kill()
+            proc.wait()
+
 def check_aws_sso_session():
-    """Check if there's an active AWS SSO session"""
+    """Check if there's an active AWS SSO session.
+
+    Lê o ~/.aws/config e confere o expiresAt dos tokens em ~/.aws/sso/cache,
+    sem executar o AWS CLI. Só quando isso não é conclusivo (profiles sem SSO
+    ou tokens renováveis) os profiles restantes são verificados via STS, em
+    paralelo e com timeout, parando no primeiro que responder.
+    """
     try:
-        # Primeiro tenta encontrar o profile configurado
-        home = os.path.expanduser("~")
-        config_file = os.path.join(home, ".aws", "config")
-        
+        config_file, _ = _aws_config_paths()
         if not os.path.exists(config_file):
             return False
-            
-        # Tenta com cada profile configurado
-        result = subprocess.run(
-            ["aws", "configure", "list-profiles"],
-            capture_output=True,
-            text=True
-        )
-        
-        if result.returncode == 0:
-            profiles = result.stdout.strip().split('\n')
-            
-            for profile in profiles:
-                try:
-                    result = subprocess.run(
-                        ["aws", "sts", "get-caller-identity", "--profile", profile],
-                        capture_output=True,
-                        text=True
-                    )
-                    if result.returncode == 0:
-                        return True
-                except:
-                    continue
-                    
-        return False
+
+        profiles, sso_sessions = read_aws_config()
+        inconclusive = []
+        for name, profile_config in profiles.items():
+            status = _sso_token_status(profile_config, sso_sessions)
+            if status:
+                return True
+            if status is None:
+                inconclusive.append(name)
+
+        for name in get_aws_profiles():
+            if name not in profiles:
+                inconclusive.append(name)
+
+        if not inconclusive:
+            return False
+        return _probe_aws_profiles(inconclusive)
     except Exception as e:
         console.print(f"Erro ao verificar sessão SSO: {str(e)}", style="dim red")
         return False
 
+def _azure_config_dir():
+    """Diretório de configuração do Azure CLI (AZURE_CONFIG_DIR ou ~/.azure)"""
+    return os.path.expanduser(os.environ.get('AZURE_CONFIG_DIR') or os.path.join("~", ".azure"))
+
+def _read_azure_json(filename):
+    """Lê um JSON do diretório do Azure CLI; retorna None se não existir ou não der para ler"""
+    import json
+
+    try:
+        # O azureProfile.json é gravado com BOM pelo Azure CLI
+        with open(os.path.join(_azure_config_dir(), filename), encoding='utf-8-sig') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _get_azure_default_subscription(profile):
+    """Retorna a assinatura padrão (isDefault) do azureProfile.json, ou None"""
+    for subscription in profile.get('subscriptions') or []:
+        if subscription.get('isDefault'):
+            return subscription
+    return None
+
+def _get_azure_user_tokens(username):
+    """Retorna (refresh tokens, access tokens) do usuário no cache do MSAL, ou None sem cache legível"""
+    cache = _read_azure_json('msal_token_cache.json')
+    if cache is None:
+        return None
+
+    username = (username or '').lower()
+    account_ids = {
+        account.get('home_account_id')
+        for account in (cache.get('Account') or {}).values()
+        if (account.get('username') or '').lower() == username
+    }
+    refresh_tokens = [t for t in (cache.get('RefreshToken') or {}).values() if t.get('home_account_id') in account_ids]
+    access_tokens = [t for t in (cache.get('AccessToken') or {}).values() if t.get('home_account_id') in account_ids]
+    return refresh_tokens, access_tokens
+
 def check_azure_cli_installed():
     """Verifica se o Azure CLI está instalado"""
-    try:
-        result = subprocess.run(["az", "--version"], capture_output=True, text=True)
-        return result.returncode == 0
-    except Exception:
-        return False
+    import shutil
+
+    return shutil.which("az") is not None
 
 def check_azure_session():
-    """Verifica se há uma sessão Azure ativa"""
-    try:
-        result = subprocess.run(
-            ["az", "account", "show"],
-            capture_output=True,
-            text=True
-        )
-        return result.returncode == 0
-    except Exception:
+    """Verifica se há uma sessão Azure ativa.
+
+    Lê o ~/.azure/azureProfile.json (assinatura padrão e usuário) e o cache de
+    tokens do MSAL, sem iniciar o Azure CLI. Sem esses arquivos (ex.: cache
+    criptografado no Windows), cai para `az account show`.
+    """
+    profile = _read_azure_json('azureProfile.json')
+    if profile is None:
+        try:
+            result = subprocess.run(
+                ["az", "account", "show"],
+                capture_output=True,
+                text=True
+            )
+            return result.returncode == 0
+        except Exception:
+            return False
+
+    subscription = _get_azure_default_subscription(profile)
+    if not subscription:
         return False
 
+    user = subscription.get('user') or {}
+    if user.get('type') != 'user':
+        # Service principals e identidades gerenciadas não ficam no cache de usuário do MSAL
+        return True
+
+    tokens = _get_azure_user_tokens(user.get('name'))
+    if tokens is None:
+        return True
+    refresh_tokens, access_tokens = tokens
+    if refresh_tokens:
+        return True
+    return any(float(t.get('expires_on', 0)) > time.time() for t in access_tokens)
+
+def get_azure_session_expiry():
+    """Retorna até quando vale o access token mais recente do usuário atual (datetime), ou None se não houver token válido"""
+    profile = _read_azure_json('azureProfile.json')
+    if not profile:
+        return None
+    subscription = _get_azure_default_subscription(profile) or {}
+    tokens = _get_azure_user_tokens((subscription.get('user') or {}).get('name'))
+    expirations = [float(t.get('expires_on', 0)) for t in (tokens[1] if tokens else [])]
+    expirations = [e for e in expirations if e > time.time()]
+    return datetime.fromtimestamp(max(expirations)) if expirations else None
+
 def get_azure_subscriptions():
     """Obtém a lista de assinaturas do Azure"""
+    profile = _read_azure_json('azureProfile.json')
+    if profile is not None:
+        return [subscription['name'] for subscription in profile.get('subscriptions') or []]
+
     try:
         result = subprocess.run(
             ["az", "account", "list", "--query", "[].name", "-o", "tsv"],
@@ -112,6 +303,11 @@ def get_azure_subscriptions():
 
 def get_azure_current_subscription():
     """Obtém a assinatura atual do Azure"""
+    profile = _read_azure_json('azureProfile.json')
+    if profile is not None:
+        subscription = _get_azure_default_subscription(profile)
+        return subscription['name'] if subscription else None
+
     try:
         result = subprocess.run(
             ["az", "account", "show", "--query", "name", "-o", "tsv"],
@@ -125,20 +321,14 @@ def get_azure_current_subscription():
         return None
 
 def get_azure_clusters(subscription=None):
-    """Obtém a lista de clusters AKS do Azure"""
+    """Obtém a lista de clusters AKS do Azure (do inventário em cache de todas as assinaturas)"""
+    from .inventory import get_aks_inventory
+
     try:
-        cmd = ["az", "aks", "list", "--query", "[].name", "-o", "tsv"]
+        clusters = get_aks_inventory().get('clusters') or []
         if subscription:
-            cmd.extend(["--subscription", subscription])
-            
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0:
-            return result.stdout.strip().split('\n')
-        return []
+            clusters = [c for c in clusters if subscription in (c['subscription'], c['subscription_id'])]
+        return [c['name'] for c in clusters]
     except Exception:
         return []
 
@@ -176,15 +366,13 @@ def get_aks_credentials(cluster_name, resource_group=None, subscription=None):
 
 def get_current_cluster_info():
     """Obtém informações do cluster atual configurado no Jera CLI"""
+    from .config_store import get_config_value
+
     try:
-        config_path = os.path.expanduser('~/.jera/config')
-        if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                config_data = yaml.safe_load(f) or {}
-                
-            # Retorna informações do cluster atual, se disponíveis
-            if 'current_cluster' in config_data:
-                return config_data['current_cluster']
+        # Retorna informações do cluster atual, se disponíveis
+        current_cluster = get_config_value('current_cluster')
+        if current_cluster:
+            return current_cluster
                 
         # Se não encontrar informações configuradas, tenta obter do kubectl
         try:
@@ -209,8 +397,14 @@ def get_current_cluster_info():
         console.print(f"Erro ao obter informações do cluster: {str(e)}", style="dim red")
         return None
 
+def parse_timestamp(value):
+    """Converte um timestamp da API (RFC 3339, ex.: 2024-01-01T00:00:00Z) em datetime"""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
 def format_age(timestamp):
-    """Formata a idade de um recurso baseado em seu timestamp"""
+    """Formata a idade de um recurso baseado em seu timestamp (datetime ou string da API)"""
+    if isinstance(timestamp, str):
+        timestamp = parse_timestamp(timestamp)
     age = time.time() - timestamp.timestamp()
     if age < 60:  # menos de 1 minuto
         return f"{int(age)}s"
@@ -221,45 +415,63 @@ def format_age(timestamp):
     else:
         return f"{int(age/86400)}d"
 
-def get_pod_metrics(namespace):
+def sum_container_usage(pod_metrics):
+    """Soma o uso dos containers de um item de metrics.k8s.io; retorna (CPU em m, memória em Mi)"""
+    cpu = memory = 0
+    for container in pod_metrics.get('containers') or []:
+        usage = container.get('usage') or {}
+        cpu += parse_resource_value(usage.get('cpu', '0'), 'cpu')
+        memory += parse_resource_value(usage.get('memory', '0'), 'memory')
+    return cpu, int(memory)
+
+def get_pod_metrics(namespace, context=None):
     """Obtém métricas de uso dos pods em um namespace"""
+    from .gateway import list_pod_metrics
+
     try:
-        result = subprocess.run(
-            ["kubectl", "top", "pods", "-n", namespace],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        metrics_lines = result.stdout.strip().split('\n')[1:]  # Pula o cabeçalho
-        metrics_dict = {}
-        for line in metrics_lines:
-            parts = line.split()
-            if len(parts) >= 3:
-                pod_name = parts[0]
-                cpu = parts[1]
-                memory = parts[2]
-                metrics_dict[pod_name] = {
-                    'cpu': cpu,
-                    'memory': memory
-                }
-        return metrics_dict
-    except subprocess.CalledProcessError:
+        items = list_pod_metrics(namespace, context=context)
+    except Exception:
         return {}
 
+    metrics_dict = {}
+    for item in items:
+        cpu, memory = sum_container_usage(item)
+        metrics_dict[item['metadata']['name']] = {
+            'cpu': f"{cpu}m",
+            'memory': f"{memory}Mi"
+        }
+    return metrics_dict
+
+# Multiplicadores dos sufixos das quantidades do Kubernetes (binários e decimais)
+QUANTITY_SUFFIXES = {
+    'Ki': 2**10, 'Mi': 2**20, 'Gi': 2**30, 'Ti': 2**40, 'Pi': 2**50, 'Ei': 2**60,
+    'n': 1e-9, 'u': 1e-6, 'm': 1e-3, 'k': 10**3, 'M': 10**6, 'G': 10**9, 'T': 10**12, 'P': 10**15, 'E': 10**18,
+}
+
+def parse_quantity(value):
+    """Converte uma quantidade do Kubernetes (500m, 1.5Gi, 512M, 1e3, 134217728) na unidade base"""
+    if not value:
+        return 0
+    value = str(value).strip()
+    if value[-2:] in QUANTITY_SUFFIXES:
+        return float(value[:-2]) * QUANTITY_SUFFIXES[value[-2:]]
+    if value[-1:] in QUANTITY_SUFFIXES:
+        return float(value[:-1]) * QUANTITY_SUFFIXES[value[-1:]]
+    return float(value)
+
 def parse_resource_value(value, resource_type='cpu'):
-    """Converte valores de recursos (CPU/memória) para um formato padrão"""
+    """Converte valores de recursos para CPU em millicores (int) ou memória em Mi.
+
+    Aceita qualquer quantidade do Kubernetes (parse_quantity); a memória
+    volta como int quando é um número inteiro de Mi, senão com duas casas.
+    """
     if not value:
         return 0
-        
+    quantity = parse_quantity(value)
     if resource_type == 'cpu':
-        if value.endswith('m'):
-            return int(value[:-1])
-        return int(float(value) * 1000)
+        # round evita que 4.35 * 1000 vire 4349
+        return int(round(quantity * 1000, 6))
     elif resource_type == 'memory':
-        if value.endswith('Mi'):
-            return int(value[:-2])
-        elif value.endswith('Gi'):
-            return int(float(value[:-2]) * 1024)
-        elif value.endswith('Ki'):
-            return int(value[:-2]) / 1024
-    return 0 
\ No newline at end of file
+        mebibytes = quantity / 2**20
+        return int(mebibytes) if mebibytes == int(mebibytes) else round(mebibytes, 2)
+    return 0
\ No newline at end of file
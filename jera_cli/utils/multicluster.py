@@ -0,0 +1,117 @@
+import threading
+import time
+import click
+from .console import LazyConsole
+from .kubeconfig import load_kubeconfig
+
+# Avisos vão para o stderr para não misturar com a saída -o json/ndjson/csv
+console = LazyConsole(stderr=True)
+
+# Prazo (segundos) para todos os clusters responderem nos comandos com --clusters
+FAN_OUT_TIMEOUT = 30
+
+def cluster_options(command):
+    """Adiciona --clusters e --all-clusters a um comando de leitura"""
+    from .completion import complete_cluster_list
+
+    command = click.option('--all-clusters', is_flag=True,
+                           help='Consulta todos os contextos do kubeconfig ao mesmo tempo')(command)
+    command = click.option('--clusters', 'clusters', shell_complete=complete_cluster_list,
+                           help='Consulta vários clusters ao mesmo tempo (contextos ou nomes, separados por vírgula)')(command)
+    return command
+
+def cluster_label(context):
+    """Nome curto do contexto para exibição (o ARN do EKS vira só o nome do cluster)"""
+    return context.rsplit('cluster/', 1)[-1] if context.startswith('arn:') else context
+
+def resolve_contexts(clusters=None, all_clusters=False):
+    """Converte --clusters/--all-clusters em nomes de contexto; None sem as opções.
+
+    Cada nome pode ser o contexto ou o nome curto do cluster (sem o ARN).
+    """
+    if not clusters and not all_clusters:
+        return None
+
+    contexts = [c['name'] for c in load_kubeconfig()['contexts']]
+    if all_clusters:
+        return contexts
+
+    resolved = []
+    for name in (n.strip() for n in clusters.split(',')):
+        if not name:
+            continue
+        matches = [c for c in contexts if c == name] or [c for c in contexts if cluster_label(c) == name]
+        if not matches:
+            raise ValueError(f"Cluster '{name}' não encontrado no kubeconfig. Veja 'jeracli clusters'.")
+        if matches[0] not in resolved:
+            resolved.append(matches[0])
+    return resolved
+
+def describe_error(error):
+    """Resume um erro de acesso ao cluster (HTTP 401, timeout, conexão recusada...)"""
+    status = getattr(error, 'status', None)
+    if status:
+        return f"HTTP {status}"
+    # MaxRetryError do urllib3 guarda a causa em `reason` (nos erros do ssl é um texto)
+    reason = getattr(error, 'reason', None)
+    if not isinstance(reason, BaseException):
+        reason = error
+    name = type(reason).__name__
+    text = str(reason)
+    if 'Timeout' in name or 'timed out' in text:
+        return "timeout"
+    if 'CERTIFICATE_VERIFY_FAILED' in text:
+        return "certificado TLS inválido"
+    if 'SSL' in name or 'SSL' in text:
+        return "erro de TLS"
+    if 'Name or service not known' in text or 'nodename nor servname' in text or 'NameResolution' in name:
+        return "DNS não resolvido"
+    if 'Connection refused' in text or 'NewConnectionError' in name or 'Refused' in name:
+        return "conexão recusada"
+    lines = text.strip().splitlines()
+    return lines[0][:80] if lines else name
+
+def run_per_context(contexts, fetch, timeout=FAN_OUT_TIMEOUT):
+    """Executa fetch(contexto) em todos os contextos ao mesmo tempo.
+
+    Retorna {contexto: (resultado, erro)}. Usa threads daemon com um prazo
+    único, para que um cluster lento ou fora do ar não segure os demais.
+    """
+    results = {}
+
+    def run(context):
+        try:
+            results[context] = (fetch(context), None)
+        except Exception as e:
+            results[context] = (None, describe_error(e))
+
+    threads = [threading.Thread(target=run, args=(context,), daemon=True) for context in contexts]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + timeout
+    for thread in threads:
+        thread.join(max(0, deadline - time.monotonic()))
+    return {context: results.get(context) or (None, f"sem resposta em {timeout:g}s") for context in contexts}
+
+def fetch_per_cluster(contexts, fetch, timeout=FAN_OUT_TIMEOUT):
+    """Busca os dados de cada cluster e retorna [(nome do cluster, resultado)].
+
+    Com contexts=None (sem --clusters) consulta só o contexto atual e retorna
+    [(None, resultado)], propagando os erros como antes. Com vários
+    clusters, os que falham são avisados e ficam de fora do resultado; se
+    nenhum responder, levanta RuntimeError.
+    """
+    if contexts is None:
+        return [(None, fetch(None))]
+
+    results = run_per_context(contexts, fetch, timeout)
+    groups = []
+    for context in contexts:
+        value, error = results[context]
+        if error:
+            console.print(f"⚠️ {cluster_label(context)}: {error}", style="bold yellow")
+        else:
+            groups.append((cluster_label(context), value))
+    if not groups:
+        raise RuntimeError("nenhum dos clusters consultados respondeu")
+    return groups
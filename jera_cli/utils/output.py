@@ -0,0 +1,92 @@
+import os
+import sys
+import click
+
+# Formatos do -o/--output; fora 'table', a saída é para scripts e não passa pelo rich
+OUTPUT_FORMATS = ('table', 'json', 'ndjson', 'csv')
+
+def output_option(command):
+    """Adiciona -o/--output a um comando de listagem; sem a opção vale o -o global"""
+    return click.option('--output', '-o', type=click.Choice(OUTPUT_FORMATS), default=None,
+                        help='Formato da saída (json, ndjson ou csv: um registro por vez, sem a tabela)')(command)
+
+def resolve_output(output=None):
+    """Formato pedido no comando ou, sem ele, no -o global (jeracli -o ndjson pods)"""
+    if output:
+        return output
+    ctx = click.get_current_context(silent=True)
+    obj = ctx.find_root().obj if ctx else None
+    return getattr(obj, 'output', None) or 'table'
+
+def report_error(output, message):
+    """Mostra o erro de um comando de listagem.
+
+    Na tabela segue como antes (❌ no stdout); em json/ndjson/csv vai para o
+    stderr e o comando sai com código 1, para o script não ler um resultado
+    vazio como sucesso.
+    """
+    from rich.console import Console
+
+    if output == 'table':
+        Console().print(f"❌ {message}", style="bold red")
+        return
+    Console(stderr=True).print(f"❌ {message}", style="bold red")
+    click.get_current_context().exit(1)
+
+def _csv_value(value):
+    import json
+
+    if value is None:
+        return ''
+    if isinstance(value, dict) or (isinstance(value, (list, tuple)) and any(isinstance(item, dict) for item in value)):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, (list, tuple)):
+        return ', '.join(str(item) for item in value)
+    return value
+
+def write_records(records, output, fields=None):
+    """Escreve os registros (dicts) no stdout à medida que são gerados.
+
+    ndjson é um objeto por linha; json é um array escrito item a item, sem
+    montar a lista em memória; csv usa `fields` (ou as chaves do primeiro
+    registro) como cabeçalho, com listas separadas por vírgula
+    (listas de objetos viram JSON). Se o leitor
+    do pipe sair antes do fim (head, jq -n...), encerra em silêncio.
+    Retorna quantos registros foram escritos.
+    """
+    import csv
+    import json
+
+    # Lido a cada chamada: o daemon troca o sys.stdout para capturar a saída
+    stream = sys.stdout
+    count = 0
+    writer = None
+    try:
+        if output == 'json':
+            stream.write('[')
+        elif output == 'csv' and fields:
+            writer = csv.DictWriter(stream, fieldnames=fields, extrasaction='ignore', lineterminator='\n')
+            writer.writeheader()
+
+        for record in records:
+            if output == 'ndjson':
+                stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+            elif output == 'json':
+                stream.write(('\n  ' if count == 0 else ',\n  ') + json.dumps(record, ensure_ascii=False))
+            else:
+                if writer is None:
+                    writer = csv.DictWriter(stream, fieldnames=list(record), extrasaction='ignore', lineterminator='\n')
+                    writer.writeheader()
+                writer.writerow({key: _csv_value(value) for key, value in record.items()})
+            count += 1
+
+        if output == 'json':
+            stream.write('\n]\n' if count else ']\n')
+        stream.flush()
+    except BrokenPipeError:
+        # Evita o segundo BrokenPipeError no flush da saída do interpretador
+        try:
+            os.dup2(os.open(os.devnull, os.O_WRONLY), stream.fileno())
+        except (OSError, ValueError, AttributeError):
+            pass
+    return count
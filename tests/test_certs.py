@@ -0,0 +1,122 @@
+import datetime
+import json
+import ssl
+from pathlib import Path
+
+import pytest
+
+from jera_cli.utils import certs
+from jera_cli.utils.certs import _der_items, _der_time, decode_certificate
+
+# Certificados autoassinados gerados para os testes (chave EC P-256, série 1000):
+# san.pem   - O=Jera Testes, CN=app.jera.test, de 2024-01-01 (UTCTime) a 2060-01-01
+#             (GeneralizedTime), SANs app.jera.test, *.jera.test, 10.0.0.1 e 2001:db8::1
+# nosan.pem - CN=legado.jera.test, sem SAN (só basicConstraints), de 1950-06-01 a
+#             2025-01-01 12:30, as duas datas em UTCTime
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+def _der(name):
+    return ssl.PEM_cert_to_DER_cert((FIXTURES / name).read_text())
+
+def _epoch(*args):
+    return datetime.datetime(*args, tzinfo=datetime.timezone.utc).timestamp()
+
+def test_der_items_forma_curta_e_longa():
+    short = b'\x04\x03abc'
+    one_byte = b'\x04\x81\x80' + b'x' * 0x80
+    two_bytes = b'\x30\x82\x01\x2c' + b'y' * 0x12c
+
+    items = list(_der_items(short + one_byte + two_bytes))
+
+    assert items == [(0x04, b'abc'), (0x04, b'x' * 0x80), (0x30, b'y' * 0x12c)]
+
+@pytest.mark.parametrize('data', [
+    b'\x30',                  # só a tag
+    b'\x30\x05abc',           # conteúdo menor que o comprimento
+    b'\x30\x82\x01',          # forma longa sem todos os bytes do comprimento
+    b'\x30\x82\x01\x00abc',   # forma longa maior que os dados
+    b'\x30\x80abc',           # comprimento indefinido (não existe em DER)
+])
+def test_der_items_truncado(data):
+    with pytest.raises(ValueError):
+        list(_der_items(data))
+
+def test_der_time_utc_e_generalized():
+    assert _der_time(0x17, b'240101000000Z') == _epoch(2024, 1, 1)
+    assert _der_time(0x18, b'20600101000000Z') == _epoch(2060, 1, 1)
+    # RFC 5280: UTCTime com ano 50-99 é 19xx, 00-49 é 20xx
+    assert _der_time(0x17, b'500601000000Z') == _epoch(1950, 6, 1)
+    assert _der_time(0x17, b'490101000000Z') == _epoch(2049, 1, 1)
+
+def test_decode_certificate_com_san():
+    result = decode_certificate(_der('san.pem'))
+
+    assert result == {
+        'issuer': 'Jera Testes',
+        'subject': 'app.jera.test',
+        'sans': ['app.jera.test', '*.jera.test', '10.0.0.1', '2001:db8::1'],
+        'not_before': _epoch(2024, 1, 1),
+        'not_after': _epoch(2060, 1, 1),
+    }
+
+def test_decode_certificate_sem_san():
+    result = decode_certificate(_der('nosan.pem'))
+
+    # Sem O no emissor, cai para o CN
+    assert result['issuer'] == 'legado.jera.test'
+    assert result['subject'] == 'legado.jera.test'
+    assert result['sans'] == []
+    assert result['not_before'] == _epoch(1950, 6, 1)
+    assert result['not_after'] == _epoch(2025, 1, 1, 12, 30)
+
+@pytest.mark.parametrize('der', [b'', b'\x30\x03abc', b'lixo que nao e DER'])
+def test_decode_certificate_invalido(der):
+    with pytest.raises(Exception):
+        decode_certificate(der)
+
+@pytest.fixture
+def fake_handshake(monkeypatch):
+    """Troca o handshake TLS por certificados fixos por host"""
+    served = {
+        'ok.jera.test': _der('san.pem'),
+        'legado.jera.test': _der('nosan.pem'),
+        'quebrado.jera.test': _der('san.pem')[:200],
+        'lixo.jera.test': b'\x00\x01\x02',
+    }
+
+    async def handshake(host, port, context, timeout):
+        return served[host]
+
+    monkeypatch.setattr(certs, '_handshake', handshake)
+    return served
+
+def test_check_certificates_erro_de_decodificacao_fica_no_host(fake_handshake):
+    results = certs.check_certificates(list(fake_handshake), cache_ttl=0)
+
+    assert results['ok.jera.test']['sans'][0] == 'app.jera.test'
+    assert results['legado.jera.test']['not_after'] == _epoch(2025, 1, 1, 12, 30)
+    assert results['quebrado.jera.test']['error'] == "certificado ilegível"
+    assert results['lixo.jera.test']['error'] == "certificado ilegível"
+
+def test_urls_certs_mostra_erro_por_host(fake_handshake, capsys):
+    from jera_cli.commands.ingress import show_certificates
+
+    hosts = {host: ['default/app'] for host in fake_handshake}
+    show_certificates(hosts, cache_ttl=0, output='json')
+    records = {record['host']: record for record in json.loads(capsys.readouterr().out)}
+
+    assert records['ok.jera.test']['error'] is None
+    assert records['ok.jera.test']['not_after'] == '2060-01-01T00:00:00+00:00'
+    assert records['legado.jera.test']['sans'] == []
+    assert records['quebrado.jera.test']['error'] == "certificado ilegível"
+    assert records['lixo.jera.test']['not_after'] is None
+
+def test_urls_certs_tabela_nao_aborta(fake_handshake, capsys, monkeypatch):
+    from jera_cli.commands.ingress import show_certificates
+
+    monkeypatch.setenv('COLUMNS', '200')
+    show_certificates({host: ['default/app'] for host in fake_handshake}, cache_ttl=0)
+    out = capsys.readouterr().out
+
+    assert out.count("certificado ilegível") == 2
+    assert "ok.jera.test" in out and "legado.jera.test" in out
@@ -0,0 +1,115 @@
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from jera_cli.utils.http_probe import percentile, probe_urls
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    connections = set()
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.connections.add(self.client_address)
+
+    def _reply(self, status, body=b''):
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def do_HEAD(self):
+        if self.path == '/nohead':
+            self._reply(405)
+        elif self.path == '/slow':
+            time.sleep(1)
+            self._reply(200)
+        elif self.path == '/missing':
+            self._reply(404)
+        else:
+            self._reply(200)
+
+    def do_GET(self):
+        self._reply(200, b'corpo do GET')
+
+@pytest.fixture(scope='module')
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+def _closed_port():
+    sock = socket.socket()
+    sock.bind(('127.0.0.1', 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+def test_status_codes(server):
+    result = probe_urls([f"{server}/ok", f"{server}/missing"], timeout=5)
+
+    assert result[f"{server}/ok"]['statuses'] == [200]
+    assert result[f"{server}/missing"]['statuses'] == [404]
+    assert result[f"{server}/ok"]['errors'] == 0
+    assert result[f"{server}/ok"]['tls'] is None
+
+def test_head_recusado_repete_com_get(server):
+    result = probe_urls([f"{server}/nohead"], timeout=5)[f"{server}/nohead"]
+
+    assert result['statuses'] == [200]
+    assert result['errors'] == 0
+
+def test_timeout(server):
+    result = probe_urls([f"{server}/slow"], timeout=0.3)[f"{server}/slow"]
+
+    assert result['statuses'] == []
+    assert result['errors'] == 1
+    assert result['error'] == "timeout"
+    assert result['total'] is None
+
+def test_conexao_recusada():
+    url = f"http://127.0.0.1:{_closed_port()}/"
+    result = probe_urls([url], timeout=5)[url]
+
+    assert result['error'] == "conexão recusada"
+    assert result['errors'] == 1
+
+def test_https_em_servidor_http(server):
+    url = server.replace('http://', 'https://') + '/ok'
+    result = probe_urls([url], timeout=5, verify=False)[url]
+
+    assert result['error'] == "erro de TLS"
+
+def test_repeat_calcula_p50_e_p95(server):
+    result = probe_urls([f"{server}/ok"], repeat=5, timeout=5)[f"{server}/ok"]
+
+    assert result['errors'] == 0
+    assert result['statuses'] == [200]
+    assert 0 < result['ttfb'] <= result['total'] <= result['total_p95']
+
+def test_repeat_reaproveita_conexao(server):
+    _Handler.connections.clear()
+    probe_urls([f"{server}/ok"], repeat=5, timeout=5)
+
+    assert len(_Handler.connections) == 1
+
+def test_urls_repetidas_sao_consultadas_uma_vez(server):
+    result = probe_urls([f"{server}/ok", f"{server}/ok"], timeout=5)
+
+    assert list(result) == [f"{server}/ok"]
+
+def test_percentile():
+    assert percentile([1, 2, 3, 4], 50) == 2
+    assert percentile([4, 3, 2, 1], 95) == 4
+    assert percentile([7], 95) == 7